@@ -0,0 +1,95 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import excel_framework
+
+HEAVY_MODULES = ("xlwings", "PIL", "openpyxl", "numpy", "psutil", "pygetwindow", "win32process")
+# Helpers that must not pull in openpyxl (and with it Pillow): they only read the xlsx XML
+STREAMING_HELPERS = ("ex_latest_row", "ex_latest_column", "ex_sheet_extent", "ex_read_sheet_dimension",
+                     "ex_read_sheet_names", "ex_iter_sheet_records", "ex_get_occupancy_index")
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import excel_framework
+package_seconds = time.perf_counter() - start
+name = sys.argv[1]
+if name:
+    getattr(excel_framework, name)
+seconds = time.perf_counter() - start
+heavy = sorted({module.split(".")[0] for module in sys.modules} & set(sys.argv[2].split(",")))
+print(json.dumps({"package_seconds": package_seconds, "seconds": seconds, "heavy_modules": heavy}))
+"""
+
+def measure_import(name=None, repeat=3):
+    """
+    Times `import excel_framework` followed by the first access of one exported name, in a fresh interpreter.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Parameters:
+    - name: str, optional
+        The exported name to access. None measures the bare package import.
+    - repeat: int, optional
+        The number of fresh interpreters; the fastest run is reported. Defaults to 3.
+
+    Returns:
+    - dict
+        {"name", "seconds", "package_seconds", "heavy_modules"}: the heavy modules are those of
+        HEAVY_MODULES that were loaded as a side effect.
+    """
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-X", "utf8", "-c", _PROBE, name or "", ",".join(HEAVY_MODULES)],
+                                cwd=ROOT_DIR, capture_output=True, text=True, check=True).stdout
+        runs.append(json.loads(output.strip().splitlines()[-1]))
+    best = min(runs, key=lambda run: run["seconds"])
+    return {"name": name or "(package)", "seconds": round(best["seconds"], 4),
+            "package_seconds": round(best["package_seconds"], 4), "heavy_modules": best["heavy_modules"]}
+
+def check_results(results):
+    """
+    Returns the list of lazy-import violations found in measure_import results.
+    """
+    problems = []
+    for result in results:
+        heavy = set(result["heavy_modules"])
+        if result["name"] == "(package)" and heavy:
+            problems.append(f"import excel_framework loads {sorted(heavy)}")
+        elif "xlwings" in heavy:
+            problems.append(f"{result['name']} imports xlwings on access")
+        elif result["name"] in STREAMING_HELPERS and heavy & {"openpyxl", "PIL"}:
+            problems.append(f"{result['name']} loads {sorted(heavy & {'openpyxl', 'PIL'})}")
+    return problems
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure the import cost of excel_framework and each helper.")
+    parser.add_argument("--names", default=None, help="comma-separated exported names (default: all)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default=None, help="write the results to this JSON file")
+    parser.add_argument("--check", action="store_true", help="exit with status 1 on a lazy-import violation")
+    args = parser.parse_args()
+
+    names = args.names.split(",") if args.names else excel_framework.__all__
+    results = [measure_import(None, args.repeat)] + [measure_import(name, args.repeat) for name in names]
+    print(f"{'name':<40} {'ms':>8} {'package ms':>11}  heavy modules")
+    for result in sorted(results, key=lambda r: r["seconds"]):
+        print(f"{result['name']:<40} {result['seconds'] * 1000:>8.1f} {result['package_seconds'] * 1000:>11.1f}  "
+              f"{', '.join(result['heavy_modules']) or '-'}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    problems = check_results(results)
+    for problem in problems:
+        print(f"FAIL: {problem}")
+    if args.check and problems:
+        sys.exit(1)
@@ -0,0 +1,239 @@
+import argparse
+import os
+import random
+import sys
+import zipfile
+from xml.sax.saxutils import escape
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from openpyxl.utils import get_column_letter
+
+from excel_framework import ex_configure_logging, ex_get_logger
+
+logger = ex_get_logger(__name__)
+
+NEEDLE = "NEEDLE"
+_ZIP_TIME = (2026, 1, 1, 0, 0, 0)
+
+_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_DRAWING_NS = "http://schemas.openxmlformats.org/drawingml/2006/spreadsheetDrawing"
+_A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+_DOC_TYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_XML_HEADER = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+def workbook_spec(rows=1000, columns=10, sparsity=0.1, shared_string_ratio=0.5, text_ratio=0.3,
+                  formula_density=0.1, sheets=1, drawings=0, needle_every=1000, seed=0):
+    """
+    Returns the parameters of a synthetic workbook as a dict, with defaults filled in.
+    The same spec always produces the same file (see generate_workbook).
+    """
+    return {
+        "rows": rows, "columns": columns, "sparsity": sparsity, "shared_string_ratio": shared_string_ratio,
+        "text_ratio": text_ratio, "formula_density": formula_density, "sheets": sheets, "drawings": drawings,
+        "needle_every": needle_every, "seed": seed,
+    }
+
+def spec_file_name(spec):
+    """
+    Returns a file name that identifies a spec, so generated workbooks can be reused between runs.
+    """
+    return ("synthetic_r{rows}_c{columns}_s{sparsity}_ss{shared_string_ratio}_t{text_ratio}"
+            "_f{formula_density}_n{sheets}_d{drawings}_e{needle_every}_seed{seed}.xlsx").format(**spec)
+
+def _write(archive, name, text):
+    archive.writestr(zipfile.ZipInfo(name, _ZIP_TIME), text, compress_type=zipfile.ZIP_DEFLATED)
+
+def _drawing_xml(columns, drawings):
+    anchors = []
+    for index in range(drawings):
+        top = 1 + index * 4
+        anchors.append(
+            f'<xdr:twoCellAnchor><xdr:from><xdr:col>{columns + 1}</xdr:col><xdr:colOff>0</xdr:colOff>'
+            f'<xdr:row>{top}</xdr:row><xdr:rowOff>0</xdr:rowOff></xdr:from>'
+            f'<xdr:to><xdr:col>{columns + 4}</xdr:col><xdr:colOff>0</xdr:colOff>'
+            f'<xdr:row>{top + 3}</xdr:row><xdr:rowOff>0</xdr:rowOff></xdr:to>'
+            f'<xdr:sp macro="" textlink=""><xdr:nvSpPr><xdr:cNvPr id="{index + 2}" name="TextBox {index + 1}"/>'
+            f'<xdr:cNvSpPr txBox="1"/></xdr:nvSpPr><xdr:spPr><a:xfrm><a:off x="0" y="0"/>'
+            f'<a:ext cx="1828800" cy="548640"/></a:xfrm><a:prstGeom prst="rect"><a:avLst/></a:prstGeom></xdr:spPr>'
+            f'<xdr:txBody><a:bodyPr/><a:lstStyle/><a:p><a:r><a:t>Shape {index + 1}</a:t></a:r></a:p></xdr:txBody>'
+            f'</xdr:sp><xdr:clientData/></xdr:twoCellAnchor>')
+    return f'{_XML_HEADER}<xdr:wsDr xmlns:xdr="{_DRAWING_NS}" xmlns:a="{_A_NS}">{"".join(anchors)}</xdr:wsDr>'
+
+def generate_workbook(file_path, rows=1000, columns=10, sparsity=0.1, shared_string_ratio=0.5, text_ratio=0.3,
+                      formula_density=0.1, sheets=1, drawings=0, needle_every=1000, seed=0):
+    """
+    Writes a deterministic synthetic .xlsx workbook for benchmarks.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Parameters:
+    - file_path: str
+        The path of the workbook to write.
+    - rows, columns: int, optional
+        The size of the data area of every sheet, starting at A1. Row 1 is a header row. Defaults to 1000 x 10.
+    - sparsity: float, optional
+        The fraction of data cells left empty (0.0 - 1.0). Defaults to 0.1.
+    - shared_string_ratio: float, optional
+        The fraction of text cells drawn from a pool of 100 repeated labels; the others are unique strings.
+        All text goes through the shared string table, as in files saved by Excel. Defaults to 0.5.
+    - text_ratio: float, optional
+        The fraction of non-empty, non-formula cells holding text; the others hold numbers. Defaults to 0.3.
+    - formula_density: float, optional
+        The fraction of non-empty cells holding a formula (columns B onwards), e.g. "=A12*2" or
+        "=SUM(A12:C12)". No cached values are stored. Defaults to 0.1.
+    - sheets: int, optional
+        The number of sheets, named Data1, Data2, ... Defaults to 1.
+    - drawings: int, optional
+        The number of text box shapes embedded in each sheet (a drawing part per sheet). Defaults to 0.
+    - needle_every: int, optional
+        Every needle_every-th data row holds the text "NEEDLE <row>" in its last column, a known target for
+        text searches. 0 disables it. Defaults to 1000.
+    - seed: int, optional
+        The random seed. Defaults to 0.
+
+    Returns:
+    - dict
+        The spec (see workbook_spec) plus "cells", the number of non-empty cells written over all sheets.
+
+    Notes:
+    - The package is written directly (worksheets streamed into the zip), not through openpyxl: openpyxl
+      stores every string inline, while Excel files keep them in the shared string table and carry a
+      <dimension> element, which several readers of this repository rely on.
+    - Zip entry timestamps are fixed, so the same spec always produces a byte-identical file.
+    """
+    spec = workbook_spec(rows, columns, sparsity, shared_string_ratio, text_ratio, formula_density,
+                         sheets, drawings, needle_every, seed)
+    rng = random.Random(seed)
+    labels = [f"Label {i:03d}" for i in range(100)]
+    letters = [get_column_letter(column) for column in range(1, columns + 1)]
+    strings = {}  # text -> shared string index
+    references = 0
+
+    def shared(text):
+        nonlocal references
+        references += 1
+        index = strings.get(text)
+        if index is None:
+            index = strings[text] = len(strings)
+        return index
+
+    cells = 0
+    with zipfile.ZipFile(file_path, "w", zipfile.ZIP_DEFLATED) as archive:
+        for sheet_index in range(1, sheets + 1):
+            info = zipfile.ZipInfo(f"xl/worksheets/sheet{sheet_index}.xml", _ZIP_TIME)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            with archive.open(info, "w") as raw:
+                out = []
+                out.append(f'{_XML_HEADER}<worksheet xmlns="{_MAIN_NS}" xmlns:r="{_REL_NS}">'
+                           f'<dimension ref="A1:{letters[-1]}{rows}"/><sheetData>')
+                out.append('<row r="1">' + "".join(f'<c r="{letter}1" t="s"><v>{shared(f"Column {letter}")}</v></c>'
+                                                   for letter in letters) + "</row>")
+                cells += columns
+                for row in range(2, rows + 1):
+                    row_cells = []
+                    needle_row = needle_every and row % needle_every == 0
+                    for column, letter in enumerate(letters):
+                        if needle_row and column == columns - 1:
+                            row_cells.append(f'<c r="{letter}{row}" t="s"><v>{shared(f"{NEEDLE} {row}")}</v></c>')
+                            cells += 1
+                            continue
+                        if rng.random() < sparsity:
+                            continue
+                        cells += 1
+                        if column > 0 and rng.random() < formula_density:
+                            if rng.random() < 0.5:
+                                formula = f"{letters[column - 1]}{row}*2"
+                            else:
+                                formula = f"SUM(A{row}:{letters[column - 1]}{row})"
+                            row_cells.append(f'<c r="{letter}{row}"><f>{formula}</f></c>')
+                        elif rng.random() < text_ratio:
+                            if rng.random() < shared_string_ratio:
+                                text = labels[rng.randrange(len(labels))]
+                            else:
+                                text = f"Text {sheet_index}-{row}-{column + 1}"
+                            row_cells.append(f'<c r="{letter}{row}" t="s"><v>{shared(text)}</v></c>')
+                        else:
+                            row_cells.append(f'<c r="{letter}{row}"><v>{round(rng.uniform(-1000, 1000), 2)}</v></c>')
+                    out.append(f'<row r="{row}">{"".join(row_cells)}</row>')
+                    if len(out) >= 1000:
+                        raw.write("".join(out).encode("utf-8"))
+                        out.clear()
+                out.append('</sheetData><pageMargins left="0.7" right="0.7" top="0.75" bottom="0.75" '
+                           'header="0.3" footer="0.3"/>')
+                if drawings:
+                    out.append('<drawing r:id="rId1"/>')
+                out.append("</worksheet>")
+                raw.write("".join(out).encode("utf-8"))
+
+            if drawings:
+                _write(archive, f"xl/drawings/drawing{sheet_index}.xml", _drawing_xml(columns, drawings))
+                _write(archive, f"xl/worksheets/_rels/sheet{sheet_index}.xml.rels",
+                       f'{_XML_HEADER}<Relationships xmlns="{_PKG_REL_NS}"><Relationship Id="rId1" '
+                       f'Type="{_DOC_TYPE}/drawing" Target="../drawings/drawing{sheet_index}.xml"/></Relationships>')
+
+        _write(archive, "xl/sharedStrings.xml",
+               f'{_XML_HEADER}<sst xmlns="{_MAIN_NS}" count="{references}" uniqueCount="{len(strings)}">'
+               + "".join(f"<si><t>{escape(text)}</t></si>" for text in strings) + "</sst>")
+        _write(archive, "xl/styles.xml",
+               f'{_XML_HEADER}<styleSheet xmlns="{_MAIN_NS}">'
+               '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+               '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+               '<fill><patternFill patternType="gray125"/></fill></fills>'
+               '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+               '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+               '<cellXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/></cellXfs>'
+               '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+               '</styleSheet>')
+        _write(archive, "xl/workbook.xml",
+               f'{_XML_HEADER}<workbook xmlns="{_MAIN_NS}" xmlns:r="{_REL_NS}">'
+               '<bookViews><workbookView activeTab="0"/></bookViews><sheets>'
+               + "".join(f'<sheet name="Data{i}" sheetId="{i}" r:id="rId{i}"/>' for i in range(1, sheets + 1))
+               + '</sheets><calcPr calcId="191029" fullCalcOnLoad="1"/></workbook>')
+        _write(archive, "xl/_rels/workbook.xml.rels",
+               f'{_XML_HEADER}<Relationships xmlns="{_PKG_REL_NS}">'
+               + "".join(f'<Relationship Id="rId{i}" Type="{_DOC_TYPE}/worksheet" Target="worksheets/sheet{i}.xml"/>'
+                         for i in range(1, sheets + 1))
+               + f'<Relationship Id="rId{sheets + 1}" Type="{_DOC_TYPE}/sharedStrings" Target="sharedStrings.xml"/>'
+               + f'<Relationship Id="rId{sheets + 2}" Type="{_DOC_TYPE}/styles" Target="styles.xml"/>'
+               + "</Relationships>")
+        _write(archive, "_rels/.rels",
+               f'{_XML_HEADER}<Relationships xmlns="{_PKG_REL_NS}"><Relationship Id="rId1" '
+               f'Type="{_DOC_TYPE}/officeDocument" Target="xl/workbook.xml"/></Relationships>')
+        content_type = "application/vnd.openxmlformats-officedocument"
+        _write(archive, "[Content_Types].xml",
+               f'{_XML_HEADER}<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+               f'<Default Extension="rels" ContentType="{content_type}-package.relationships+xml"/>'
+               '<Default Extension="xml" ContentType="application/xml"/>'
+               f'<Override PartName="/xl/workbook.xml" ContentType="{content_type}.spreadsheetml.sheet.main+xml"/>'
+               + "".join(f'<Override PartName="/xl/worksheets/sheet{i}.xml" '
+                         f'ContentType="{content_type}.spreadsheetml.worksheet+xml"/>' for i in range(1, sheets + 1))
+               + "".join(f'<Override PartName="/xl/drawings/drawing{i}.xml" ContentType="{content_type}.drawing+xml"/>'
+                         for i in range(1, sheets + 1) if drawings)
+               + f'<Override PartName="/xl/sharedStrings.xml" ContentType="{content_type}.spreadsheetml.sharedStrings+xml"/>'
+               + f'<Override PartName="/xl/styles.xml" ContentType="{content_type}.spreadsheetml.styles+xml"/>'
+               + "</Types>")
+
+    spec["cells"] = cells
+    logger.info(f"Generated '{file_path}' with {cells} cells and {len(strings)} unique strings on {sheets} sheets.")
+    return spec
+
+if __name__ == "__main__":
+    ex_configure_logging()
+    parser = argparse.ArgumentParser(description="Write a deterministic synthetic workbook.")
+    parser.add_argument("file_path")
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--columns", type=int, default=10)
+    parser.add_argument("--sparsity", type=float, default=0.1)
+    parser.add_argument("--shared-string-ratio", type=float, default=0.5)
+    parser.add_argument("--text-ratio", type=float, default=0.3)
+    parser.add_argument("--formula-density", type=float, default=0.1)
+    parser.add_argument("--sheets", type=int, default=1)
+    parser.add_argument("--drawings", type=int, default=0)
+    parser.add_argument("--needle-every", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = vars(parser.parse_args())
+    print(generate_workbook(**args))
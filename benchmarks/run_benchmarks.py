@@ -0,0 +1,229 @@
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import openpyxl
+import psutil
+
+from generate_workbook import NEEDLE, generate_workbook, spec_file_name, workbook_spec
+from excel_framework import ex_configure_logging, ex_get_logger
+
+logger = ex_get_logger(__name__)
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+SIZES = {"10k": 10_000, "100k": 100_000, "1m": 1_000_000, "5m": 5_000_000}
+COLUMNS = 20
+
+def _operations(file_path, work_dir):
+    """
+    The benchmarked calls: name -> (needs an edit-mode load, callable).
+    """
+    from excel_framework import (ex_copy_range, ex_find_cells_with_fomulas, ex_find_cells_with_text,
+                                 ex_latest_column, ex_latest_row)
+
+    def copy_range():
+        target = os.path.join(work_dir, "copy_target.xlsx")
+        if os.path.exists(target):
+            os.remove(target)
+        ex_copy_range((file_path, "Data1", "all"), (target, "Copy", "A1"))
+
+    return {
+        "find_text_openpyxl": (True, lambda: ex_find_cells_with_text(file_path, NEEDLE, sheet_name="Data1")),
+        "find_text_stream": (False, lambda: ex_find_cells_with_text(file_path, NEEDLE, sheet_name="Data1", engine="stream")),
+        "find_text_xml": (False, lambda: ex_find_cells_with_text(file_path, NEEDLE, sheet_name="Data1", engine="xml")),
+        "find_text_shared_strings": (False, lambda: ex_find_cells_with_text(file_path, NEEDLE, sheet_name="Data1",
+                                                                            engine="shared_strings")),
+        "find_formulas_openpyxl": (True, lambda: ex_find_cells_with_fomulas(file_path, sheet_name="Data1")),
+        "find_formulas_xml": (False, lambda: ex_find_cells_with_fomulas(file_path, sheet_name="Data1", engine="xml")),
+        "latest_row_dimension": (False, lambda: ex_latest_row(file_path, sheet_name="Data1")),
+        "latest_row_column_openpyxl": (True, lambda: ex_latest_row(file_path, sheet_name="Data1", row=1, column=1)),
+        "latest_row_column_xml": (False, lambda: ex_latest_row(file_path, sheet_name="Data1", row=1, column=1, engine="xml")),
+        "latest_column_row_openpyxl": (True, lambda: ex_latest_column(file_path, sheet_name="Data1", row=1, column=1)),
+        "latest_column_row_xml": (False, lambda: ex_latest_column(file_path, sheet_name="Data1", row=1, column=1,
+                                                                  engine="xml")),
+        "copy_range_new_file": (False, copy_range),
+    }
+
+def _peak_rss():
+    """
+    Returns the peak resident set size of this process in bytes.
+    """
+    info = psutil.Process().memory_info()
+    peak = getattr(info, "peak_wset", None)  # Windows
+    if peak is not None:
+        return peak
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # kilobytes on Linux
+
+def _worker(file_path, work_dir, operation, queue):
+    """
+    Runs one operation in a fresh process, so timings are cold and the peak RSS is its own.
+    """
+    try:
+        _, call = _operations(file_path, work_dir)[operation]
+        baseline = _peak_rss()
+        start = time.perf_counter()
+        call()
+        seconds = time.perf_counter() - start
+        queue.put({"seconds": seconds, "peak_rss": _peak_rss(), "baseline_rss": baseline})
+    except Exception as e:
+        queue.put({"error": f"{type(e).__name__}: {e}"})
+
+def _run_operation(file_path, work_dir, operation, timeout):
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(target=_worker, args=(file_path, work_dir, operation, queue))
+    process.start()
+    try:
+        result = queue.get(timeout=timeout)
+    except Exception:
+        result = {"error": f"no result within {timeout} s"}
+    process.join(5)
+    if process.is_alive():
+        process.terminate()
+    return result
+
+def run_benchmarks(sizes=("10k", "100k"), operations=None, repeat=1, max_edit_cells=1_000_000, spec_options=None,
+                   work_dir=None, timeout=3600):
+    """
+    Generates (or reuses) one synthetic workbook per size and times the benchmarked operations on it.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Parameters:
+    - sizes: iterable of str or int, optional
+        Data sizes in cells: keys of SIZES ("10k", "100k", "1m", "5m") or plain numbers. The sheet is
+        COLUMNS (20) columns wide. Defaults to ("10k", "100k").
+    - operations: iterable of str, optional
+        The operation names to run (see _operations). Defaults to all of them.
+    - repeat: int, optional
+        The number of runs of each operation; the fastest is reported. Defaults to 1.
+    - max_edit_cells: int, optional
+        Operations that load the workbook in edit mode are skipped above this many cells, as they need
+        several GB of memory. Defaults to 1,000,000.
+    - spec_options: dict, optional
+        Extra generate_workbook parameters (sparsity, formula_density, sheets, drawings, ...).
+    - work_dir: str, optional
+        Where generated workbooks are kept. Defaults to benchmarks/workbooks.
+    - timeout: int, optional
+        The number of seconds after which one run is abandoned. Defaults to 3600.
+
+    Returns:
+    - dict
+        {"environment": {...}, "results": [...]}. Each result holds size, operation, cells, seconds,
+        cells_per_second, peak_rss_mb, baseline_rss_mb and, when it failed or was skipped, error / skipped.
+
+    Notes:
+    - Every run happens in a new process: the workbook cache is cold and the peak RSS belongs to the run.
+    """
+    work_dir = work_dir or os.path.join(BENCHMARK_DIR, "workbooks")
+    os.makedirs(work_dir, exist_ok=True)
+    results = []
+    for size in sizes:
+        cells = SIZES[size] if size in SIZES else int(size)
+        spec = workbook_spec(**dict({"rows": max(2, cells // COLUMNS), "columns": COLUMNS}, **(spec_options or {})))
+        file_path = os.path.join(work_dir, spec_file_name(spec))
+        if not os.path.exists(file_path):
+            generate_workbook(file_path, **spec)
+
+        names = list(operations or _operations(file_path, work_dir))
+        for name in names:
+            needs_edit_mode = _operations(file_path, work_dir)[name][0]
+            result = {"size": str(size), "operation": name, "cells": cells}
+            if needs_edit_mode and cells > max_edit_cells:
+                result["skipped"] = f"edit-mode load above {max_edit_cells} cells"
+                results.append(result)
+                logger.info(f"{size} {name}: skipped.")
+                continue
+            runs = [_run_operation(file_path, work_dir, name, timeout) for _ in range(repeat)]
+            failed = [run for run in runs if "error" in run]
+            if failed:
+                result["error"] = failed[0]["error"]
+            else:
+                best = min(runs, key=lambda run: run["seconds"])
+                result.update({
+                    "seconds": round(best["seconds"], 4),
+                    "cells_per_second": round(cells / best["seconds"]) if best["seconds"] else None,
+                    "peak_rss_mb": round(max(run["peak_rss"] for run in runs) / 2**20, 1),
+                    "baseline_rss_mb": round(best["baseline_rss"] / 2**20, 1),
+                })
+            results.append(result)
+            logger.info(f"{size} {name}: {result.get('seconds', result.get('error'))}")
+
+    environment = {
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "openpyxl": openpyxl.__version__,
+        "repeat": repeat,
+        "spec_options": spec_options or {},
+    }
+    return {"environment": environment, "results": results}
+
+def compare_results(current, previous):
+    """
+    Returns printable lines comparing two result sets: seconds and peak RSS, with the ratio current/previous.
+    """
+    before = {(r["size"], r["operation"]): r for r in previous["results"]}
+    lines = [f"{'size':>6} {'operation':<28} {'seconds':>10} {'before':>10} {'ratio':>7} {'rss MB':>8} {'before':>8}"]
+    for result in current["results"]:
+        old = before.get((result["size"], result["operation"]), {})
+        seconds, old_seconds = result.get("seconds"), old.get("seconds")
+        ratio = f"{seconds / old_seconds:.2f}" if seconds and old_seconds else "-"
+        lines.append(f"{result['size']:>6} {result['operation']:<28} {str(seconds or '-'):>10} {str(old_seconds or '-'):>10} "
+                     f"{ratio:>7} {str(result.get('peak_rss_mb', '-')):>8} {str(old.get('peak_rss_mb', '-')):>8}")
+    return lines
+
+def _print_results(report):
+    print(f"{'size':>6} {'operation':<28} {'seconds':>10} {'cells/s':>12} {'peak RSS MB':>12}")
+    for result in report["results"]:
+        if "seconds" in result:
+            print(f"{result['size']:>6} {result['operation']:<28} {result['seconds']:>10} "
+                  f"{result['cells_per_second']:>12} {result['peak_rss_mb']:>12}")
+        else:
+            print(f"{result['size']:>6} {result['operation']:<28} {result.get('skipped') or result.get('error')}")
+
+if __name__ == "__main__":
+    ex_configure_logging()
+    parser = argparse.ArgumentParser(description="Benchmark the ex_* helpers on synthetic workbooks.")
+    parser.add_argument("--sizes", default="10k,100k", help="comma-separated sizes: 10k, 100k, 1m, 5m or a cell count")
+    parser.add_argument("--operations", default=None, help="comma-separated operation names (default: all)")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--max-edit-cells", type=int, default=1_000_000)
+    parser.add_argument("--sparsity", type=float, default=0.1)
+    parser.add_argument("--shared-string-ratio", type=float, default=0.5)
+    parser.add_argument("--formula-density", type=float, default=0.1)
+    parser.add_argument("--sheets", type=int, default=1)
+    parser.add_argument("--drawings", type=int, default=0)
+    parser.add_argument("--work-dir", default=None)
+    parser.add_argument("--output", default=None, help="result file (default: benchmarks/results/<date>.json)")
+    parser.add_argument("--compare", default=None, help="an earlier result file to compare with")
+    args = parser.parse_args()
+
+    spec_options = {"sparsity": args.sparsity, "shared_string_ratio": args.shared_string_ratio,
+                    "formula_density": args.formula_density, "sheets": args.sheets, "drawings": args.drawings}
+    report = run_benchmarks(sizes=args.sizes.split(","),
+                            operations=args.operations.split(",") if args.operations else None,
+                            repeat=args.repeat, max_edit_cells=args.max_edit_cells, spec_options=spec_options,
+                            work_dir=args.work_dir)
+    _print_results(report)
+
+    output = args.output or os.path.join(BENCHMARK_DIR, "results", datetime.now().strftime("%Y%m%d-%H%M%S") + ".json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Saved results to {output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            print("\n".join(compare_results(report, json.load(f))))
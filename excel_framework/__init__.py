@@ -0,0 +1,138 @@
+"""
+excel_framework - helpers for reading, searching and editing Excel workbooks.
+
+Every helper lives in its own ex_<name> module. Importing the package itself is cheap: a helper and its
+dependencies (openpyxl, Pillow, xlwings, ...) are imported on the first access of its name, so
+
+    import excel_framework as ex
+    ex.ex_latest_row(file_path, sheet_name="Data")
+
+only ever loads the streaming reader, and a script that never touches an xlwings helper does not need
+Excel or xlwings installed.
+
+Author: NGUYEN TIEN THANH / KNT15083
+Last Updated: 2026-10-17
+"""
+import importlib
+import sys
+from types import ModuleType
+
+# Exported name -> the module that defines it
+_EXPORTS = {
+    # Workbook lifetime (xlwings)
+    "ex_open_workbook": "ex_open_workbook",
+    "ex_close_workbook": "ex_close_workbook",
+    "ex_close_all": "ex_close_all",
+    "ex_close_hidden": "ex_close_hidden",
+    "ex_save_activate": "ex_save_activate",
+    "ex_convert_to_pdf": "ex_convert_to_pdf",
+    "ex_convert_to_xlsx": "ex_convert_to_xlsx",
+    # Sheets, shapes and styles (xlwings)
+    "ex_copy_sheet": "ex_copy_sheet",
+    "ex_sheet_action": "ex_sheet_action",
+    "ex_sheets_action": "ex_sheets_action",
+    "ex_print_action": "ex_print_action",
+    "ex_style_autosize": "ex_style_autosize",
+    "ex_style_range": "ex_style_range",
+    "ex_insert_textbox": "ex_insert_textbox",
+    "ex_edit_textbox": "ex_edit_textbox",
+    "ex_copy_textbox": "ex_copy_textbox",
+    "ex_delete_shape": "ex_delete_shape",
+    "ex_find_shapes_has_text": "ex_find_shapes_has_text",
+    # Reading and searching (openpyxl / streaming XML)
+    "ex_latest_row": "ex_latest_row",
+    "ex_latest_column": "ex_latest_column",
+    "ex_iter_cell_values": "ex_iter_cell_values",
+    "ex_iter_populated_cells": "ex_iter_populated_cells",
+    "ex_iter_cells_with_text": "ex_find_cells_with_text",
+    "ex_find_cells_with_text": "ex_find_cells_with_text",
+    "ex_find_cells_with_texts": "ex_find_cells_with_texts",
+    "ex_iter_formulas": "ex_find_cells_with_fomulas",
+    "ex_find_cells_with_fomulas": "ex_find_cells_with_fomulas",
+    "ex_read_formulas_with_values": "ex_find_cells_with_fomulas",
+    "SheetRecord": "ex_xlsx_reader",
+    "ex_iter_sheet_records": "ex_xlsx_reader",
+    "ex_read_sheet_names": "ex_xlsx_reader",
+    "ex_read_sheet_dimension": "ex_xlsx_reader",
+    "ex_sheet_extent": "ex_xlsx_reader",
+    "ex_iter_text_matches_by_shared_strings": "ex_xlsx_reader",
+    "OccupancyIndex": "ex_occupancy_index",
+    "ex_get_occupancy_index": "ex_occupancy_index",
+    "ex_invalidate_occupancy_index": "ex_occupancy_index",
+    "SheetFrame": "ex_sheet_frame",
+    "ex_read_sheet_frame": "ex_sheet_frame",
+    "ex_invalidate_sheet_frame": "ex_sheet_frame_cache",
+    # Export
+    "ex_iter_sheet_batches": "ex_export_sheet",
+    "ex_export_sheet": "ex_export_sheet",
+    # Editing (openpyxl)
+    "ex_copy_range": "ex_copy_range",
+    "ex_copy_range_between_sheets": "ex_copy_range",
+    "ex_copy_ranges": "ex_copy_ranges",
+    "ex_write_xlsx": "ex_write_xlsx",
+    "ex_csv_to_xlsx": "ex_write_xlsx",
+    # Formulas
+    "FormulaRef": "ex_formula_tokens",
+    "ex_tokenize_formula": "ex_formula_tokens",
+    "ex_formula_functions": "ex_formula_tokens",
+    "ex_formula_errors": "ex_formula_tokens",
+    "ex_formula_references": "ex_formula_tokens",
+    "RowIntervals": "ex_formula_graph",
+    "FormulaGraph": "ex_formula_graph",
+    "ex_build_formula_graph": "ex_formula_graph",
+    "ExcelError": "ex_formula_evaluator",
+    "FormulaEvaluator": "ex_formula_evaluator",
+    "ex_write_cached_values": "ex_formula_evaluator",
+    "ex_calculate_workbook": "ex_formula_evaluator",
+    # Batch jobs
+    "ex_load_job": "ex_run_job",
+    "ex_plan_job": "ex_run_job",
+    "ex_run_job": "ex_run_job",
+    # Workbook cache
+    "ex_openpyxl": "ex_workbook_cache",
+    "ex_load_workbook": "ex_workbook_cache",
+    "ex_invalidate_workbook": "ex_workbook_cache",
+    "ex_set_workbook_cache_limit": "ex_workbook_cache",
+    "ex_workbook_cache_info": "ex_workbook_cache",
+    "WorkbookSession": "ex_workbook_session",
+    "ex_session_source": "ex_workbook_session",
+    # Logging and telemetry
+    "ex_get_logger": "ex_logging",
+    "ex_configure_logging": "ex_logging",
+    "LogSampler": "ex_logging",
+    "MetricsRegistry": "ex_telemetry",
+    "ex_enable_telemetry": "ex_telemetry",
+    "ex_telemetry_registry": "ex_telemetry",
+    "ex_telemetry_scope": "ex_telemetry",
+    "ex_export_telemetry": "ex_telemetry",
+    "ex_count": "ex_telemetry",
+    "instrument": "ex_telemetry",
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    """
+    Imports the module behind an exported name on first access and caches the attribute on the package.
+    """
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
+class _Package(ModuleType):
+    """
+    Most helpers share their name with their module. Importing the submodule makes the import system set
+    it as a package attribute, which would shadow the function; keep the function instead.
+    """
+    def __setattr__(self, name, value):
+        if isinstance(value, ModuleType) and _EXPORTS.get(name) == name:
+            value = getattr(value, name, value)
+        super().__setattr__(name, value)
+
+sys.modules[__name__].__class__ = _Package
@@ -0,0 +1,4 @@
+from .ex_run_job import main
+
+# python -m excel_framework job.yaml
+raise SystemExit(main())
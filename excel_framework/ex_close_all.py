@@ -1,12 +1,11 @@
-import logging
 import subprocess
+from .ex_logging import ex_configure_logging, ex_get_logger
+from .ex_telemetry import instrument
 
+logger = ex_get_logger(__name__)
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(module)s | %(lineno)d | %(funcName)s | %(levelname)s | %(message)s',
-)
 
+@instrument
 def ex_close_all():
     """
     Force closes all running instances of Excel on the system.
@@ -24,15 +23,16 @@ def ex_close_all():
     - Logs an error message if an error occurs during the process.
     - Logs a warning if no running Excel application is found to close.
     """
-    logging.debug("Starting the process to force close Excel.")
+    logger.debug("Starting the process to force close Excel.")
     try:
         subprocess.run(["taskkill", "/f", "/im", "excel.exe"], check=True)
-        logging.info("Excel has been force closed successfully.")
+        logger.info("Excel has been force closed successfully.")
     except subprocess.CalledProcessError as e:
-        logging.error(f"An error occurred while trying to close Excel: {e}")
+        logger.error(f"An error occurred while trying to close Excel: {e}")
     except FileNotFoundError:
-        logging.warning("No running Excel application found to close.")
+        logger.warning("No running Excel application found to close.")
 
 if __name__ == '__main__':
+    ex_configure_logging()
     ex_close_all()
 
@@ -1,14 +1,9 @@
-import psutil
-import pygetwindow as gw
-import win32process
-import logging
+from .ex_logging import ex_configure_logging, ex_get_logger
+from .ex_telemetry import instrument
 
+logger = ex_get_logger(__name__)
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(module)s | %(lineno)d | %(funcName)s | %(levelname)s | %(message)s',
-)
-
+@instrument
 def ex_close_hidden():
     """
     Terminates any hidden instances of Excel processes running on the system.
@@ -25,8 +20,11 @@ def ex_close_hidden():
     - Logs errors if there are issues accessing any processes.
     - Logs an info message if no hidden Excel processes were found to terminate.
     """
+    import psutil
+    import pygetwindow as gw
+    import win32process
         
-    logging.debug("Starting the process to terminate hidden Excel instances.")
+    logger.debug("Starting the process to terminate hidden Excel instances.")
     
     def is_excel_window_visible(pid):
         windows = gw.getWindowsWithTitle('Excel')
@@ -45,16 +43,17 @@ def ex_close_hidden():
             try:
                 if not is_excel_window_visible(proc.info['pid']):
                     proc.terminate()
-                    logging.info(f'Terminated hidden Excel process: {proc.info["name"]} (PID: {proc.info["pid"]})')
+                    logger.info(f'Terminated hidden Excel process: {proc.info["name"]} (PID: {proc.info["pid"]})')
                     any_terminated = True
                 else:
-                    logging.debug(f'Excel process (PID: {proc.info["pid"]}) is visible and will not be terminated.')
+                    logger.debug(f'Excel process (PID: {proc.info["pid"]}) is visible and will not be terminated.')
             except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
-                logging.error(f'Error accessing process (PID: {proc.info["pid"]}): {e}')
+                logger.error(f'Error accessing process (PID: {proc.info["pid"]}): {e}')
 
     if not any_terminated:
-        logging.info('No hidden Excel processes were found to terminate.')
+        logger.info('No hidden Excel processes were found to terminate.')
 
 if __name__ == '__main__':
+    ex_configure_logging()
     ex_close_hidden()
 
@@ -1,10 +1,8 @@
-import logging
-
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(module)s | %(lineno)d | %(funcName)s | %(levelname)s | %(message)s',
-)
+from .ex_logging import ex_configure_logging, ex_get_logger
+from .ex_telemetry import ex_count, instrument
 
+logger = ex_get_logger(__name__)
+@instrument
 def ex_close_workbook(app, wb, save_on_close=True):
     """
     Closes an Excel workbook and optionally saves changes before closing.
@@ -33,35 +31,40 @@ def ex_close_workbook(app, wb, save_on_close=True):
     - Logs debug information about whether the Excel application is quitting or remaining open.
     """
     
-    logging.debug(f"Starting to close the workbook '{wb.name}' with save_on_close set to {save_on_close}.")
+    logger.debug(f"Starting to close the workbook '{wb.name}' with save_on_close set to {save_on_close}.")
     wb_name = wb.name  
 
     try:
         if save_on_close:
             try:
+                ex_count(com_calls=1)
                 wb.save()
-                logging.debug(f"Successfully saved the workbook '{wb_name}'.")
+                logger.debug(f"Successfully saved the workbook '{wb_name}'.")
             except Exception as save_error:
-                logging.error(f"Failed to save the workbook '{wb_name}'. Error: {save_error}")
+                logger.error(f"Failed to save the workbook '{wb_name}'. Error: {save_error}")
                 raise
         else:
-            logging.debug(f"Skipped saving the workbook '{wb_name}'.")
+            logger.debug(f"Skipped saving the workbook '{wb_name}'.")
 
+        ex_count(com_calls=1)
         wb.close()
-        logging.debug(f"Successfully closed the workbook '{wb_name}'.")
+        logger.debug(f"Successfully closed the workbook '{wb_name}'.")
 
     except Exception as e:
-        logging.error(f"Failed to close the workbook '{wb_name}'. Error: {e}")
+        logger.error(f"Failed to close the workbook '{wb_name}'. Error: {e}")
         raise
 
     finally:
+        ex_count(com_calls=1)
         if app.books.count == 0:
+            ex_count(com_calls=1)
             app.quit()
-            logging.debug('Successfully quit the Excel application.')
+            logger.debug('Successfully quit the Excel application.')
         else:
-            logging.debug('The Excel application is still running with other workbooks open.')
+            logger.debug('The Excel application is still running with other workbooks open.')
 
 if __name__ == '__main__':
+    ex_configure_logging()
     try:
         file_path = r"C:\Users\KNT15083\Documents\Book1111.xlsx"
         file_path = r"C:\Users\KNT15083\Downloads\fffsda.xlsx"
@@ -1,12 +1,10 @@
 import os
-import xlwings as xw
-import logging
+from .ex_logging import ex_configure_logging, ex_get_logger
+from .ex_telemetry import ex_count, instrument
 
-logging.basicConfig(
-        level=logging.DEBUG,
-        format='%(asctime)s | %(module)s | %(lineno)d | %(funcName)s | %(levelname)s | %(message)s',
-    )
+logger = ex_get_logger(__name__)
 
+@instrument
 def ex_convert_to_pdf(excel_file_path, pdf_file_path=None):
     """
     Converts an Excel file to a PDF file and saves it to the specified path.
@@ -30,9 +28,10 @@ def ex_convert_to_pdf(excel_file_path, pdf_file_path=None):
     - Logs an info message when the conversion to PDF is completed successfully.
     - Logs an error message if an exception occurs during the conversion process.
     """
+    import xlwings as xw
     # Check if the input Excel file exists
     if not os.path.exists(excel_file_path):
-        logging.error("Excel file does not exist.")
+        logger.error("Excel file does not exist.")
         return
 
     # If pdf_file_path is not provided, create it from excel_file_path
@@ -42,24 +41,28 @@ def ex_convert_to_pdf(excel_file_path, pdf_file_path=None):
     # Ensure the output folder exists
     pdf_folder = os.path.dirname(pdf_file_path)
     if not os.path.exists(pdf_folder) and pdf_folder != '':
-        logging.error("Output folder does not exist.")
+        logger.error("Output folder does not exist.")
         return
 
+    ex_count(com_calls=2)  # start Excel, display_alerts
     app = xw.App(visible=False)
     app.display_alerts = False
 
     try:
+        ex_count(com_calls=2)  # open, to_pdf
         workbook = app.books.open(excel_file_path, ignore_read_only_recommended=True)
         workbook.to_pdf(pdf_file_path)
-        logging.info(f"Conversion to PDF completed! File saved at: {pdf_file_path}")
+        logger.info(f"Conversion to PDF completed! File saved at: {pdf_file_path}")
     except Exception as e:
-        logging.error(f"An error occurred: {e}")
+        logger.error(f"An error occurred: {e}")
 
     finally:
+        ex_count(com_calls=2)  # close, quit
         workbook.close()
         app.quit()
 
 if __name__ == "__main__":
+    ex_configure_logging()
     try:
         excel_file = r"C:\Users\KNT15083\Downloads\sontung\Out\RN01815\検討書\J2-24-P068.xlsx"
         output_folder = r"C:\Users\KNT15083\Downloads\sontung\Out\RN01815\検討書"
@@ -1,12 +1,10 @@
 import os
-import xlwings as xw
-import logging
+from .ex_logging import ex_configure_logging, ex_get_logger
+from .ex_telemetry import ex_count, instrument
 
-logging.basicConfig(
-        level=logging.DEBUG,
-        format='%(asctime)s | %(module)s | %(lineno)d | %(funcName)s | %(levelname)s | %(message)s',
-    )
+logger = ex_get_logger(__name__)
 
+@instrument
 def ex_convert_to_xlsx(xls_file_path, xlsx_file_path=None, remove_xls_file=False):
     """
     Converts an Excel file from .xls format to .xlsx format and optionally deletes the original .xls file.
@@ -31,30 +29,35 @@ def ex_convert_to_xlsx(xls_file_path, xlsx_file_path=None, remove_xls_file=False
     - Logs an info message if the original .xls file is deleted after conversion.
     - Logs an error message if an exception occurs during the conversion process.
     """
+    import xlwings as xw
     try:
         # If xlsx_file_path is not provided, create it from xls_file_path
         if xlsx_file_path is None:
             xlsx_file_path = os.path.splitext(xls_file_path)[0] + '.xlsx'
         
+        ex_count(com_calls=2)  # start Excel, display_alerts
         app = xw.App(visible=False) 
         app.display_alerts = False
+        ex_count(com_calls=2)  # open, save
         wb = app.books.open(xls_file_path)
 
         wb.save(xlsx_file_path)
-        logging.info(f"Successfully converted {xls_file_path} to {xlsx_file_path}.")
+        logger.info(f"Successfully converted {xls_file_path} to {xlsx_file_path}.")
 
+        ex_count(com_calls=2)  # close, quit
         wb.close()
         app.quit()
 
         # Remove the original xls file if remove_xls_file is True
         if remove_xls_file:
             os.remove(xls_file_path)
-            logging.info(f"Original file {xls_file_path} has been deleted.")
+            logger.info(f"Original file {xls_file_path} has been deleted.")
 
     except Exception as e:
-        logging.error(f"Error during conversion: {e}")
+        logger.error(f"Error during conversion: {e}")
 
 if __name__ == "__main__":
+    ex_configure_logging()
     try:
         excel_file = r"C:\Users\KNT15083\Downloads\sontung\Out\RN01815\検討書\J2-24-P068.xlsx"
         output_folder = r"C:\Users\KNT15083\Downloads\sontung\Out\RN01815\検討書"
@@ -0,0 +1,312 @@
+import os
+from functools import lru_cache
+
+import openpyxl
+from openpyxl.cell.cell import MergedCell
+from openpyxl.formula.tokenizer import Token
+from openpyxl.formula.translate import Translator, TranslatorError
+from openpyxl.styles.cell_style import StyleArray
+from openpyxl.styles.numbers import BUILTIN_FORMATS_MAX_SIZE
+from openpyxl.utils import get_column_letter
+
+from .ex_iter_populated_cells import ex_iter_populated_cells
+from .ex_occupancy_index import ex_invalidate_occupancy_index
+from .ex_sheet_frame_cache import ex_invalidate_sheet_frame
+from .ex_workbook_cache import ex_load_workbook, ex_invalidate_workbook
+from .ex_workbook_session import WorkbookSession, ex_session_source
+from .ex_logging import ex_configure_logging, ex_get_logger
+from .ex_telemetry import instrument
+
+logger = ex_get_logger(__name__)
+
+@lru_cache(maxsize=4096)
+def _formula_translator(formula):
+    # Tokenizes the formula once; the origin is irrelevant since translations use explicit offsets
+    return Translator(formula, origin="A1")
+
+@lru_cache(maxsize=65536)
+def _translate_formula(formula, row_offset, col_offset):
+    """
+    Moves the relative references of a formula by (row_offset, col_offset). Fill-down formulas repeat
+    the same text many times, so results are cached per (formula, row offset, column offset).
+    References moved off the sheet (above row 1 or left of column A) become #REF!, as Excel does.
+    """
+    translator = _formula_translator(formula)
+    try:
+        return translator.translate_formula(row_delta=row_offset, col_delta=col_offset)
+    except TranslatorError:
+        pass
+
+    out = ["="]
+    for token in translator.get_tokens():
+        if token.type == Token.OPERAND and token.subtype == Token.RANGE:
+            try:
+                out.append(Translator.translate_range(token.value, row_offset, col_offset))
+            except TranslatorError:
+                out.append("#REF!")
+        else:
+            out.append(token.value)
+    translated = "".join(out)
+    logger.warning(f"Formula {formula} moved by ({row_offset}, {col_offset}) refers outside the sheet: {translated}.")
+    return translated
+
+def _relocate(value, row_offset, col_offset):
+    if isinstance(value, str) and value.startswith("=") and (row_offset or col_offset):
+        return _translate_formula(value, row_offset, col_offset)
+    return value
+
+def _copy_rows_to_new_file(source_file, source_sheet_name, source_range, target_file, target_sheet_name, start_row, start_col,
+                           translate_formulas=False):
+    """
+    Streams whole row tuples from a read-only source into a write-only workbook saved as target_file.
+    """
+    source_wb = ex_load_workbook(source_file, read_only=True)
+    try:
+        source_sheet = source_wb[source_sheet_name]
+        source_sheet.reset_dimensions()
+
+        if source_range.lower() == "all":
+            min_col, min_row = 1, 1
+            rows = source_sheet.iter_rows(values_only=True)
+        else:
+            min_col, min_row, max_col, max_row = openpyxl.utils.range_boundaries(source_range)
+            rows = source_sheet.iter_rows(min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col,
+                                          values_only=True)
+        row_offset, col_offset = start_row - min_row, start_col - min_col
+
+        target_wb = openpyxl.Workbook(write_only=True)
+        target_sheet = target_wb.create_sheet(title=target_sheet_name)
+        for _ in range(start_row - 1):
+            target_sheet.append(())
+        padding = (None,) * (start_col - 1)
+        copied_rows = 0
+        for row in rows:
+            if translate_formulas:
+                row = tuple(_relocate(value, row_offset, col_offset) for value in row)
+            target_sheet.append(padding + tuple(row) if padding else row)
+            copied_rows += 1
+    finally:
+        source_wb.close()  # read-only workbooks hold the file open
+
+    target_wb.save(target_file)
+    logger.info(f"Copied {copied_rows} rows to new file '{target_file}' (sheet '{target_sheet_name}').")
+
+def _map_style(source_wb, target_wb, style, style_map):
+    """
+    Returns the target StyleArray for a source StyleArray, registering its font, fill, border, number format,
+    protection and alignment in the target workbook only the first time this style is seen.
+    """
+    key = tuple(style)
+    mapped = style_map.get(key)
+    if mapped is None:
+        if source_wb is target_wb:
+            mapped = StyleArray(style)
+        else:
+            mapped = StyleArray()
+            mapped.fontId = target_wb._fonts.add(source_wb._fonts[style.fontId])
+            mapped.fillId = target_wb._fills.add(source_wb._fills[style.fillId])
+            mapped.borderId = target_wb._borders.add(source_wb._borders[style.borderId])
+            mapped.protectionId = target_wb._protections.add(source_wb._protections[style.protectionId])
+            mapped.alignmentId = target_wb._alignments.add(source_wb._alignments[style.alignmentId])
+            if style.numFmtId < BUILTIN_FORMATS_MAX_SIZE:
+                mapped.numFmtId = style.numFmtId
+            else:
+                number_format = source_wb._number_formats[style.numFmtId - BUILTIN_FORMATS_MAX_SIZE]
+                mapped.numFmtId = target_wb._number_formats.add(number_format) + BUILTIN_FORMATS_MAX_SIZE
+            style_name = source_wb._named_styles[style.xfId].name if style.xfId < len(source_wb._named_styles) else None
+            if style_name in target_wb._named_styles.names:
+                mapped.xfId = target_wb._named_styles.names.index(style_name)
+            mapped.pivotButton = style.pivotButton
+            mapped.quotePrefix = style.quotePrefix
+        style_map[key] = mapped
+    return mapped
+
+def _copy_layout(source_sheet, target_sheet, min_row, min_col, max_row, max_col, row_offset, col_offset):
+    """
+    Copies column widths, row heights and merged ranges that lie inside the copied block.
+    """
+    for dimension in list(source_sheet.column_dimensions.values()):
+        if dimension.customWidth and dimension.width:
+            for column in range(max(dimension.min or 0, min_col), min(dimension.max or 0, max_col) + 1):
+                target_sheet.column_dimensions[get_column_letter(column + col_offset)].width = dimension.width
+
+    for row, dimension in list(source_sheet.row_dimensions.items()):
+        if min_row <= row <= max_row and dimension.ht is not None:
+            target_sheet.row_dimensions[row + row_offset].height = dimension.ht
+
+    for merged in list(source_sheet.merged_cells.ranges):
+        if min_row <= merged.min_row and merged.max_row <= max_row and min_col <= merged.min_col and merged.max_col <= max_col:
+            target_sheet.merge_cells(start_row=merged.min_row + row_offset, start_column=merged.min_col + col_offset,
+                                     end_row=merged.max_row + row_offset, end_column=merged.max_col + col_offset)
+
+@instrument
+def ex_copy_range_between_sheets(source_sheet, source_range, target_sheet, target_start_cell, copy_styles=False, style_map=None,
+                                 translate_formulas=False):
+    """
+    Copies a range between two worksheets already loaded in edit mode, without saving anything.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Parameters:
+    - source_sheet: openpyxl.worksheet.worksheet.Worksheet
+        The sheet to copy from.
+    - source_range: str
+        The range to copy (e.g., "A1:B10"), or "all" for the whole used area of the sheet.
+    - target_sheet: openpyxl.worksheet.worksheet.Worksheet
+        The sheet to copy to.
+    - target_start_cell: str
+        The top-left cell of the destination (e.g., "E3").
+    - copy_styles: bool, optional
+        If True, also copies number formats, fonts, fills, borders, alignment, protection, column widths,
+        row heights and the merged ranges that lie inside the block. Defaults to False.
+    - style_map: dict, optional
+        Cache of source style -> target style for this pair of workbooks. Pass the same dict to successive
+        calls between the same workbooks so that every distinct style is mapped only once.
+    - translate_formulas: bool, optional
+        If True, relative references in formulas are moved by the offset between the source range and
+        target_start_cell, as Excel does when pasting (e.g. "=A1*2" copied one row down becomes "=A2*2").
+        Absolute references ($A$1) are kept. Defaults to False, which copies the formula text unchanged.
+
+    Returns:
+    - int
+        The number of cells written.
+
+    Notes:
+    - Formula translations are cached per (formula, row offset, column offset) and each distinct formula is
+      tokenized only once per process.
+    - Each distinct source style is added to the target style tables once and then shared by reference,
+      so the saved file grows by the number of distinct styles copied, not by the number of cells.
+    """
+    start_row, start_col = openpyxl.utils.cell.coordinate_to_tuple(target_start_cell)
+    if source_range.lower() == "all":
+        min_col, min_row, max_col, max_row = 1, 1, source_sheet.max_column, source_sheet.max_row
+    else:
+        min_col, min_row, max_col, max_row = openpyxl.utils.range_boundaries(source_range)
+    row_offset, col_offset = start_row - min_row, start_col - min_col
+
+    if not copy_styles:
+        # Read the whole block first, so copying onto an overlapping area of the same sheet is safe
+        values = [(r, c, cell.value) for r, c, cell in ex_iter_populated_cells(source_sheet, min_row, min_col, max_row, max_col)
+                  if cell.value is not None]
+        if translate_formulas:
+            values = [(r, c, _relocate(value, row_offset, col_offset)) for r, c, value in values]
+
+        # Only cells that exist are read or written: empty source cells clear the target cells that exist,
+        # and no empty cell is created in either sheet (ws.cell() would store one per coordinate touched)
+        for r, c, cell in ex_iter_populated_cells(target_sheet, start_row, start_col,
+                                                  max_row + row_offset, max_col + col_offset):
+            cell.value = None
+        for r, c, value in values:
+            target_sheet.cell(row=r + row_offset, column=c + col_offset, value=value)
+        return len(values)
+
+    if style_map is None:
+        style_map = {}
+    source_wb, target_wb = source_sheet.parent, target_sheet.parent
+    # Formatted blanks are copied too; merged cells are rebuilt by _copy_layout
+    cells = [(r, c, cell.value, _map_style(source_wb, target_wb, cell._style, style_map))
+             for r, c, cell in ex_iter_populated_cells(source_sheet, min_row, min_col, max_row, max_col)
+             if (cell.value is not None or cell.has_style) and not isinstance(cell, MergedCell)]
+    if translate_formulas:
+        cells = [(r, c, _relocate(value, row_offset, col_offset), style) for r, c, value, style in cells]
+
+    # Merged ranges of the target that overlap the block would make its cells read-only
+    for merged in list(target_sheet.merged_cells.ranges):
+        if not (merged.max_row < start_row or merged.min_row > max_row + row_offset
+                or merged.max_col < start_col or merged.min_col > max_col + col_offset):
+            target_sheet.unmerge_cells(merged.coord)
+    for r, c, cell in ex_iter_populated_cells(target_sheet, start_row, start_col,
+                                              max_row + row_offset, max_col + col_offset):
+        cell.value = None
+        cell._style = StyleArray()
+    for r, c, value, style in cells:
+        target_cell = target_sheet.cell(row=r + row_offset, column=c + col_offset, value=value)
+        target_cell._style = StyleArray(style)  # cells must not share one mutable StyleArray
+
+    _copy_layout(source_sheet, target_sheet, min_row, min_col, max_row, max_col, row_offset, col_offset)
+    logger.debug(f"Copied {len(cells)} cells using {len(style_map)} distinct styles.")
+    return len(cells)
+
+@instrument
+def ex_copy_range(source_info, target_info, copy_styles=False, translate_formulas=False):
+    """
+    Copies data from a specified range in a source Excel sheet to a target Excel sheet.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Parameters:
+    - source_info: tuple
+        A tuple containing the source file path, source sheet name, and source range (e.g., ("source.xlsx", "Sheet1", "A1:B10")).
+        The file may also be a WorkbookSession.
+    - target_info: tuple
+        A tuple containing the target file path, target sheet name, and target starting cell (e.g., ("target.xlsx", "Sheet2", "A1")).
+        The file may also be a WorkbookSession: the cells are written to its workbook, the target sheet is
+        marked dirty and nothing is saved until the session ends.
+    - copy_styles: bool, optional
+        If True, also copies cell formatting, column widths, row heights and merged ranges
+        (see ex_copy_range_between_sheets). Defaults to False.
+    - translate_formulas: bool, optional
+        If True, relative references in copied formulas are adjusted to the new location
+        (see ex_copy_range_between_sheets). Defaults to False.
+
+    Returns:
+    - None
+        The function does not return any value. It saves the target file after copying the data,
+        unless the target is a WorkbookSession.
+
+    Notes:
+    - When the target file does not exist yet and copy_styles is False, the source is streamed in read-only mode and whole rows are
+      written through a write_only workbook, so the copy is bounded by I/O rather than per-cell overhead.
+      The new file contains only the target sheet.
+    - When the target file exists, it is loaded in edit mode (openpyxl cannot add a sheet to an existing file
+      in write_only mode) and only the cells that exist in the source are written.
+
+    Logs:
+    - Logs an error message if the source file or sheet cannot be found (not included in the current code).
+    - Logs an info message when the data is successfully copied and the target file is saved (not included in the current code).
+    """
+
+    source_file, source_sheet_name, source_range = source_info
+    target_file, target_sheet_name, target_start_cell = target_info
+    start_row, start_col = openpyxl.utils.cell.coordinate_to_tuple(target_start_cell)
+
+    if not isinstance(target_file, WorkbookSession) and not os.path.exists(target_file) and not copy_styles:
+        stream_source, engine = ex_session_source(source_file, "stream")
+        if engine == "stream":
+            _copy_rows_to_new_file(stream_source, source_sheet_name, source_range,
+                                   target_file, target_sheet_name, start_row, start_col,
+                                   translate_formulas=translate_formulas)
+            ex_invalidate_workbook(target_file)
+            ex_invalidate_occupancy_index(target_file)
+            ex_invalidate_sheet_frame(target_file)
+            return
+
+    # The source is only read, so it can come from the shared workbook cache (or its session)
+    source_wb = ex_load_workbook(source_file)
+    source_sheet = source_wb[source_sheet_name]
+
+    # The target is modified, so it always gets its own copy: the caller's session, or one for this call
+    session = target_file if isinstance(target_file, WorkbookSession) else WorkbookSession(target_file)
+    target_sheet = session.edit_sheet(target_sheet_name, create=True)
+
+    ex_copy_range_between_sheets(source_sheet, source_range, target_sheet, target_start_cell,
+                                 copy_styles=copy_styles, translate_formulas=translate_formulas)
+
+    if session is not target_file:
+        session.save()
+        session.close()
+
+if __name__ == "__main__":
+    ex_configure_logging()
+
+    # Ví dụ sử dụng
+    source_info = ('source_file.xlsx', 'Sheet1', 'A5:D10')  # Sao chép từ A5 đến D10
+    target_info = ('target_file.xlsx', 'CopiedSheet', 'E3')  # Dán bắt đầu từ E3
+    ex_copy_range(source_info, target_info)
+
+    # Ví dụ sao chép toàn bộ
+    source_info_all = ('source_file.xlsx', 'Sheet1', 'all')  # Sao chép toàn bộ
+    target_info_all = ('target_file.xlsx', 'CopiedSheet', 'A1')  # Dán bắt đầu từ A1
+    ex_copy_range(source_info_all, target_info_all)
@@ -0,0 +1,96 @@
+import os
+
+from .ex_copy_range import ex_copy_range_between_sheets
+from .ex_workbook_cache import ex_load_workbook
+from .ex_workbook_session import WorkbookSession
+from .ex_logging import ex_configure_logging, ex_get_logger
+from .ex_telemetry import instrument
+
+logger = ex_get_logger(__name__)
+
+@instrument
+def ex_copy_ranges(operations, copy_styles=False, translate_formulas=False):
+    """
+    Copies many ranges at once, loading every workbook one time and saving every target one time.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Parameters:
+    - operations: list of tuples
+        A list of (source_info, target_info) pairs in the same format as ex_copy_range, e.g.
+        [(("source.xlsx", "Sheet1", "A1:B10"), ("target.xlsx", "Sheet2", "A1")), ...].
+        Operations are applied in the given order. Any file may also be a WorkbookSession.
+    - copy_styles: bool, optional
+        If True, also copies formatting, column widths, row heights and merged ranges. The style mapping of
+        each source/target workbook pair is shared by all its operations. Defaults to False.
+    - translate_formulas: bool, optional
+        If True, relative references in copied formulas are adjusted to their new location. Defaults to False.
+
+    Returns:
+    - int
+        The number of target files saved. Targets given as a WorkbookSession are written to their session and
+        saved when it ends, so they are not counted.
+
+    Notes:
+    - Operations are grouped by file: each source is loaded once for the whole batch (through the workbook
+      cache) and each target is loaded once in edit mode, or created if it does not exist.
+    - A source that is also a target of the batch is read from the open target workbook, so later
+      operations see the result of earlier ones, as with successive ex_copy_range calls.
+    """
+    sessions = {}  # absolute path -> WorkbookSession of each target
+    own_sessions = []  # sessions opened here for targets given as paths, saved at the end
+    style_maps = {}  # (source path, target path) -> source style -> target style
+    source_workbooks = {}  # absolute path -> workbook of each source that is not a target, loaded once
+
+    def session_of(file):
+        if isinstance(file, WorkbookSession):
+            return sessions.setdefault(file.file_path, file)
+        abs_path = os.path.abspath(file)
+        if abs_path not in sessions:
+            sessions[abs_path] = WorkbookSession(abs_path)
+            own_sessions.append(sessions[abs_path])
+        return sessions[abs_path]
+
+    # Register every target first, so a file that is both source and target is read from memory
+    for _, (target_file, _, _) in operations:
+        session_of(target_file)
+    logger.debug(f"Batch of {len(operations)} copies over {len(sessions)} target files.")
+
+    try:
+        for (source_file, source_sheet_name, source_range), (target_file, target_sheet_name, target_start_cell) in operations:
+            source_path = source_file.file_path if isinstance(source_file, WorkbookSession) else os.path.abspath(source_file)
+            if source_path in sessions:
+                source_wb = sessions[source_path].workbook
+            else:
+                # Held here for the whole batch: a source larger than the workbook cache would be parsed again
+                # for every operation otherwise
+                source_wb = source_workbooks.get(source_path)
+                if source_wb is None:
+                    source_wb = source_workbooks[source_path] = ex_load_workbook(source_file)
+            target = session_of(target_file)
+            target_sheet = target.edit_sheet(target_sheet_name, create=True)
+
+            style_map = style_maps.setdefault((source_path, target.file_path), {})
+            copied = ex_copy_range_between_sheets(source_wb[source_sheet_name], source_range, target_sheet,
+                                                  target_start_cell, copy_styles=copy_styles, style_map=style_map,
+                                                  translate_formulas=translate_formulas)
+            logger.debug(f"Copied {copied} cells from '{source_path}'!{source_range} to '{target.file_path}'!{target_start_cell}.")
+    finally:
+        for source_wb in source_workbooks.values():
+            source_wb.close()
+        source_workbooks.clear()
+
+    saved = 0
+    for session in own_sessions:
+        saved += session.save()
+        session.close()
+    return saved
+
+if __name__ == "__main__":
+    ex_configure_logging()
+    operations = [
+        (('source_file.xlsx', 'Sheet1', 'A5:D10'), ('target_file.xlsx', 'CopiedSheet', 'E3')),
+        (('source_file.xlsx', 'Sheet1', 'F5:F10'), ('target_file.xlsx', 'CopiedSheet', 'J3')),
+    ]
+    ex_copy_ranges(operations)
@@ -1,12 +1,9 @@
-import openpyxl
-import xlwings as xw
-import logging
+from .ex_logging import ex_configure_logging, ex_get_logger
+from .ex_telemetry import ex_count, instrument
 
-logging.basicConfig(
-        level=logging.DEBUG,
-        format='%(asctime)s | %(module)s | %(lineno)d | %(funcName)s | %(levelname)s | %(message)s',
-    )
+logger = ex_get_logger(__name__)
 
+@instrument
 def ex_copy_sheet(source_file_path, destination_file_path, sheet_identifier=None, paste_position=None):
     """
     Copies a specified sheet from a source Excel workbook to a destination Excel workbook.
@@ -35,16 +32,21 @@ def ex_copy_sheet(source_file_path, destination_file_path, sheet_identifier=None
     - Logs an error message if the paste position is invalid.
     - Logs an info message when the sheet is successfully copied and the destination workbook is saved.
     """
+    import xlwings as xw
     try:
+        ex_count(com_calls=2)  # start Excel, display_alerts
         app = xw.App(visible=False)
         app.display_alerts = False
         
         # Open the source workbook
+        ex_count(com_calls=1)
         source_wb = app.books.open(source_file_path)
         # Open or create the destination workbook
         try:
+            ex_count(com_calls=1)
             destination_wb = app.books.open(destination_file_path)
         except FileNotFoundError:
+            ex_count(com_calls=1)
             destination_wb = app.books.add()
         
         # Determine the sheet to copy
@@ -56,15 +58,16 @@ def ex_copy_sheet(source_file_path, destination_file_path, sheet_identifier=None
             if 1 <= sheet_identifier <= len(source_wb.sheets):
                 source_sheet = source_wb.sheets[sheet_identifier - 1]  # Convert to 0-based index
             else:
-                logging.error("Invalid sheet index. Must be between 1 and the number of sheets.")
+                logger.error("Invalid sheet index. Must be between 1 and the number of sheets.")
                 return
         else:
             # Use the sheet name
             if sheet_identifier not in [sheet.name for sheet in source_wb.sheets]:
-                logging.error(f"Sheet '{sheet_identifier}' does not exist in the source workbook.")
+                logger.error(f"Sheet '{sheet_identifier}' does not exist in the source workbook.")
                 return
             source_sheet = source_wb.sheets[sheet_identifier]
         
+        ex_count(com_calls=3)  # look up the sheet, the anchor sheet, copy
         # Copy the sheet to the destination workbook
         if paste_position is None:
             # Paste at the end if no position is specified
@@ -72,25 +75,28 @@ def ex_copy_sheet(source_file_path, destination_file_path, sheet_identifier=None
         else:
             # Check if the specified paste position is valid
             if paste_position < 1 or paste_position > len(destination_wb.sheets) + 1:
-                logging.error("Invalid paste position. Must be between 1 and the number of sheets + 1.")
+                logger.error("Invalid paste position. Must be between 1 and the number of sheets + 1.")
                 return
             
             # Paste at the specified position
             source_sheet.copy(after=destination_wb.sheets[paste_position - 1])
         
-        logging.info(f"Sheet copied from '{source_file_path}' to '{destination_file_path}'.")
+        logger.info(f"Sheet copied from '{source_file_path}' to '{destination_file_path}'.")
 
         # Save the destination workbook
+        ex_count(com_calls=1)
         destination_wb.save(destination_file_path)
 
     except Exception as e:
-        logging.error(f"An error occurred: {e}")
+        logger.error(f"An error occurred: {e}")
 
     finally:
         # Clean up
+        ex_count(com_calls=3)  # close both workbooks, quit
         source_wb.close()
         destination_wb.close()
         app.quit()
 
 if __name__ == "__main__":
+    ex_configure_logging()
     pass
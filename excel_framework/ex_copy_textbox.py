@@ -1,12 +1,10 @@
-import xlwings as xw
-import logging
 import time
+from .ex_logging import ex_configure_logging, ex_get_logger
+from .ex_telemetry import ex_count, instrument
 
-logging.basicConfig(
-        level=logging.DEBUG,
-        format='%(module)s | %(lineno)d | %(funcName)s | %(levelname)s | %(message)s',
-    )
+logger = ex_get_logger(__name__)
 
+@instrument
 def ex_copy_textbox(source_sheet, target_sheet, shape_name, coordinates):
     """
     Copies a textbox shape from a source Excel sheet to a target Excel sheet at specified coordinates.
@@ -39,22 +37,26 @@ def ex_copy_textbox(source_sheet, target_sheet, shape_name, coordinates):
         """
         Convert a cell reference (like 'A1') to its top and left coordinates.
         """
+        ex_count(com_calls=3)
         cell = sheet.Range(cell_reference)
         top = cell.Top
         left = cell.Left
         return top, left
 
-    logging.debug(f"Starting to copy shape '{shape_name}' from '{source_sheet.name}' to '{target_sheet.name}' at coordinates '{coordinates}'.")
+    logger.debug(f"Starting to copy shape '{shape_name}' from '{source_sheet.name}' to '{target_sheet.name}' at coordinates '{coordinates}'.")
     try:
         shapes_list = [s.Name for s in source_sheet.api.Shapes]
+        ex_count(com_calls=1 + len(shapes_list))
         if shape_name in shapes_list:
-            logging.debug(f'Found shape "{shape_name}" in "{source_sheet.name}".')
+            logger.debug(f'Found shape "{shape_name}" in "{source_sheet.name}".')
             time.sleep(0.1)
+            ex_count(com_calls=2)  # Copy, Paste
             source_sheet.shapes[shape_name].api.Copy()
             time.sleep(0.1)
             target_sheet.api.Paste()
-            logging.debug(f'Successfully pasted shape "{shape_name}" to {target_sheet.name}.')
+            logger.debug(f'Successfully pasted shape "{shape_name}" to {target_sheet.name}.')
 
+            ex_count(com_calls=3)  # Count, get the shape, AutoSize
             pasted_shape = target_sheet.api.Shapes(target_sheet.api.Shapes.Count)
             pasted_shape.TextFrame.AutoSize = True
             
@@ -63,16 +65,18 @@ def ex_copy_textbox(source_sheet, target_sheet, shape_name, coordinates):
                 coordinates = cell_to_coordinates(target_sheet, coordinates)
 
             # Set position using the provided coordinates
+            ex_count(com_calls=2)
             pasted_shape.Top = coordinates[0]  # Set Top to the first coordinate
             pasted_shape.Left = coordinates[1]  # Set Left to the second coordinate
             
-            logging.info(f'Set position of pasted "{shape_name}" to coordinates "{coordinates}" with (Top: {pasted_shape.Top}, Left: {pasted_shape.Left}).')
+            logger.info(f'Set position of pasted "{shape_name}" to coordinates "{coordinates}" with (Top: {pasted_shape.Top}, Left: {pasted_shape.Left}).')
         else:
-            logging.warning(f"Shape '{shape_name}' not found in the source sheet. Available shapes: {shapes_list}.")
+            logger.warning(f"Shape '{shape_name}' not found in the source sheet. Available shapes: {shapes_list}.")
     except Exception as e:
-        logging.error(f"An error occurred while copying shape '{shape_name}': {e}")
+        logger.error(f"An error occurred while copying shape '{shape_name}': {e}")
 
 if __name__ == '__main__':
+    ex_configure_logging()
     import os
     import sys
 
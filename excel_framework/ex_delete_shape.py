@@ -1,11 +1,9 @@
-import xlwings as xw
-import logging
+from .ex_logging import ex_get_logger
+from .ex_telemetry import ex_count, instrument
 
-logging.basicConfig(
-        level=logging.DEBUG,
-        format='%(module)s | %(lineno)d | %(funcName)s | %(levelname)s | %(message)s',
-    )
+logger = ex_get_logger(__name__)
 
+@instrument
 def ex_delete_shape(sheet, shape_name):
     """
     Deletes a specified shape from an Excel worksheet.
@@ -29,17 +27,18 @@ def ex_delete_shape(sheet, shape_name):
     - Logs an info message if the specified shape is not found in the sheet.
     - Logs an error message if an exception occurs during the deletion process.
     """
-    logging.debug(f"Starting to delete shape '{shape_name}' from sheet '{sheet.name}'.")
+    logger.debug(f"Starting to delete shape '{shape_name}' from sheet '{sheet.name}'.")
     shape_found = False
 
     try:
         for shape in sheet.api.Shapes:
+            ex_count(com_calls=1)
             if shape.Name == shape_name:
                 shape.Delete()
-                logging.info(f'Deleted shape "{shape_name}" from sheet "{sheet.name}".')
+                logger.info(f'Deleted shape "{shape_name}" from sheet "{sheet.name}".')
                 shape_found = True
 
         if not shape_found:
-            logging.info(f'Shape "{shape_name}" not found in sheet "{sheet.name}".')
+            logger.info(f'Shape "{shape_name}" not found in sheet "{sheet.name}".')
     except Exception as e:
-        logging.error(f"An error occurred while deleting shape '{shape_name}': {e}")
+        logger.error(f"An error occurred while deleting shape '{shape_name}': {e}")
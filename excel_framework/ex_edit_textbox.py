@@ -1,12 +1,10 @@
-import xlwings as xw
-import logging
 import time
+from .ex_logging import ex_get_logger
+from .ex_telemetry import ex_count, instrument
 
-logging.basicConfig(
-        level=logging.DEBUG,
-        format='%(module)s | %(lineno)d | %(funcName)s | %(levelname)s | %(message)s',
-    )
+logger = ex_get_logger(__name__)
 
+@instrument
 def ex_edit_textbox(sheet, shape_name, new_text):
     """
     Edits the text of a specified textbox shape in an Excel worksheet.
@@ -31,9 +29,12 @@ def ex_edit_textbox(sheet, shape_name, new_text):
     - Logs an info message when the shape is successfully updated with the new text.
     - Logs an error message if the specified shape does not exist in the sheet or if an error occurs during the editing process.
     """
-    logging.debug(f"Starting to edit textbox '{shape_name}' in sheet '{sheet.name}'.")
+    logger.debug(f"Starting to edit textbox '{shape_name}' in sheet '{sheet.name}'.")
     try:
-        if shape_name in [s.Name for s in sheet.api.Shapes]:
+        shape_names = [s.Name for s in sheet.api.Shapes]
+        ex_count(com_calls=1 + len(shape_names))
+        if shape_name in shape_names:
+            ex_count(com_calls=7)  # get the shape, read Top / Left, set the text, AutoSize, Top, Left
             shape = sheet.api.Shapes(shape_name)
             
             original_top = shape.Top
@@ -46,8 +47,8 @@ def ex_edit_textbox(sheet, shape_name, new_text):
             shape.Top = original_top
             shape.Left = original_left
             
-            logging.info(f"Successfully updated shape '{shape_name}' in the sheet '{sheet.name}' with new text: '{new_text}'.")
+            logger.info(f"Successfully updated shape '{shape_name}' in the sheet '{sheet.name}' with new text: '{new_text}'.")
         else:
-            logging.error(f"Shape '{shape_name}' does not exist in the sheet '{sheet.name}'.")
+            logger.error(f"Shape '{shape_name}' does not exist in the sheet '{sheet.name}'.")
     except Exception as e:
-        logging.error(f"An error occurred while editing shape '{shape_name}' in the sheet '{sheet.name}': {e}")
+        logger.error(f"An error occurred while editing shape '{shape_name}' in the sheet '{sheet.name}': {e}")
@@ -0,0 +1,351 @@
+import csv
+import os
+from datetime import date, datetime, time, timedelta
+
+from .ex_iter_cell_values import ex_iter_cell_values
+from .ex_workbook_session import ex_session_source
+from .ex_xlsx_reader import ex_iter_sheet_records, ex_read_sheet_dimension, ex_sheet_extent
+from .ex_logging import ex_configure_logging, ex_get_logger
+from .ex_telemetry import instrument
+
+logger = ex_get_logger(__name__)
+
+# Output format by file extension
+_FORMATS = {".parquet": "parquet", ".pq": "parquet", ".csv": "csv", ".arrow": "arrow", ".feather": "arrow", ".ipc": "arrow"}
+
+def _pyarrow():
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError("Arrow and Parquet export needs pyarrow (pip install pyarrow); "
+                          "CSV export works without it.") from e
+    return pyarrow
+
+def _arrow_type(pa, column_type):
+    return {"bool": pa.bool_(), "int64": pa.int64(), "float64": pa.float64(), "string": pa.string(),
+            "timestamp": pa.timestamp("us"), "date": pa.date32(), "time": pa.time64("us"),
+            "duration": pa.duration("us")}[column_type]
+
+def _infer_type(values):
+    """
+    Column type of a list of cell values: the narrowest of bool, float64, timestamp, date, time, duration that
+    holds all of them, otherwise string. A column without any value is a string column.
+    Numbers are always float64: Excel stores every number as a double, so whole numbers in the sample say
+    nothing about the rows after it. int64 is only used when asked for in types.
+    """
+    kinds = {type(value) for value in values if value is not None}
+    if not kinds:
+        return "string"
+    if kinds == {bool}:
+        return "bool"
+    if kinds <= {int, float}:
+        return "float64"
+    if kinds <= {datetime, date}:
+        return "timestamp" if datetime in kinds else "date"
+    if kinds == {time}:
+        return "time"
+    if kinds == {timedelta}:
+        return "duration"
+    return "string"
+
+def _convert(value, column_type):
+    """
+    Converts a cell value to the column type; raises TypeError if it does not fit.
+    """
+    if value is None or column_type == "string":
+        return value if value is None or isinstance(value, str) else str(value)
+    kind = type(value)
+    if column_type == "float64" and kind in (int, float):
+        return float(value)
+    if column_type == "int64" and (kind is int or (kind is float and value.is_integer())):
+        return int(value)
+    if column_type == "bool" and kind is bool:
+        return value
+    if column_type == "timestamp" and kind in (datetime, date):
+        return value if kind is datetime else datetime.combine(value, time())
+    if (column_type, kind) in (("date", date), ("time", time), ("duration", timedelta)):
+        return value
+    raise TypeError(value)
+
+def _column_letter(column):
+    letters = ""
+    while column:
+        column, remainder = divmod(column - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+def _iter_rows(file_path, sheet_name, find_range, errors):
+    """
+    Streams the populated rows of a sheet as (row number, {column: value}), cached values for formula cells.
+    """
+    source, engine = ex_session_source(file_path, "xml")
+    if engine == "openpyxl":
+        # Unsaved session changes: formula cells have no cached value and are exported as their text
+        cells = ex_iter_cell_values(source, sheet_name=sheet_name, find_range=find_range)
+    else:
+        cells = ((record.row, record.column, None if record.data_type == "e" and errors == "null" else record.value)
+                 for record in ex_iter_sheet_records(source, sheet_name=sheet_name, find_range=find_range))
+
+    current_row, values = None, {}
+    for row, column, value in cells:
+        if row != current_row:
+            if values:
+                yield current_row, values
+            current_row, values = row, {}
+        if value is not None:
+            values[column] = value
+    if values:
+        yield current_row, values
+
+def _column_span(file_path, sheet_name, find_range):
+    """
+    (first column, last column) to export: the columns of find_range, else the used range of the sheet.
+    """
+    min_col = max_col = None
+    if find_range:
+        from openpyxl.utils import range_boundaries
+        min_col, _, max_col, _ = range_boundaries(find_range)
+    if min_col is not None and max_col is not None:
+        return min_col, max_col
+
+    source, engine = ex_session_source(file_path, "xml")
+    if engine == "openpyxl":
+        sheet = source.sheet(sheet_name)
+        used = (sheet.min_column, sheet.max_column)
+    else:
+        bounds = ex_read_sheet_dimension(source, sheet_name)
+        if bounds is not None and (bounds[2], bounds[3]) != (1, 1):
+            used = (bounds[0], bounds[2])
+        else:
+            used = (1, ex_sheet_extent(source, sheet_name)[1])
+    return min_col or used[0], max_col or used[1]
+
+class _SheetExport:
+    """
+    Turns the row stream of a sheet into batches of typed columns: the header and the column types are decided
+    from the first batch, later batches are converted to them. A value that does not fit its column type
+    is exported as null with errors='null' and raises with errors='text'.
+    """
+    def __init__(self, file_path, sheet_name, find_range, header, types, batch_rows, errors):
+        if header not in ("auto", True, False):
+            raise ValueError(f"header must be 'auto', True or False, not {header!r}.")
+        if errors not in ("null", "text"):
+            raise ValueError(f"errors must be 'null' or 'text', not {errors!r}.")
+        self.first_col, last_col = _column_span(file_path, sheet_name, find_range)
+        self.width = max(last_col - self.first_col + 1, 0)
+        self.batch_rows = batch_rows
+        self.rows = _iter_rows(file_path, sheet_name, find_range, errors)
+        self.names, self.types = [], []
+        self.header_row = None
+        self.exported_rows = 0
+        self.errors = errors
+        self.nulled_values = {}  # column name -> number of values exported as null because they did not fit
+        self._pending = self._read_batch()
+        self._decide_columns(header, types or {})
+
+    def _read_batch(self):
+        batch = []
+        for row, values in self.rows:
+            batch.append((row, [values.get(column) for column in range(self.first_col, self.first_col + self.width)]))
+            if len(batch) >= self.batch_rows:
+                break
+        return batch
+
+    def _decide_columns(self, header, types):
+        first = self._pending[0][1] if self._pending else []
+        labels = [value for value in first if value is not None]
+        if header == "auto":
+            # A header row holds texts only, above non-text values or distinct from each other; a single row is data
+            header = (len(self._pending) > 1 and bool(labels) and all(isinstance(value, str) for value in labels)
+                      and (len(set(labels)) == len(labels)
+                           or any(value is not None and not isinstance(value, str)
+                                  for _, values in self._pending[1:] for value in values)))
+        if header and self._pending:
+            self.header_row = self._pending.pop(0)[0]
+            if not self._pending:
+                self._pending = self._read_batch()
+        else:
+            first = []
+
+        seen = set()
+        for offset in range(self.width):
+            label = first[offset] if offset < len(first) else None
+            name = str(label).strip() if label is not None and str(label).strip() else _column_letter(self.first_col + offset)
+            unique, suffix = name, 2
+            while unique in seen:
+                unique, suffix = f"{name}_{suffix}", suffix + 1
+            seen.add(unique)
+            self.names.append(unique)
+        unknown = set(types) - set(self.names)
+        if unknown:
+            raise KeyError(f"types names unknown columns {sorted(unknown)}; the columns are {self.names}.")
+        self.types = [types.get(name) or _infer_type([values[offset] for _, values in self._pending])
+                      for offset, name in enumerate(self.names)]
+        logger.debug(f"Exporting columns {list(zip(self.names, self.types))} (header row: {self.header_row}).")
+
+    def __iter__(self):
+        """
+        Yields lists of converted column values, one list per column, batch_rows rows at most.
+        """
+        batch = self._pending
+        self._pending = None
+        while batch:
+            columns = [[] for _ in range(self.width)]
+            for row, values in batch:
+                for offset, value in enumerate(values):
+                    try:
+                        columns[offset].append(_convert(value, self.types[offset]))
+                    except TypeError:
+                        name = self.names[offset]
+                        if self.errors == "text":
+                            raise ValueError(f"Column '{name}' is typed {self.types[offset]}, but row {row} holds "
+                                             f"{value!r}. Pass its type in types (e.g. {{'{name}': 'string'}}), "
+                                             f"or errors='null' to export such values as null.") from None
+                        if name not in self.nulled_values:
+                            logger.warning(f"Column '{name}' is typed {self.types[offset]}, but row {row} holds {value!r}; "
+                                           f"exported as null, like any further value that does not fit.")
+                        self.nulled_values[name] = self.nulled_values.get(name, 0) + 1
+                        columns[offset].append(None)
+            self.exported_rows += len(batch)
+            yield columns
+            batch = self._read_batch()
+        if self.nulled_values:
+            logger.warning(f"Values exported as null because they did not fit their column type: {self.nulled_values}.")
+
+def _record_batches(pa, export):
+    """
+    (schema, generator of RecordBatches) for a _SheetExport.
+    """
+    schema = pa.schema([(name, _arrow_type(pa, column_type)) for name, column_type in zip(export.names, export.types)])
+    batches = (pa.RecordBatch.from_arrays([pa.array(values, type=field.type) for values, field in zip(columns, schema)],
+                                          schema=schema)
+               for columns in export)
+    return schema, batches
+
+def ex_iter_sheet_batches(file_path, sheet_name=None, find_range=None, header="auto", types=None,
+                          batch_rows=65536, errors="null"):
+    """
+    Streams a sheet as pyarrow RecordBatches with one typed column per sheet column.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Parameters:
+    - file_path: str or WorkbookSession
+        The path to the .xlsx / .xlsm file. A WorkbookSession with unsaved changes is read from its workbook.
+    - sheet_name: str, optional
+        The name of the sheet. If not provided, the active sheet is used.
+    - find_range: str, optional
+        The range to export (e.g. "A1:H5000", "B:D"). If not provided, the used range of the sheet is exported.
+    - header: 'auto', True or False, optional
+        Whether the first populated row holds the column names. 'auto' (default) takes it as a header when it
+        holds texts only and they are distinct or the rows below hold other values. Columns without a name are
+        named by their letter ("A", "B", ...), repeated names get a suffix ("name_2").
+    - types: dict, optional
+        Column name -> 'string', 'int64', 'float64', 'bool', 'timestamp', 'date', 'time' or 'duration',
+        overriding the type inferred from the first batch. Numbers are inferred as float64, as Excel stores
+        them; ask for 'int64' here for whole-number columns.
+    - batch_rows: int, optional
+        Rows per batch; also the sample used for type inference. Defaults to 65536.
+    - errors: str, optional
+        'null' (default) exports error cells (#N/A, #DIV/0!, ...) as nulls, and values that do not fit the type
+        of their column as nulls with a warning. 'text' exports error cells as their literal and raises on
+        values that do not fit.
+
+    Yields:
+    - pyarrow.RecordBatch
+        Batches sharing one schema. Rows without any value are skipped.
+
+    Raises:
+    - ValueError
+        If errors is 'text' and a value does not fit the type of its column.
+    - ImportError
+        If pyarrow is not installed.
+
+    Notes:
+    - Formula cells export the value Excel calculated last time. Only one batch of rows is held in memory.
+    """
+    pa = _pyarrow()
+    export = _SheetExport(file_path, sheet_name, find_range, header, types, batch_rows, errors)
+    yield from _record_batches(pa, export)[1]
+
+@instrument
+def ex_export_sheet(file_path, output_path, sheet_name=None, find_range=None, header="auto", types=None,
+                    batch_rows=65536, errors="null", compression="snappy"):
+    """
+    Exports a sheet to Parquet, Arrow IPC or CSV in one streaming pass, so analytics never re-read the xlsx.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Parameters:
+    - file_path: str or WorkbookSession
+        The path to the .xlsx / .xlsm file.
+    - output_path: str
+        The file to write. The format follows the extension: .parquet / .pq, .arrow / .feather / .ipc, or .csv.
+    - sheet_name, find_range, header, types, batch_rows, errors:
+        As in ex_iter_sheet_batches.
+    - compression: str, optional
+        Parquet compression codec ('snappy' (default), 'zstd', 'gzip', None, ...). Ignored for other formats.
+
+    Returns:
+    - dict
+        {"output_path", "format", "rows", "header_row", "columns": [(name, type), ...]}.
+
+    Raises:
+    - ValueError
+        If the extension is not supported, or if errors is 'text' and a value does not fit its column type.
+    - ImportError
+        If pyarrow is missing for a Parquet / Arrow file.
+
+    Notes:
+    - CSV is written with pyarrow when it is installed and with the csv module otherwise.
+    - Memory is bounded by batch_rows; the output is written next to output_path and renamed when complete.
+    """
+    output_format = _FORMATS.get(os.path.splitext(output_path)[1].lower())
+    if output_format is None:
+        raise ValueError(f"Unsupported output file '{output_path}'. Use one of {sorted(_FORMATS)}.")
+    try:
+        pa = _pyarrow()
+    except ImportError:
+        if output_format != "csv":
+            raise
+        pa = None
+
+    export = _SheetExport(file_path, sheet_name, find_range, header, types, batch_rows, errors)
+    temp_path = output_path + ".part"
+    try:
+        if pa is None:
+            with open(temp_path, "w", encoding="utf-8", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(export.names)
+                for columns in export:
+                    writer.writerows(zip(*columns))
+        else:
+            schema, batches = _record_batches(pa, export)
+            if output_format == "parquet":
+                import pyarrow.parquet as pq
+                writer = pq.ParquetWriter(temp_path, schema, compression=compression)
+            elif output_format == "arrow":
+                writer = pa.ipc.new_file(temp_path, schema)
+            else:
+                import pyarrow.csv as pa_csv
+                writer = pa_csv.CSVWriter(temp_path, schema)
+            try:
+                for batch in batches:
+                    writer.write_batch(batch)
+            finally:
+                writer.close()
+        os.replace(temp_path, output_path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+    logger.info(f"Exported {export.exported_rows} rows x {len(export.names)} columns to '{output_path}'.")
+    return {"output_path": os.path.abspath(output_path), "format": output_format, "rows": export.exported_rows,
+            "header_row": export.header_row, "columns": list(zip(export.names, export.types))}
+
+if __name__ == "__main__":
+    ex_configure_logging()
+    file_path = r"C:\Users\KNT15083\Downloads\521\summary.xlsx"
+    print(ex_export_sheet(file_path, r"C:\Users\KNT15083\Downloads\521\summary.parquet", sheet_name="Summary"))
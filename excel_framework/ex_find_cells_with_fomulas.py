@@ -0,0 +1,236 @@
+from .ex_formula_tokens import ex_formula_errors, ex_formula_functions, ex_formula_references
+from .ex_iter_populated_cells import ex_iter_populated_cells
+from .ex_workbook_cache import ex_load_workbook
+from .ex_workbook_session import ex_session_source
+from .ex_xlsx_reader import ex_iter_sheet_records
+from .ex_logging import LogSampler, ex_configure_logging, ex_get_logger
+from .ex_telemetry import ex_count, instrument
+
+logger = ex_get_logger(__name__)
+
+def ex_iter_formulas(file_path, sheet_name=None, find_range=None, engine="openpyxl"):
+    """
+    Iterates over the formula cells of a sheet with their formula text.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Parameters:
+    - file_path: str or WorkbookSession
+        The path to the Excel file to read.
+        A WorkbookSession is read from its workbook while it has unsaved changes (see ex_session_source).
+    - sheet_name: str, optional
+        The name of the sheet. If not provided, the active sheet is used.
+    - find_range: str, optional
+        A string representing the range of cells to read (e.g., "A1:C10"). If not provided, the entire sheet is read.
+    - engine: str, optional
+        'openpyxl' (default) reads the cached workbook loaded in edit mode.
+        'xml' (.xlsx only) reads the formulas straight from the worksheet XML through ex_iter_sheet_records.
+
+    Yields:
+    - tuple
+        (row, column, formula) for every formula cell in row-major order, e.g. (3, 2, "=SUM(B1:B2)").
+        Array formulas are returned as their text.
+
+    Raises:
+    - KeyError, OSError
+        If the sheet or the file cannot be read.
+    """
+    file_path, engine = ex_session_source(file_path, engine)
+    if engine == "xml":
+        for record in ex_iter_sheet_records(file_path, sheet_name=sheet_name, find_range=find_range):
+            if record.formula is not None:
+                yield record.row, record.column, record.formula
+        return
+
+    wb_openpyxl = ex_load_workbook(file_path)
+    ws = wb_openpyxl.active if sheet_name is None else wb_openpyxl[sheet_name]
+    if find_range is None:
+        bounds = (1, 1, None, None)
+    else:
+        from openpyxl.utils import range_boundaries
+
+        # Clamped to the used area so the shared (cached) workbook does not grow
+        min_col, min_row, max_col, max_row = range_boundaries(find_range)
+        bounds = (min_row or 1, min_col or 1, min(max_row or ws.max_row, ws.max_row), min(max_col or ws.max_column, ws.max_column))
+
+    scanned = 0
+    for row, column, cell in ex_iter_populated_cells(ws, *bounds):
+        scanned += 1
+        if cell.data_type == 'f':  # Check if cell has a formula
+            yield row, column, getattr(cell.value, "text", cell.value)
+    ex_count(cells=scanned)
+
+def _formula_matcher(sheet_name, function_name, sheet_ref, range_ref, error_literal):
+    """
+    Builds a predicate over formula texts for the token-level filters; None when no filter is set.
+    """
+    if function_name is None and sheet_ref is None and range_ref is None and error_literal is None:
+        return None
+
+    function_name = function_name.upper() if function_name is not None else None
+    sheet_ref = sheet_ref.lower() if sheet_ref is not None else None
+    error_literal = error_literal.upper() if error_literal is not None else None
+    if range_ref is not None:
+        from openpyxl.utils import range_boundaries
+
+        range_sheet, _, address = range_ref.rpartition("!")
+        range_sheet = range_sheet.strip("'").replace("''", "'").lower() or None
+        min_col, min_row, max_col, max_row = range_boundaries(address.replace("$", ""))
+        min_row, min_col = min_row or 1, min_col or 1
+        max_row, max_col = max_row or 1048576, max_col or 16384
+        own_sheet = sheet_name.lower() if sheet_name is not None else None
+
+    def matches(formula):
+        if function_name is not None and function_name not in ex_formula_functions(formula):
+            return False
+        if error_literal is not None and error_literal not in ex_formula_errors(formula):
+            return False
+        if sheet_ref is None and range_ref is None:
+            return True
+        references = ex_formula_references(formula)
+        if sheet_ref is not None and not any(ref.sheet is not None and ref.sheet.lower() == sheet_ref
+                                             for ref in references):
+            return False
+        if range_ref is not None:
+            return any((ref.sheet.lower() if ref.sheet is not None else own_sheet) == range_sheet
+                       and ref.min_row <= max_row and ref.max_row >= min_row
+                       and ref.min_col <= max_col and ref.max_col >= min_col
+                       for ref in references)
+        return True
+
+    return matches
+
+@instrument
+def ex_find_cells_with_fomulas(file_path, sheet_name=None, filter_text=None, find_range=None, engine="openpyxl",
+                               function_name=None, sheet_ref=None, range_ref=None, error_literal=None):
+
+    """
+    Finds and retrieves coordinates of cells containing formulas from a specified sheet in an Excel workbook.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Parameters:
+    - file_path: str or WorkbookSession
+        The path to the Excel file from which to find cells with formulas.
+        A WorkbookSession is read from its workbook while it has unsaved changes (see ex_session_source).
+    - sheet_name: str, optional
+        The name of the sheet to search for formulas. If not provided, the active sheet is used.
+    - filter_text: str, optional
+        An optional string to filter the formulas. Only formulas containing this text will be returned.
+    - find_range: str, optional
+        A string representing the range of cells to search (e.g., "A1:C10"). If not provided, the entire sheet is searched.
+    - engine: str, optional
+        'openpyxl' (default) loads the workbook in edit mode.
+        'xml' (.xlsx only) reads the formulas straight from the worksheet XML through ex_iter_sheet_records.
+    - function_name: str, optional
+        Only formulas calling this function (e.g. "SUM" matches SUM( but not SUMIF( or the text "SUM" in a string).
+    - sheet_ref: str, optional
+        Only formulas referencing a cell or range of this sheet by name (e.g. "Data" for Data!A1).
+    - range_ref: str, optional
+        Only formulas referencing a cell or range that overlaps this range (e.g. "B2:B10" or "Data!B:B").
+        Without a sheet, the range is on the searched sheet (sheet_name).
+    - error_literal: str, optional
+        Only formulas containing this error literal (e.g. "#REF!" or "#N/A").
+
+    Returns:
+    - list of tuples
+        A list of tuples containing the coordinates (row, column) of cells that contain formulas.
+        Returns an empty list if no formulas are found or if an error occurs during the process.
+
+    Raises:
+    - Exception
+        Logs an error message if there is an issue accessing the specified workbook or sheet.
+
+    Notes:
+    - All given filters must match. The token-level filters (function_name, sheet_ref, range_ref, error_literal)
+      use openpyxl's formula tokenizer; each distinct formula text is tokenized once and the outcome of the
+      filters is remembered per text, so filled-down and shared formulas are checked only once.
+    """
+
+    logger.debug(f"Starting to find formulas in '{file_path}'.")
+
+    replaced_cells = []
+    try:
+        matcher = _formula_matcher(sheet_name, function_name, sheet_ref, range_ref, error_literal)
+        decisions = {}  # formula text -> result of the token-level filters
+        found = LogSampler(logger)
+        for row, column, formula in ex_iter_formulas(file_path, sheet_name=sheet_name, find_range=find_range, engine=engine):
+            if filter_text is not None and not (isinstance(formula, str) and filter_text in formula):
+                continue
+            if matcher is not None:
+                if not isinstance(formula, str):
+                    continue
+                matched = decisions.get(formula)
+                if matched is None:
+                    matched = decisions[formula] = matcher(formula)
+                if not matched:
+                    continue
+            # Append the coordinate as a tuple (row, column)
+            replaced_cells.append((row, column))
+            if found.enabled:
+                found.debug("Found formula at (%d, %d): '%s'", row, column, formula)
+        found.summary(f"Matched formulas in '{file_path}'")
+    except Exception as e:
+        logger.error(f"Error reading formulas from '{file_path}': {e}")
+        return []
+
+    logger.info(f"Total formulas found: {len(replaced_cells)}")
+    return replaced_cells
+
+@instrument
+def ex_read_formulas_with_values(file_path, sheet_name=None, find_range=None, filter_text=None):
+    """
+    Reads every formula of a sheet together with the value Excel calculated for it last time, in one pass.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Parameters:
+    - file_path: str or WorkbookSession
+        The path to the .xlsx / .xlsm file to read. A WorkbookSession with unsaved changes has no calculated
+        values yet: its formulas are read from its workbook with a cached_value of None.
+    - sheet_name: str, optional
+        The name of the sheet. If not provided, the active sheet is used.
+    - find_range: str, optional
+        A string representing the range of cells to read (e.g., "A1:C10"). If not provided, the entire sheet is read.
+    - filter_text: str, optional
+        Only formulas containing this text are returned.
+
+    Returns:
+    - list of tuples
+        (row, column, formula, cached_value) for every formula cell, e.g. (5, 2, "=SUM(B1:B4)", 120).
+        cached_value is what openpyxl returns with data_only=True, and None if the file was never
+        calculated (e.g. written by openpyxl). Returns an empty list if an error occurs.
+
+    Notes:
+    - The worksheet XML holds both the formula (<f>) and its cached result (<v>), so the file is streamed
+      once through ex_iter_sheet_records instead of being loaded twice with openpyxl.
+    - Shared formulas are expanded only for cells that are read: a group is tokenized the first time one
+      of its cells inside find_range is reached.
+    """
+    try:
+        source, engine = ex_session_source(file_path, "xml")
+        if engine == "openpyxl":
+            formulas = [(row, column, formula, None)
+                        for row, column, formula in ex_iter_formulas(source, sheet_name=sheet_name, find_range=find_range)
+                        if filter_text is None or (isinstance(formula, str) and filter_text in formula)]
+        else:
+            formulas = [(record.row, record.column, record.formula, record.value)
+                        for record in ex_iter_sheet_records(source, sheet_name=sheet_name, find_range=find_range)
+                        if record.formula is not None and (filter_text is None or filter_text in record.formula)]
+    except Exception as e:
+        logger.error(f"Error reading formulas from '{file_path}': {e}")
+        return []
+
+    logger.info(f"Total formulas read with their values: {len(formulas)}")
+    return formulas
+
+
+if __name__ == "__main__":
+    ex_configure_logging()
+    file_path = r"C:\Users\KNT15083\Downloads\521\summary.xlsx"
+    search_text = "BODY"
+    cell = ex_find_cells_with_fomulas(file_path, sheet_name=None, filter_text=None)
+    print(cell)
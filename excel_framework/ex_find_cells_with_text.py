@@ -0,0 +1,164 @@
+from .ex_iter_cell_values import ex_iter_cell_values
+from .ex_workbook_cache import ex_load_workbook
+from .ex_workbook_session import ex_session_source
+from .ex_xlsx_reader import ex_iter_sheet_records, ex_iter_text_matches_by_shared_strings
+from .ex_logging import LogSampler, ex_configure_logging, ex_get_logger
+from .ex_telemetry import ex_count, instrument
+
+logger = ex_get_logger(__name__)
+
+def ex_iter_cells_with_text(file_path, search_text, sheet_name=None, exact_match=False, find_range=None, engine="stream"):
+    """
+    Streams the coordinates of cells containing specified text, yielding each match as soon as it is read.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Parameters:
+    - file_path: str or WorkbookSession
+        The path to the Excel file in which to search for text.
+        A WorkbookSession is read from its workbook while it has unsaved changes (see ex_session_source).
+    - search_text: str
+        The text to search for within the cells.
+    - sheet_name: str, optional
+        The name of the sheet to search in. If not provided, the active sheet is used.
+    - exact_match: bool, optional
+        If True, searches for an exact match of the search_text. Defaults to False for partial matches.
+    - find_range: str, optional
+        A string representing the range of cells to search (e.g., "A1:C10"). If not provided, the entire sheet is searched.
+    - engine: str, optional
+        'stream' (default) reads the sheet through ex_iter_cell_values (openpyxl read-only, values only).
+        'xml' reads it through ex_iter_sheet_records, straight from the worksheet XML (.xlsx only).
+
+    Yields:
+    - tuple
+        The coordinates (row, column) of each cell that contains the search_text.
+
+    Notes:
+    - Memory stays flat with both engines and empty cells are never compared.
+      Formula cells are compared by their formula text, as in the default edit mode.
+    """
+    file_path, engine = ex_session_source(file_path, engine)
+    if engine == "xml":
+        cells = ((record.row, record.column, record.value if record.formula is None else record.formula)
+                 for record in ex_iter_sheet_records(file_path, sheet_name=sheet_name, find_range=find_range))
+    else:
+        cells = ex_iter_cell_values(file_path, sheet_name=sheet_name, find_range=find_range)
+
+    for row, column, cell_value in cells:
+        if exact_match:
+            if cell_value == search_text:
+                yield row, column
+        elif search_text in str(cell_value):
+            yield row, column
+
+@instrument
+def ex_find_cells_with_text(file_path, search_text, sheet_name=None, exact_match=False, find_range=None, engine="openpyxl"):
+    """
+    Searches for cells containing specified text in an Excel sheet and returns their coordinates.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Parameters:
+    - file_path: str or WorkbookSession
+        The path to the Excel file in which to search for text.
+        A WorkbookSession is read from its workbook while it has unsaved changes (see ex_session_source).
+    - search_text: str
+        The text to search for within the cells.
+    - sheet_name: str, optional
+        The name of the sheet to search in. If not provided, the active sheet is used.
+    - exact_match: bool, optional
+        If True, searches for an exact match of the search_text. Defaults to False for partial matches.
+    - find_range: str, optional
+        A string representing the range of cells to search (e.g., "A1:C10"). If not provided, the entire sheet is searched.
+    - engine: str, optional
+        'openpyxl' (default) loads the workbook in edit mode and checks every cell.
+        'stream' reads the sheet in read-only mode through ex_iter_cells_with_text; empty cells are skipped
+        and memory stays flat on very large sheets.
+        'xml' (.xlsx only) parses the worksheet XML directly through ex_iter_sheet_records, skipping
+        the openpyxl object model; several times faster than 'stream'.
+        'shared_strings' (.xlsx only) tests each unique shared string once and then only checks the cells
+        that can match, see ex_iter_text_matches_by_shared_strings. Fastest for sheets with repeated labels.
+        'frame' (.xlsx only, needs NumPy) searches the cached SheetFrame of the sheet (see ex_read_sheet_frame);
+        the first search pays for one streaming pass, later searches on the unchanged file are vectorized.
+
+    Returns:
+    - list of tuples
+        A list of tuples containing the coordinates (row, column) of cells that contain the search_text.
+        Returns an empty list if no matches are found or if an error occurs during the process.
+
+    Raises:
+    - Exception
+        Logs an error message if there is an issue accessing the specified sheet or cells.
+    """
+    logger.debug("Starting the search for text in cells.")
+    found_cells = []  # List to store coordinates of found cells
+
+    try:
+        file_path, engine = ex_session_source(file_path, engine)
+        if engine in ("stream", "xml"):
+            found_cells = list(ex_iter_cells_with_text(file_path, search_text, sheet_name=sheet_name,
+                                                       exact_match=exact_match, find_range=find_range, engine=engine))
+            logger.info(f"Found {len(found_cells)} cells containing '{search_text}'.")
+            return found_cells
+        if engine == "shared_strings":
+            found_cells = list(ex_iter_text_matches_by_shared_strings(file_path, search_text, sheet_name=sheet_name,
+                                                                      exact_match=exact_match, find_range=find_range))
+            logger.info(f"Found {len(found_cells)} cells containing '{search_text}'.")
+            return found_cells
+        if engine == "frame":
+            from .ex_sheet_frame import ex_read_sheet_frame
+            frame = ex_read_sheet_frame(file_path, sheet_name=sheet_name, find_range=find_range, formulas=True)
+            found_cells = frame.find_text(search_text, exact_match=exact_match)
+            logger.info(f"Found {len(found_cells)} cells containing '{search_text}'.")
+            return found_cells
+        if engine != "openpyxl":
+            raise ValueError(f"Unknown engine '{engine}'. Use 'openpyxl', 'stream', 'xml', 'shared_strings' or 'frame'.")
+
+        # Load the workbook and select the specified sheet
+        workbook = ex_load_workbook(file_path)
+        sheet = workbook[sheet_name] if sheet_name else workbook.active
+
+        # Determine the range to search
+        if find_range:
+            from openpyxl.utils import range_boundaries
+
+            # Clamp to the used area so the shared (cached) workbook does not grow
+            min_col, min_row, max_col, max_row = range_boundaries(find_range)
+            cell_range = sheet.iter_rows(min_row=min_row or 1, max_row=min(max_row or sheet.max_row, sheet.max_row),
+                                         min_col=min_col or 1, max_col=min(max_col or sheet.max_column, sheet.max_column))
+        else:
+            cell_range = sheet.iter_rows()  # Iterate through all rows in the sheet
+
+        # Per-cell output is sampled and only built when DEBUG is enabled
+        checked = LogSampler(logger)
+        scanned = 0
+        for row in cell_range:
+            scanned += len(row)
+            for cell in row:
+                cell_value = cell.value
+                if checked.enabled:
+                    checked.debug("Checking cell: '%s', Content: '%s'", cell.coordinate, cell_value)
+
+                if exact_match:
+                    if cell_value == search_text:
+                        found_cells.append((cell.row, cell.column))  # Append as (row, column)
+                else:
+                    if search_text in str(cell_value):
+                        found_cells.append((cell.row, cell.column))  # Append as (row, column)
+        checked.summary("Checked cells")
+        ex_count(cells=scanned)
+        logger.info(f"Found {len(found_cells)} cells containing '{search_text}'.")
+
+    except Exception as e:
+        logger.error(f"Error while accessing cells in sheet '{sheet_name}': {e}")
+
+    return found_cells  # Return the list of found cell coordinates
+
+if __name__ == "__main__":
+    ex_configure_logging()
+    file_path = r"C:\Users\KNT15083\Downloads\521\summary.xlsx"
+    search_text = "BODY"
+    cell = ex_find_cells_with_text(file_path, search_text, sheet_name=None, exact_match=False, find_range=None)
+    print(cell)
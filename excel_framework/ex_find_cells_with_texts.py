@@ -0,0 +1,132 @@
+import re
+from collections import deque
+
+from .ex_iter_cell_values import ex_iter_cell_values
+from .ex_logging import ex_configure_logging, ex_get_logger
+from .ex_telemetry import instrument
+
+logger = ex_get_logger(__name__)
+
+def _build_automaton(terms):
+    """
+    Builds an Aho-Corasick automaton for the given terms.
+    Returns (goto, fail, output) where output[state] is the set of terms ending at that state,
+    already merged along the failure links.
+    """
+    goto = [{}]
+    output = [set()]
+    for term in terms:
+        state = 0
+        for char in term:
+            next_state = goto[state].get(char)
+            if next_state is None:
+                next_state = len(goto)
+                goto[state][char] = next_state
+                goto.append({})
+                output.append(set())
+            state = next_state
+        output[state].add(term)
+
+    fail = [0] * len(goto)
+    queue = deque(goto[0].values())
+    while queue:
+        state = queue.popleft()
+        for char, next_state in goto[state].items():
+            queue.append(next_state)
+            link = fail[state]
+            while link and char not in goto[link]:
+                link = fail[link]
+            fail[next_state] = goto[link].get(char, 0)
+            output[next_state] |= output[fail[next_state]]
+
+    return goto, fail, [frozenset(terms_at_state) for terms_at_state in output]
+
+def _match_terms(text, goto, fail, output):
+    """
+    Returns the set of terms occurring in text, in a single pass over its characters.
+    """
+    found = set()
+    state = 0
+    for char in text:
+        while state and char not in goto[state]:
+            state = fail[state]
+        state = goto[state].get(char, 0)
+        if output[state]:
+            found |= output[state]
+    return found
+
+@instrument
+def ex_find_cells_with_texts(file_path, search_texts, sheet_name=None, exact_match=False, find_range=None):
+    """
+    Searches for many texts at once in an Excel sheet, reading every cell only one time.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Parameters:
+    - file_path: str or WorkbookSession
+        The path to the Excel file in which to search for text.
+        A WorkbookSession is read from its workbook while it has unsaved changes (see ex_session_source).
+    - search_texts: list of str or dict
+        The texts to search for. A list uses exact_match for every text; a dict maps each text
+        to its own exact_match flag (e.g. {"BODY": False, "TOTAL": True}).
+    - sheet_name: str, optional
+        The name of the sheet to search in. If not provided, the active sheet is used.
+    - exact_match: bool, optional
+        The match mode for texts given as a list. Defaults to False for partial matches.
+    - find_range: str, optional
+        A string representing the range of cells to search (e.g., "A1:C10"). If not provided, the entire sheet is searched.
+
+    Returns:
+    - dict
+        A dict mapping every search text to a list of (row, column) tuples of the matching cells.
+        Texts without any match map to an empty list. Returns what was found so far if an error occurs.
+
+    Notes:
+    - The sheet is streamed once through ex_iter_cell_values. Exact texts are looked up in a set,
+      partial texts are matched together with an Aho-Corasick automaton, so the cost depends on the
+      number of cells and not on the number of texts.
+    - Matching follows ex_find_cells_with_text: exact texts compare with the cell value itself,
+      partial texts look inside str(value). Empty cells are skipped.
+    """
+    if isinstance(search_texts, dict):
+        modes = dict(search_texts)
+    else:
+        modes = {text: exact_match for text in search_texts}
+
+    found_cells = {text: [] for text in modes}
+    exact_texts = {text for text, exact in modes.items() if exact}
+    partial_texts = [text for text, exact in modes.items() if not exact and text != ""]
+    match_everything = "" in modes and not modes[""]  # "" is contained in every value
+
+    logger.debug(f"Searching {len(exact_texts)} exact and {len(partial_texts)} partial texts in one pass.")
+
+    goto, fail, output = _build_automaton(partial_texts)
+    # Cheap C-level pre-check so the automaton only walks cells that contain at least one text
+    prefilter = None
+    if partial_texts:
+        prefilter = re.compile("|".join(re.escape(text) for text in sorted(partial_texts, key=len, reverse=True)))
+
+    try:
+        for row, column, cell_value in ex_iter_cell_values(file_path, sheet_name=sheet_name, find_range=find_range):
+            if exact_texts and isinstance(cell_value, str) and cell_value in exact_texts:
+                found_cells[cell_value].append((row, column))
+            if match_everything:
+                found_cells[""].append((row, column))
+            if prefilter is not None:
+                text = cell_value if isinstance(cell_value, str) else str(cell_value)
+                if prefilter.search(text):
+                    for term in _match_terms(text, goto, fail, output):
+                        found_cells[term].append((row, column))
+
+    except Exception as e:
+        logger.error(f"Error while accessing cells in sheet '{sheet_name}': {e}")
+
+    logger.info(f"Found {sum(1 for cells in found_cells.values() if cells)} of {len(found_cells)} texts.")
+    return found_cells
+
+if __name__ == "__main__":
+    ex_configure_logging()
+    file_path = r"C:\Users\KNT15083\Downloads\521\summary.xlsx"
+    result = ex_find_cells_with_texts(file_path, {"BODY": False, "TOTAL": True}, sheet_name=None)
+    print(result)
@@ -1,18 +1,9 @@
-import logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s | %(module)s | %(lineno)d | %(funcName)s | %(levelname)s | %(message)s',
-)
+from .ex_logging import ex_configure_logging, ex_get_logger
+from .ex_telemetry import ex_count, instrument
 
-import warnings
-warnings.filterwarnings("ignore")
-
-from PIL import Image
-Image.MAX_IMAGE_PIXELS = None
-
-import openpyxl
-from openpyxl import load_workbook
+logger = ex_get_logger(__name__)
 
+@instrument
 def ex_find_shapes_has_text(sheet, search_text, exact_match=False):
     """
     Searches for specified text within shapes in an Excel worksheet and returns the names of matching shapes.
@@ -38,34 +29,36 @@ def ex_find_shapes_has_text(sheet, search_text, exact_match=False):
     - Logs a warning if no shapes contain the specified text.
     """
 
-    logging.debug("Starting the search for text in shapes.")
+    logger.debug("Starting the search for text in shapes.")
     
     found_shapes = []  # List to store names of shapes containing the text
 
     for shape in sheet.api.Shapes:
-        logging.debug(f"Shape Name: '{shape.Name}', Type: {shape.Type}, Position: ({shape.Left}, {shape.Top})")
+        ex_count(com_calls=2)  # the shape itself and its text
+        logger.debug(f"Shape Name: '{shape.Name}', Type: {shape.Type}, Position: ({shape.Left}, {shape.Top})")
         try:
             text = shape.TextFrame.Characters().Text
-            logging.debug(f"Checking shape: '{shape.Name}', Content: '{text}'")
+            logger.debug(f"Checking shape: '{shape.Name}', Content: '{text}'")
 
             if exact_match:
                 if text == search_text:
                     found_shapes.append(shape.Name)
                     message = f"Found in shape (exact match): '{text}', Name: '{shape.Name}', Position: ({shape.Left}, {shape.Top})"
-                    logging.info(message)
+                    logger.info(message)
             else:
                 if search_text in text:
                     found_shapes.append(shape.Name)
                     message = f"Found in shape (partial match): '{text}', Name: '{shape.Name}', Position: ({shape.Left}, {shape.Top})"
-                    logging.info(message)
+                    logger.info(message)
         except Exception as e:
-            logging.debug(f"Error while accessing shape '{shape.Name}': {e}")
+            logger.debug(f"Error while accessing shape '{shape.Name}': {e}")
 
     if found_shapes:
         return found_shapes  # Return the list of found shape names
     else:
-        logging.warning(f"Text '{search_text}' not found in any shape in the sheet.")
+        logger.warning(f"Text '{search_text}' not found in any shape in the sheet.")
         return []  # Return an empty list if no shapes were found
 
 if __name__ == "__main__":
+    ex_configure_logging()
     file_path = r"C:\Users\KNT15083\Downloads\521\summary.xlsx"
@@ -0,0 +1,1350 @@
+import datetime
+import math
+import os
+import re
+import tempfile
+import zipfile
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+from decimal import Decimal, ROUND_DOWN, ROUND_HALF_UP, ROUND_UP
+from xml.sax.saxutils import escape
+
+import numpy as np
+from openpyxl.utils import get_column_letter, range_boundaries
+from openpyxl.utils.datetime import to_excel
+
+from .ex_formula_graph import FormulaGraph, RowIntervals
+from .ex_formula_tokens import MAX_COLUMN, MAX_ROW, ex_tokenize_formula
+from .ex_iter_populated_cells import ex_iter_populated_cells
+from .ex_occupancy_index import ex_invalidate_occupancy_index
+from .ex_sheet_frame_cache import ex_invalidate_sheet_frame
+from .ex_workbook_cache import ex_invalidate_workbook, ex_load_workbook
+from .ex_logging import ex_configure_logging, ex_get_logger
+from .ex_telemetry import instrument
+
+logger = ex_get_logger(__name__)
+
+class ExcelError(Exception):
+    """
+    An Excel error value (#DIV/0!, #N/A, #VALUE!, ...). Raised while evaluating and stored as a cell value.
+    """
+
+    def __init__(self, code):
+        super().__init__(code)
+        self.code = code
+
+    def __eq__(self, other):
+        return isinstance(other, ExcelError) and other.code == self.code
+
+    def __hash__(self):
+        return hash(self.code)
+
+    def __repr__(self):
+        return f"ExcelError({self.code!r})"
+
+class _Unsupported(Exception):
+    """The formula uses something the evaluator does not implement; its cell keeps no value."""
+
+_UNKNOWN = object()  # value of a cell whose formula could not be evaluated
+_MISSING = object()  # omitted function argument, e.g. the last one of VLOOKUP(A1, B:C, 2, )
+
+_Range = namedtuple("_Range", ["sheet", "min_row", "min_col", "max_row", "max_col"])
+
+def _error(code):
+    return ExcelError(code)
+
+# ---------------------------------------------------------------------------------------------------------------
+# Scalar coercion, following Excel's rules
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+def _number(value):
+    if isinstance(value, ExcelError):
+        raise value
+    if value is None or value is _MISSING:
+        return 0
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            raise _error("#VALUE!")
+    raise _error("#VALUE!")
+
+def _raise(code):
+    raise _error(code)
+
+def _text(value):
+    if isinstance(value, ExcelError):
+        raise value
+    if value is None or value is _MISSING:
+        return ""
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, float):
+        if value.is_integer() and abs(value) < 1e15:
+            return str(int(value))
+        return f"{value:.15g}".upper()
+    return str(value)
+
+def _boolean(value):
+    if isinstance(value, ExcelError):
+        raise value
+    if value is None or value is _MISSING:
+        return False
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return value != 0
+    if isinstance(value, str):
+        if value.upper() in ("TRUE", "FALSE"):
+            return value.upper() == "TRUE"
+    raise _error("#VALUE!")
+
+def _rank(value):
+    # Excel orders numbers < text < logicals
+    if isinstance(value, bool):
+        return 2
+    if isinstance(value, str):
+        return 1
+    return 0
+
+def _compare(left, right):
+    """-1, 0 or 1, comparing text case-insensitively; a blank takes the type of the other side."""
+    if isinstance(left, ExcelError):
+        raise left
+    if isinstance(right, ExcelError):
+        raise right
+    if left is None:
+        left = "" if isinstance(right, str) else (False if isinstance(right, bool) else 0)
+    if right is None:
+        right = "" if isinstance(left, str) else (False if isinstance(left, bool) else 0)
+    left_rank, right_rank = _rank(left), _rank(right)
+    if left_rank != right_rank:
+        return -1 if left_rank < right_rank else 1
+    if left_rank == 1:
+        left, right = left.lower(), right.lower()
+    return (left > right) - (left < right)
+
+def _round(value, digits, rounding):
+    quantum = Decimal(1).scaleb(-int(digits))
+    return float(Decimal(repr(float(value))).quantize(quantum, rounding=rounding))
+
+def _wildcard_pattern(text):
+    """Regex for Excel wildcards: * any text, ? one character, ~ escapes the next one."""
+    parts = []
+    i = 0
+    while i < len(text):
+        char = text[i]
+        if char == "~" and i + 1 < len(text):
+            parts.append(re.escape(text[i + 1]))
+            i += 2
+            continue
+        parts.append(".*" if char == "*" else "." if char == "?" else re.escape(char))
+        i += 1
+    return re.compile("".join(parts), re.IGNORECASE | re.DOTALL)
+
+# ---------------------------------------------------------------------------------------------------------------
+# Vectorized helpers over 2D blocks of cell values
+
+_to_float = np.frompyfunc(lambda value: float(value) if _is_number(value) else np.nan, 1, 1)
+
+def _block_numbers(values):
+    return _to_float(values).astype(float) if values.size else np.zeros(values.shape)
+
+def _first_error(values):
+    for value in values.ravel():
+        if isinstance(value, ExcelError):
+            return value
+    return None
+
+def _criteria_mask(ev, area, criteria):
+    """Boolean mask of the cells of an area matching a SUMIF / COUNTIF criteria."""
+    if isinstance(criteria, ExcelError):
+        raise criteria
+    if isinstance(criteria, bool):
+        codes, keys = ev._key_codes(area)
+        return codes == keys.get(("b", criteria), -1)
+    if _is_number(criteria):
+        return ev._numbers(area) == criteria
+
+    criteria = _text(criteria)
+    operator = ""
+    for candidate in (">=", "<=", "<>", ">", "<", "="):
+        if criteria.startswith(candidate):
+            operator, criteria = candidate, criteria[len(candidate):]
+            break
+
+    try:
+        target = float(criteria) if criteria.strip() else None
+    except ValueError:
+        target = None
+    if target is not None:
+        numbers = ev._numbers(area)
+        if operator in ("", "="):
+            return numbers == target
+        if operator == "<>":
+            return ~(numbers == target)
+        with np.errstate(invalid="ignore"):
+            return {">": numbers > target, "<": numbers < target,
+                    ">=": numbers >= target, "<=": numbers <= target}[operator]
+
+    if operator in ("", "=", "<>") and criteria and not any(char in criteria for char in "*?~"):
+        # Plain equality: compare integer codes of the values, built once per range and calculation
+        flag = criteria.upper() in ("TRUE", "FALSE")
+        codes, keys = ev._key_codes(area)
+        mask = codes == keys.get(("b", criteria.upper() == "TRUE") if flag else ("s", criteria.lower()), -1)
+        return ~mask if operator == "<>" else mask
+
+    values = ev._values(area)
+    if operator in ("", "=", "<>"):
+        if criteria == "":
+            # "" and "=" match blank cells, "<>" matches the others
+            mask = np.frompyfunc(lambda value: value is None or value == "", 1, 1)(values).astype(bool)
+        else:
+            pattern = _wildcard_pattern(criteria)
+            mask = np.frompyfunc(lambda value: isinstance(value, str) and pattern.fullmatch(value) is not None,
+                                 1, 1)(values).astype(bool)
+        return ~mask if operator == "<>" else mask
+
+    lowered = criteria.lower()
+    compare = {">": str.__gt__, "<": str.__lt__, ">=": str.__ge__, "<=": str.__le__}[operator]
+    return np.frompyfunc(lambda value: isinstance(value, str) and compare(value.lower(), lowered),
+                         1, 1)(values).astype(bool)
+
+def _lookup_key(value):
+    # Exact-match key: numbers by value, text case-insensitively
+    if isinstance(value, bool):
+        return ("b", value)
+    if _is_number(value):
+        return ("n", float(value))
+    if isinstance(value, str):
+        return ("s", value.lower())
+    return None
+
+def _lookup_position(ev, vector, value, match_type):
+    """
+    0-based position of value in a 1D area (a single row or column) with MATCH semantics, or raises #N/A.
+    match_type 0 is an exact match (with wildcards for text), 1 the largest value <= value on ascending
+    data and -1 the smallest value >= value on descending data.
+    """
+    if isinstance(value, ExcelError):
+        raise value
+    if value is None:
+        value = 0
+    if match_type == 0:
+        if isinstance(value, str) and any(char in value for char in "*?~"):
+            pattern = _wildcard_pattern(value)
+            items = ev._values(vector).ravel()
+            hits = np.flatnonzero(np.frompyfunc(lambda item: isinstance(item, str) and pattern.fullmatch(item) is not None,
+                                                1, 1)(items).astype(bool))
+            if not hits.size:
+                raise _error("#N/A")
+            return int(hits[0])
+        position = ev._exact_index(vector).get(_lookup_key(value))
+        if position is None:
+            raise _error("#N/A")
+        return position
+
+    if _is_number(value):
+        numbers = ev._numbers(vector).ravel()
+        positions = np.flatnonzero(~np.isnan(numbers))
+        passed = numbers[positions] <= value if match_type > 0 else numbers[positions] >= value
+    else:
+        items = ev._values(vector).ravel()
+        positions = np.flatnonzero(np.frompyfunc(lambda item: item is not None and not isinstance(item, ExcelError)
+                                                 and _rank(item) == _rank(value), 1, 1)(items).astype(bool))
+        order = np.array([_compare(items[i], value) for i in positions], dtype=int)
+        passed = order <= 0 if match_type > 0 else order >= 0
+    if not positions.size or not passed[0]:
+        raise _error("#N/A")
+    # Data is assumed sorted: stop before the first value past the target
+    stop = np.flatnonzero(~passed)
+    return int(positions[stop[0] - 1] if stop.size else positions[-1])
+
+# ---------------------------------------------------------------------------------------------------------------
+# Functions. Each receives the evaluator and its evaluated arguments (scalars, _Range or arrays);
+# the ones in _LAZY_FUNCTIONS receive argument thunks instead.
+
+def _raise_error_in(ev, area):
+    error = ev._error_in(area)
+    if error is not None:
+        raise error
+
+def _numbers_of(ev, args):
+    """Numbers counted by SUM / AVERAGE / MIN / MAX: numbers in ranges, coercible scalars given directly."""
+    chunks = []
+    for arg in args:
+        if arg is _MISSING:
+            continue
+        if isinstance(arg, (_Range, np.ndarray)):
+            _raise_error_in(ev, arg)
+            numbers = ev._numbers(arg).ravel()
+            chunks.append(numbers[~np.isnan(numbers)])
+        else:
+            chunks.append(np.array([float(_number(arg))]))
+    return np.concatenate(chunks) if chunks else np.zeros(0)
+
+def _fn_sum(ev, *args):
+    total = 0.0
+    for arg in args:
+        if isinstance(arg, (_Range, np.ndarray)):
+            _raise_error_in(ev, arg)
+            total += float(np.nansum(ev._numbers(arg)))
+        elif arg is not _MISSING:
+            total += _number(arg)
+    return total
+
+def _fn_average(ev, *args):
+    numbers = _numbers_of(ev, args)
+    if not numbers.size:
+        raise _error("#DIV/0!")
+    return float(np.mean(numbers))
+
+def _fn_min(ev, *args):
+    numbers = _numbers_of(ev, args)
+    return float(np.min(numbers)) if numbers.size else 0
+
+def _fn_max(ev, *args):
+    numbers = _numbers_of(ev, args)
+    return float(np.max(numbers)) if numbers.size else 0
+
+def _fn_count(ev, *args):
+    count = 0
+    for arg in args:
+        if isinstance(arg, (_Range, np.ndarray)):
+            count += int(np.count_nonzero(~np.isnan(ev._numbers(arg))))
+        elif arg is not _MISSING:
+            try:
+                _number(arg)
+                count += 1
+            except ExcelError:
+                pass
+    return count
+
+def _fn_counta(ev, *args):
+    count = 0
+    for arg in args:
+        if isinstance(arg, (_Range, np.ndarray)):
+            count += int(np.count_nonzero(np.not_equal(ev._values(arg), None)))
+        elif arg is not _MISSING:
+            count += 1
+    return count
+
+def _fn_countblank(ev, area):
+    values = ev._values(area)
+    return int(np.count_nonzero(np.equal(values, None) | np.equal(values, "")))
+
+def _conditions_mask(ev, pairs):
+    mask = None
+    for area, criteria in pairs:
+        condition = _criteria_mask(ev, area, ev._scalar(criteria))
+        if mask is not None and condition.shape != mask.shape:
+            raise _error("#VALUE!")
+        mask = condition if mask is None else mask & condition
+    return mask
+
+def _resized(area, shape):
+    # Excel reads sum_range with the shape of the criteria range, starting at its top-left cell
+    if isinstance(area, _Range):
+        return area._replace(max_row=area.min_row + shape[0] - 1, max_col=area.min_col + shape[1] - 1)
+    return area
+
+def _masked_sum(ev, area, mask):
+    numbers = ev._numbers(area)
+    if numbers.shape != mask.shape:
+        raise _error("#VALUE!")
+    if ev._error_in(area) is not None:
+        error = _first_error(ev._values(area)[mask])
+        if error is not None:
+            raise error
+    return float(np.nansum(numbers[mask]))
+
+def _fn_sumif(ev, area, criteria, sum_area=_MISSING):
+    mask = _conditions_mask(ev, [(area, criteria)])
+    return _masked_sum(ev, area if sum_area is _MISSING else _resized(sum_area, mask.shape), mask)
+
+def _fn_sumifs(ev, sum_area, *pairs):
+    return _masked_sum(ev, sum_area, _conditions_mask(ev, zip(pairs[0::2], pairs[1::2])))
+
+def _fn_countif(ev, area, criteria):
+    return int(np.count_nonzero(_conditions_mask(ev, [(area, criteria)])))
+
+def _fn_countifs(ev, *pairs):
+    return int(np.count_nonzero(_conditions_mask(ev, zip(pairs[0::2], pairs[1::2]))))
+
+def _fn_averageif(ev, area, criteria, average_area=_MISSING):
+    mask = _conditions_mask(ev, [(area, criteria)])
+    target = area if average_area is _MISSING else _resized(average_area, mask.shape)
+    numbers = ev._numbers(target)[mask]
+    numbers = numbers[~np.isnan(numbers)]
+    if not numbers.size:
+        raise _error("#DIV/0!")
+    return float(np.mean(numbers))
+
+def _fn_sumproduct(ev, *args):
+    product = None
+    for arg in args:
+        _raise_error_in(ev, arg)
+        numbers = np.nan_to_num(ev._numbers(arg), nan=0.0)
+        if product is not None and numbers.shape != product.shape:
+            raise _error("#VALUE!")
+        product = numbers if product is None else product * numbers
+    return float(np.sum(product)) if product is not None else 0
+
+def _fn_if(ev, condition, if_true=None, if_false=None):
+    if _boolean(ev._scalar(condition())):
+        value = if_true() if if_true is not None else 0
+    else:
+        value = if_false() if if_false is not None else False
+    return 0 if value is _MISSING else value
+
+def _fn_iferror(ev, value, fallback):
+    try:
+        result = ev._scalar(value())
+    except ExcelError:
+        return fallback()
+    return result
+
+def _fn_ifna(ev, value, fallback):
+    try:
+        result = ev._scalar(value())
+    except ExcelError as error:
+        if error.code == "#N/A":
+            return fallback()
+        raise
+    return result
+
+def _logical_values(ev, args):
+    flags = []
+    for arg in args:
+        if isinstance(arg, (_Range, np.ndarray)):
+            _raise_error_in(ev, arg)
+            values = ev._values(arg)
+            flags.extend(bool(value) for value in values.ravel() if isinstance(value, (bool, int, float)))
+        elif arg is not _MISSING:
+            flags.append(_boolean(arg))
+    if not flags:
+        raise _error("#VALUE!")
+    return flags
+
+def _fn_and(ev, *args):
+    return all(_logical_values(ev, args))
+
+def _fn_or(ev, *args):
+    return any(_logical_values(ev, args))
+
+def _fn_not(ev, value):
+    return not _boolean(value)
+
+def _checker(test):
+    def function(ev, value):
+        try:
+            value = ev._scalar(value())
+        except ExcelError as error:
+            return test(error)
+        return test(value)
+    return function
+
+def _lookup(ev, value, table, index, approximate, vertical):
+    height, width = ev._shape(table)
+    index = int(_number(index))
+    if index < 1:
+        raise _error("#VALUE!")
+    if index > (width if vertical else height):
+        raise _error("#REF!")
+    exact = approximate is not _MISSING and not _boolean(approximate)
+    keys = ev._sub_area(table, None, 0) if vertical else ev._sub_area(table, 0, None)
+    position = _lookup_position(ev, keys, ev._scalar(value), 0 if exact else 1)
+    return ev._sub_area(table, position, index - 1) if vertical else ev._sub_area(table, index - 1, position)
+
+def _fn_vlookup(ev, value, table, index, approximate=True):
+    return _lookup(ev, value, table, index, approximate, vertical=True)
+
+def _fn_hlookup(ev, value, table, index, approximate=True):
+    return _lookup(ev, value, table, index, approximate, vertical=False)
+
+def _fn_match(ev, value, area, match_type=1):
+    height, width = ev._shape(area)
+    if height != 1 and width != 1:
+        raise _error("#N/A")
+    match_type = 1 if match_type is _MISSING else int(_number(match_type))
+    return _lookup_position(ev, area, ev._scalar(value), match_type) + 1
+
+def _fn_index(ev, area, row, column=_MISSING):
+    row = 0 if row is _MISSING else int(_number(row))
+    column = 0 if column is _MISSING else int(_number(column))
+    height, width = ev._shape(area)
+    if height == 1 and column == 0 and row:
+        row, column = 1, row  # INDEX(A1:E1, 3) reads along the row
+    if row < 0 or column < 0 or row > height or column > width:
+        raise _error("#REF!")
+    return ev._sub_area(area, row - 1 if row else None, column - 1 if column else None)
+
+def _fn_round(ev, value, digits=0):
+    return _round(_number(value), _number(digits), ROUND_HALF_UP)
+
+def _fn_roundup(ev, value, digits=0):
+    return _round(_number(value), _number(digits), ROUND_UP)
+
+def _fn_rounddown(ev, value, digits=0):
+    return _round(_number(value), _number(digits), ROUND_DOWN)
+
+def _fn_mod(ev, number, divisor):
+    number, divisor = _number(number), _number(divisor)
+    if divisor == 0:
+        raise _error("#DIV/0!")
+    return number - divisor * math.floor(number / divisor)
+
+def _fn_sqrt(ev, value):
+    value = _number(value)
+    if value < 0:
+        raise _error("#NUM!")
+    return math.sqrt(value)
+
+def _joined_texts(ev, args):
+    for arg in args:
+        if isinstance(arg, (_Range, np.ndarray)):
+            _raise_error_in(ev, arg)
+            for value in ev._values(arg).ravel():
+                yield _text(value)
+        elif arg is not _MISSING:
+            yield _text(arg)
+
+def _fn_concat(ev, *args):
+    return "".join(_joined_texts(ev, args))
+
+def _fn_textjoin(ev, delimiter, ignore_empty, *args):
+    texts = list(_joined_texts(ev, args))
+    if _boolean(ignore_empty):
+        texts = [text for text in texts if text != ""]
+    return _text(delimiter).join(texts)
+
+def _fn_left(ev, text, count=1):
+    count = int(_number(count))
+    if count < 0:
+        raise _error("#VALUE!")
+    return _text(text)[:count]
+
+def _fn_right(ev, text, count=1):
+    count = int(_number(count))
+    if count < 0:
+        raise _error("#VALUE!")
+    return _text(text)[len(_text(text)) - count:] if count else ""
+
+def _fn_mid(ev, text, start, count):
+    start, count = int(_number(start)), int(_number(count))
+    if start < 1 or count < 0:
+        raise _error("#VALUE!")
+    return _text(text)[start - 1:start - 1 + count]
+
+def _fn_substitute(ev, text, old, new, instance=_MISSING):
+    text, old, new = _text(text), _text(old), _text(new)
+    if not old:
+        return text
+    if instance is _MISSING:
+        return text.replace(old, new)
+    instance = int(_number(instance))
+    if instance < 1:
+        raise _error("#VALUE!")
+    position = -1
+    for _ in range(instance):
+        position = text.find(old, position + 1)
+        if position < 0:
+            return text
+    return text[:position] + new + text[position + len(old):]
+
+def _fn_find(ev, needle, text, start=1):
+    position = _text(text).find(_text(needle), int(_number(start)) - 1)
+    if position < 0 or int(_number(start)) < 1:
+        raise _error("#VALUE!")
+    return position + 1
+
+def _fn_search(ev, needle, text, start=1):
+    start = int(_number(start))
+    found = _wildcard_pattern(_text(needle)).search(_text(text), start - 1) if start >= 1 else None
+    if found is None:
+        raise _error("#VALUE!")
+    return found.start() + 1
+
+def _fn_value(ev, text):
+    if _is_number(text):
+        return text
+    return _number(_text(text))
+
+_FUNCTIONS = {
+    "SUM": _fn_sum,
+    "AVERAGE": _fn_average,
+    "MIN": _fn_min,
+    "MAX": _fn_max,
+    "COUNT": _fn_count,
+    "COUNTA": _fn_counta,
+    "COUNTBLANK": _fn_countblank,
+    "SUMIF": _fn_sumif,
+    "SUMIFS": _fn_sumifs,
+    "COUNTIF": _fn_countif,
+    "COUNTIFS": _fn_countifs,
+    "AVERAGEIF": _fn_averageif,
+    "SUMPRODUCT": _fn_sumproduct,
+    "AND": _fn_and,
+    "OR": _fn_or,
+    "NOT": _fn_not,
+    "TRUE": lambda ev: True,
+    "FALSE": lambda ev: False,
+    "NA": lambda ev: _raise("#N/A"),
+    "VLOOKUP": _fn_vlookup,
+    "HLOOKUP": _fn_hlookup,
+    "MATCH": _fn_match,
+    "INDEX": _fn_index,
+    "ROUND": _fn_round,
+    "ROUNDUP": _fn_roundup,
+    "ROUNDDOWN": _fn_rounddown,
+    "INT": lambda ev, value: math.floor(_number(value)),
+    "ABS": lambda ev, value: abs(_number(value)),
+    "MOD": _fn_mod,
+    "POWER": lambda ev, base, exponent: _power(_number(base), _number(exponent)),
+    "SQRT": _fn_sqrt,
+    "CONCATENATE": lambda ev, *args: "".join(_text(ev._scalar(arg)) for arg in args),
+    "CONCAT": _fn_concat,
+    "TEXTJOIN": _fn_textjoin,
+    "LEFT": _fn_left,
+    "RIGHT": _fn_right,
+    "MID": _fn_mid,
+    "LEN": lambda ev, text: len(_text(text)),
+    "UPPER": lambda ev, text: _text(text).upper(),
+    "LOWER": lambda ev, text: _text(text).lower(),
+    "PROPER": lambda ev, text: _text(text).title(),
+    "TRIM": lambda ev, text: re.sub(" +", " ", _text(text).strip(" ")),
+    "SUBSTITUTE": _fn_substitute,
+    "REPT": lambda ev, text, count: _text(text) * max(int(_number(count)), 0),
+    "EXACT": lambda ev, left, right: _text(left) == _text(right),
+    "FIND": _fn_find,
+    "SEARCH": _fn_search,
+    "VALUE": _fn_value,
+}
+
+_LAZY_FUNCTIONS = {
+    "IF": _fn_if,
+    "IFERROR": _fn_iferror,
+    "IFNA": _fn_ifna,
+    "ISERROR": _checker(lambda value: isinstance(value, ExcelError)),
+    "ISNA": _checker(lambda value: isinstance(value, ExcelError) and value.code == "#N/A"),
+    "ISERR": _checker(lambda value: isinstance(value, ExcelError) and value.code != "#N/A"),
+    "ISBLANK": _checker(lambda value: value is None),
+    "ISNUMBER": _checker(_is_number),
+    "ISTEXT": _checker(lambda value: isinstance(value, str)),
+    "ISLOGICAL": _checker(lambda value: isinstance(value, bool)),
+}
+
+# Functions that take ranges as such; the others receive the value of single-cell references
+_RANGE_FUNCTIONS = {"SUM", "AVERAGE", "MIN", "MAX", "COUNT", "COUNTA", "COUNTBLANK", "SUMIF", "SUMIFS", "COUNTIF",
+                    "COUNTIFS", "AVERAGEIF", "SUMPRODUCT", "AND", "OR", "VLOOKUP", "HLOOKUP", "MATCH", "INDEX",
+                    "CONCAT", "TEXTJOIN", "CONCATENATE"}
+
+# ---------------------------------------------------------------------------------------------------------------
+# Operators
+
+def _power(base, exponent):
+    try:
+        result = math.pow(base, exponent)
+    except (OverflowError, ValueError, ZeroDivisionError):
+        raise _error("#NUM!" if base != 0 else "#DIV/0!")
+    return result
+
+def _divide(left, right):
+    if right == 0:
+        raise _error("#DIV/0!")
+    return left / right
+
+_ARITHMETIC = {
+    "+": lambda left, right: left + right,
+    "-": lambda left, right: left - right,
+    "*": lambda left, right: left * right,
+    "/": _divide,
+    "^": _power,
+}
+
+_COMPARISONS = {
+    "=": lambda order: order == 0,
+    "<>": lambda order: order != 0,
+    "<": lambda order: order < 0,
+    ">": lambda order: order > 0,
+    "<=": lambda order: order <= 0,
+    ">=": lambda order: order >= 0,
+}
+
+def _scalar_operation(operator, left, right):
+    if operator in _ARITHMETIC:
+        return _ARITHMETIC[operator](_number(left), _number(right))
+    if operator == "&":
+        return _text(left) + _text(right)
+    return _COMPARISONS[operator](_compare(left, right))
+
+def _apply_operator(operator, left, right):
+    if isinstance(left, np.ndarray) or isinstance(right, np.ndarray):
+        # Array arithmetic, e.g. inside SUMPRODUCT((A1:A9="x")*B1:B9)
+        return np.frompyfunc(lambda a, b: _scalar_operation(operator, a, b), 2, 1)(left, right)
+    return _scalar_operation(operator, left, right)
+
+# ---------------------------------------------------------------------------------------------------------------
+# Parser: tokens of openpyxl's Tokenizer -> closures
+
+class _Parser:
+    """
+    Recursive-descent parser compiling a tokenized formula into nested closures over an evaluator.
+    Precedence, from lowest: comparisons, &, + -, * /, ^, %, unary minus.
+    """
+
+    def __init__(self, evaluator, sheet, formula):
+        self.ev = evaluator
+        self.sheet = sheet
+        self.tokens = [token for token in ex_tokenize_formula(formula) if token[1] != "WHITE-SPACE"]
+        self.position = 0
+        self.references = []
+
+    def peek(self):
+        return self.tokens[self.position] if self.position < len(self.tokens) else (None, None, None)
+
+    def take(self):
+        token = self.peek()
+        self.position += 1
+        return token
+
+    def parse(self):
+        if not self.tokens:
+            raise _Unsupported("empty formula")
+        node = self.comparison()
+        if self.position != len(self.tokens):
+            raise _Unsupported(f"unexpected token {self.peek()[0]!r}")
+        return node
+
+    def _binary(self, operand, operators):
+        node = operand()
+        while self.peek()[1] == "OPERATOR-INFIX" and self.peek()[0] in operators:
+            operator = self.take()[0]
+            left, right = node, operand()
+            node = self._operation(operator, left, right)
+        return node
+
+    def _operation(self, operator, left, right):
+        ev = self.ev
+        return lambda: _apply_operator(operator, ev._operand(left()), ev._operand(right()))
+
+    def comparison(self):
+        return self._binary(self.concatenation, _COMPARISONS)
+
+    def concatenation(self):
+        return self._binary(self.additive, ("&",))
+
+    def additive(self):
+        return self._binary(self.multiplicative, ("+", "-"))
+
+    def multiplicative(self):
+        return self._binary(self.power, ("*", "/"))
+
+    def power(self):
+        return self._binary(self.percent, ("^",))
+
+    def percent(self):
+        node = self.unary()
+        while self.peek()[1] == "OPERATOR-POSTFIX":
+            self.take()
+            inner = node
+            node = self._operation("/", inner, lambda: 100)
+        return node
+
+    def unary(self):
+        if self.peek()[1] == "OPERATOR-PREFIX":
+            operator = self.take()[0]
+            operand = self.unary()
+            if operator == "+":
+                return operand
+            return self._operation("*", operand, lambda: -1)
+        return self.primary()
+
+    def primary(self):
+        value, token_type, subtype = self.take()
+        if token_type == "OPERAND":
+            return self.operand(value, subtype)
+        if token_type == "FUNC" and subtype == "OPEN":
+            return self.function(value[:-1].upper())
+        if token_type == "PAREN" and subtype == "OPEN":
+            node = self.comparison()
+            if self.take()[1] != "PAREN":
+                raise _Unsupported("unbalanced parenthesis")
+            return node
+        if token_type == "ARRAY" and subtype == "OPEN":
+            return self.array()
+        raise _Unsupported(f"unexpected token {value!r}")
+
+    def operand(self, value, subtype):
+        if subtype == "NUMBER":
+            number = float(value)
+            number = int(number) if number.is_integer() and "." not in value and "E" not in value.upper() else number
+            return lambda: number
+        if subtype == "TEXT":
+            text = value[1:-1].replace('""', '"')
+            return lambda: text
+        if subtype == "LOGICAL":
+            flag = value.upper() == "TRUE"
+            return lambda: flag
+        if subtype == "ERROR":
+            code = value.upper()
+            return lambda: _raise(code)
+        reference = self.ev._resolve_reference(self.sheet, value)
+        self.references.append(reference)
+        return lambda: reference
+
+    def array(self):
+        rows = [[]]
+        while True:
+            value, token_type, subtype = self.take()
+            if token_type == "ARRAY" and subtype == "CLOSE":
+                break
+            if token_type == "SEP":
+                if subtype == "ROW":
+                    rows.append([])
+                continue
+            if token_type == "OPERATOR-PREFIX" and value == "-":
+                value, token_type, subtype = self.take()
+                value = "-" + value
+            if token_type != "OPERAND" or subtype == "RANGE":
+                raise _Unsupported("array constant")
+            rows[-1].append(self.operand(value, subtype)())
+        block = np.empty((len(rows), len(rows[0])), dtype=object)
+        for i, row in enumerate(rows):
+            block[i, :] = row
+        return lambda: block
+
+    def function(self, name):
+        for prefix in ("_XLFN.", "_XLWS."):
+            if name.startswith(prefix):
+                name = name[len(prefix):]
+        arguments = []
+        if self.peek()[1] == "FUNC" and self.peek()[2] == "CLOSE":
+            self.take()
+        else:
+            while True:
+                if self.peek()[1] in ("SEP", "FUNC") and self.peek()[2] in ("ARG", "CLOSE"):
+                    arguments.append(lambda: _MISSING)
+                else:
+                    arguments.append(self.comparison())
+                value, token_type, subtype = self.take()
+                if token_type == "FUNC" and subtype == "CLOSE":
+                    break
+                if token_type != "SEP" or subtype != "ARG":
+                    raise _Unsupported(f"unexpected token {value!r} in {name}")
+
+        ev = self.ev
+        if name in _LAZY_FUNCTIONS:
+            function = _LAZY_FUNCTIONS[name]
+            return lambda: function(ev, *arguments)
+        if name not in _FUNCTIONS:
+            raise _Unsupported(f"function {name}")
+        function = _FUNCTIONS[name]
+        if name in _RANGE_FUNCTIONS:
+            return lambda: function(ev, *[argument() for argument in arguments])
+        return lambda: function(ev, *[ev._scalar(argument()) for argument in arguments])
+
+# ---------------------------------------------------------------------------------------------------------------
+
+class _Column:
+    """Values of one sheet column during a calculation, as object and float arrays (row r at index r - 1)."""
+
+    __slots__ = ("values", "numbers", "special")
+
+    def __init__(self, size):
+        self.values = np.full(size, None, dtype=object)
+        self.numbers = np.full(size, np.nan)
+        self.special = 0  # errors and unknown values; blocks are only scanned for them when non-zero
+
+    def store(self, index, value):
+        old = self.values[index]
+        if isinstance(old, ExcelError) or old is _UNKNOWN:
+            self.special -= 1
+        if isinstance(value, ExcelError) or value is _UNKNOWN:
+            self.special += 1
+        self.values[index] = value
+        self.numbers[index] = value if _is_number(value) else np.nan
+
+class FormulaEvaluator:
+    """
+    Offline evaluator for the formulas of an openpyxl workbook loaded in edit mode.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    calculate() evaluates every formula in dependency order; after editing cells, recalculate(cells)
+    only evaluates the formulas depending on them (found through FormulaGraph). Results are kept in
+    values ({(sheet, row, column): value}); save() writes the workbook with these values cached, so
+    data_only readers see them.
+
+    Supported: arithmetic, comparison and & operators, SUM/AVERAGE/MIN/MAX/COUNT(A/BLANK), SUMIF(S),
+    COUNTIF(S), AVERAGEIF, SUMPRODUCT, IF/IFERROR/IFNA/AND/OR/NOT and IS* tests, VLOOKUP/HLOOKUP/INDEX/MATCH,
+    ROUND(UP/DOWN)/INT/ABS/MOD/POWER/SQRT and the common text functions. Range functions work on NumPy
+    arrays of whole columns, built once per calculation. Cells using anything else (other functions,
+    defined names, array formulas, circular references) are reported in unsupported and get no value.
+    """
+
+    def __init__(self, wb):
+        self.wb = wb
+        self._sheets = {ws.title: ws for ws in wb.worksheets}
+        self._sheet_names = {title.lower(): title for title in self._sheets}
+        self.graph = FormulaGraph(self._sheets)
+        self.values = {}        # (sheet, row, column) -> calculated value
+        self.unsupported = {}   # (sheet, row, column) -> reason
+        self._compiled = {}     # (sheet, row, column) -> (closure, references)
+        for title, ws in self._sheets.items():
+            for (row, column), cell in ws._cells.items():
+                if cell.data_type == "f" and isinstance(cell.value, str):
+                    self.graph.add_formula(title, row, column, cell.value)
+
+    # -- references and values -----------------------------------------------------------------------------------
+
+    def _resolve_reference(self, sheet, reference):
+        target, separator, address = reference.rpartition("!")
+        if separator:
+            if target.startswith("'") and target.endswith("'"):
+                target = target[1:-1].replace("''", "'")
+            if target.lower() not in self._sheet_names:
+                raise _Unsupported(f"reference {reference}")
+            sheet = self._sheet_names[target.lower()]
+        try:
+            min_col, min_row, max_col, max_row = range_boundaries(address.replace("$", ""))
+        except (ValueError, TypeError):
+            raise _Unsupported(f"name {reference}")
+        return _Range(sheet, min_row or 1, min_col or 1, max_row or MAX_ROW, max_col or MAX_COLUMN)
+
+    def _input_value(self, cell):
+        value = cell.value
+        if cell.data_type == "e":
+            return ExcelError(value)
+        if cell.data_type == "f":
+            return _UNKNOWN  # array or data table formula, not evaluated
+        if isinstance(value, (datetime.datetime, datetime.date, datetime.time, datetime.timedelta)):
+            return to_excel(value, self.wb.epoch)
+        return value
+
+    def _read(self, sheet, row, column):
+        key = (sheet, row, column)
+        if key in self.graph.formulas:
+            value = self.values.get(key)
+        else:
+            cell = self._sheets[sheet]._cells.get((row, column))
+            value = self._input_value(cell) if cell is not None else None
+        if value is _UNKNOWN:
+            raise _Unsupported(f"depends on {sheet}!{get_column_letter(column)}{row}")
+        return value
+
+    def _column(self, sheet, column):
+        key = (sheet, column)
+        data = self._columns.get(key)
+        if data is None:
+            ws = self._sheets[sheet]
+            data = self._columns[key] = _Column(self._extents[sheet][0])
+            for row, _, cell in ex_iter_populated_cells(ws, 1, column, data.values.size, column):
+                if (sheet, row, column) in self.graph.formulas:
+                    data.store(row - 1, self.values.get((sheet, row, column)))
+                else:
+                    data.store(row - 1, self._input_value(cell))
+        return data
+
+    def _shape(self, area):
+        if isinstance(area, _Range):
+            max_row, max_col = self._extents[area.sheet]
+            # Whole rows / columns stop at the used part of the sheet; explicit ranges keep their size
+            last_row = min(area.max_row, max_row) if area.max_row == MAX_ROW else area.max_row
+            last_col = min(area.max_col, max_col) if area.max_col == MAX_COLUMN else area.max_col
+            return max(last_row - area.min_row + 1, 0), max(last_col - area.min_col + 1, 0)
+        return self._values(area).shape
+
+    def _area_columns(self, area):
+        """Column data and row slice holding the stored part of a range."""
+        max_row, max_col = self._extents[area.sheet]
+        last_row = min(area.max_row, max_row)
+        rows = slice(area.min_row - 1, max(last_row, area.min_row - 1))
+        columns = [self._column(area.sheet, column) for column in range(area.min_col, min(area.max_col, max_col) + 1)]
+        for data in columns:
+            if data.special and any(value is _UNKNOWN for value in data.values[rows]):
+                raise _Unsupported("depends on an unsupported cell")
+        return columns, rows
+
+    def _block(self, area, attribute, fill, dtype):
+        columns, rows = self._area_columns(area)
+        shape = self._shape(area)
+        stored = rows.stop - rows.start
+        if len(columns) == 1 and shape == (stored, 1):
+            return getattr(columns[0], attribute)[rows].reshape(-1, 1)
+        block = np.full(shape, fill, dtype=dtype)
+        for offset, data in enumerate(columns[:shape[1]]):
+            block[:stored, offset] = getattr(data, attribute)[rows]
+        return block
+
+    def _values(self, area):
+        """2D object array of an area (range or array value)."""
+        if isinstance(area, _Range):
+            return self._block(area, "values", None, object)
+        if isinstance(area, np.ndarray):
+            return area if area.ndim == 2 else area.reshape(1, -1)
+        block = np.empty((1, 1), dtype=object)
+        block[0, 0] = area
+        return block
+
+    def _numbers(self, area):
+        """2D float array of an area, NaN where the cell is not a number (text, logical, blank, error)."""
+        if isinstance(area, _Range):
+            return self._block(area, "numbers", np.nan, float)
+        return _block_numbers(self._values(area))
+
+    def _error_in(self, area):
+        """First error value of an area, or None."""
+        if isinstance(area, _Range):
+            columns, rows = self._area_columns(area)
+            for data in columns:
+                if data.special:
+                    error = _first_error(data.values[rows])
+                    if error is not None:
+                        return error
+            return None
+        return _first_error(self._values(area))
+
+    def _sub_area(self, area, row, column):
+        """Cell (row, column) of an area, 0-based; None selects the whole row / column."""
+        if isinstance(area, _Range):
+            height, width = self._shape(area)
+            return _Range(area.sheet,
+                          area.min_row + row if row is not None else area.min_row,
+                          area.min_col + column if column is not None else area.min_col,
+                          area.min_row + row if row is not None else area.min_row + height - 1,
+                          area.min_col + column if column is not None else area.min_col + width - 1)
+        values = self._values(area)
+        return values[row if row is not None else slice(None), column if column is not None else slice(None)]
+
+    def _key_codes(self, area):
+        """
+        (codes, {lookup key: code}) of an area: an int array where equal values (text compared
+        case-insensitively) share a code, so criteria tests run as array comparisons.
+        """
+        cache_key = ("codes", area) if isinstance(area, _Range) else None
+        cached = self._lookups.get(cache_key) if cache_key is not None else None
+        if cached is None:
+            values = self._values(area)
+            keys = {}
+            codes = np.fromiter((keys.setdefault(_lookup_key(value), len(keys)) for value in values.ravel()),
+                                dtype=np.int64, count=values.size).reshape(values.shape)
+            cached = (codes, keys)
+            if cache_key is not None:
+                self._lookups[cache_key] = cached
+        return cached
+
+    def _exact_index(self, vector):
+        """{lookup key: first position} of a row or column, built once per calculation for ranges."""
+        cache_key = vector if isinstance(vector, _Range) else None
+        index = self._lookups.get(cache_key) if cache_key is not None else None
+        if index is None:
+            index = {}
+            for position, value in enumerate(self._values(vector).ravel()):
+                key = _lookup_key(value)
+                if key is not None and key not in index:
+                    index[key] = position
+            if cache_key is not None:
+                self._lookups[cache_key] = index
+        return index
+
+    def _scalar(self, value):
+        """Value of an operand used as a single value; a multi-cell range gives its top-left cell."""
+        if isinstance(value, _Range):
+            value = self._read(value.sheet, value.min_row, value.min_col)
+        elif isinstance(value, np.ndarray):
+            value = value.ravel()[0] if value.size else None
+        if isinstance(value, ExcelError):
+            raise value
+        return value
+
+    def _operand(self, value):
+        # Operators on multi-cell ranges work element-wise
+        if isinstance(value, _Range) and (value.min_row != value.max_row or value.min_col != value.max_col):
+            return self._values(value)
+        return value if isinstance(value, np.ndarray) else self._scalar(value)
+
+    # -- evaluation -----------------------------------------------------------------------------------------------
+
+    def _compile(self, cell):
+        compiled = self._compiled.get(cell)
+        if compiled is None:
+            parser = _Parser(self, cell[0], self.graph.formulas[cell])
+            try:
+                node = parser.parse()
+            except _Unsupported as reason:
+                node = reason
+            compiled = self._compiled[cell] = (node, parser.references)
+        return compiled
+
+    def _evaluate(self, cell, circular=False):
+        node, _ = self._compile(cell)
+        try:
+            if circular:
+                raise _Unsupported("circular reference")
+            if isinstance(node, _Unsupported):
+                raise node
+            value = node()
+            if isinstance(value, _Range):
+                value = self._read(value.sheet, value.min_row, value.min_col)
+            elif isinstance(value, np.ndarray):
+                value = value.ravel()[0] if value.size else None
+            if value is None or value is _MISSING:
+                value = 0  # a reference to a blank cell shows 0
+            elif isinstance(value, float) and not math.isfinite(value):
+                value = ExcelError("#NUM!")
+        except ExcelError as error:
+            value = ExcelError(error.code)
+        except _Unsupported as reason:
+            self.unsupported[cell] = str(reason)
+            value = _UNKNOWN
+        except (ArithmeticError, TypeError, ValueError, IndexError) as error:
+            self.unsupported[cell] = f"{type(error).__name__}: {error}"
+            value = _UNKNOWN
+        else:
+            self.unsupported.pop(cell, None)
+        self.values[cell] = value
+        data = self._columns.get((cell[0], cell[2]))
+        if data is not None:
+            data.store(cell[1] - 1, value)
+
+    def _run(self, cells):
+        """
+        Evaluates cells in dependency order. A cell waits until the formulas it reads, among cells, are done;
+        covered row intervals per column make each range scan its pending rows only once.
+        """
+        self._columns = {}
+        self._lookups = {}
+        self._extents = {title: (ws.max_row, ws.max_column) for title, ws in self._sheets.items()}
+        pending = set(cells)
+        pending_rows = {}  # sheet -> {column: sorted rows to evaluate}
+        for sheet, row, column in sorted(pending, key=lambda cell: (cell[0], cell[2], cell[1])):
+            pending_rows.setdefault(sheet, {}).setdefault(column, []).append(row)
+        done = set()
+        resolved = {}  # (sheet, column) -> RowIntervals whose pending cells are all done
+        circular = set()
+
+        def waiting_for(cell):
+            for reference in self._compile(cell)[1]:
+                columns = pending_rows.get(reference.sheet)
+                if not columns:
+                    continue
+                if reference.min_row == reference.max_row and reference.min_col == reference.max_col:
+                    key = (reference.sheet, reference.min_row, reference.min_col)
+                    if key in pending and key not in done:
+                        yield key
+                    continue
+                for column, rows in columns.items():
+                    if not reference.min_col <= column <= reference.max_col:
+                        continue
+                    intervals = resolved.get((reference.sheet, column))
+                    gaps = intervals.gaps(reference.min_row, reference.max_row) if intervals else \
+                        [(reference.min_row, reference.max_row)]
+                    for low, high in gaps:
+                        for i in range(bisect_left(rows, low), bisect_right(rows, high)):
+                            key = (reference.sheet, rows[i], column)
+                            if key not in done:
+                                yield key
+
+        for start in sorted(pending):
+            if start in done:
+                continue
+            stack = [start]
+            on_stack = {start}
+            while stack:
+                cell = stack[-1]
+                if cell in done:
+                    stack.pop()
+                    continue
+                blockers = []
+                for blocker in waiting_for(cell):
+                    if blocker in on_stack:
+                        circular.add(cell)
+                        continue
+                    blockers.append(blocker)
+                if blockers:
+                    for blocker in blockers:
+                        stack.append(blocker)
+                        on_stack.add(blocker)
+                    continue
+
+                self._evaluate(cell, circular=cell in circular)
+                done.add(cell)
+                stack.pop()
+                on_stack.discard(cell)
+                for reference in self._compile(cell)[1]:
+                    for column in pending_rows.get(reference.sheet, {}):
+                        if reference.min_col <= column <= reference.max_col:
+                            resolved.setdefault((reference.sheet, column), RowIntervals()).add(
+                                reference.min_row, reference.max_row)
+
+        if circular:
+            logger.warning(f"{len(circular)} formulas are part of circular references and were not calculated.")
+        self._columns = {}
+        self._lookups = {}
+        return len(done)
+
+    def calculate(self):
+        """
+        Evaluates every formula of the workbook. Returns the number of formulas evaluated.
+        """
+        self.values = {}
+        self.unsupported = {}
+        count = self._run(list(self.graph.formulas))
+        logger.info(f"Calculated {count} formulas, {len(self.unsupported)} unsupported.")
+        return count
+
+    def recalculate(self, cells):
+        """
+        Re-evaluates only the formulas affected by edited cells.
+
+        cells is an iterable of (sheet, row, column) tuples written since the last calculation, values or
+        formulas. Returns the number of formulas evaluated.
+        """
+        changed = []
+        for sheet, row, column in cells:
+            sheet = self._sheet_names.get(sheet.lower(), sheet)
+            key = (sheet, row, column)
+            cell = self._sheets[sheet]._cells.get((row, column))
+            self._compiled.pop(key, None)
+            if cell is not None and cell.data_type == "f" and isinstance(cell.value, str):
+                self.graph.add_formula(sheet, row, column, cell.value)
+            else:
+                self.graph.remove_formula(sheet, row, column)
+                self.values.pop(key, None)
+                self.unsupported.pop(key, None)
+            changed.append(key)
+
+        dirty = {key for key in changed if key in self.graph.formulas}
+        for sheet, row, column in changed:
+            dirty.update(self.graph.dependents(sheet, row, column, transitive=True))
+        count = self._run(dirty)
+        logger.info(f"Recalculated {count} formulas after {len(changed)} edits.")
+        return count
+
+    def cached_values(self):
+        """
+        Values ready to be cached in the file: {(sheet, row, column): value}, without unsupported cells.
+        """
+        return {cell: value for cell, value in self.values.items() if value is not _UNKNOWN}
+
+    def save(self, file_path):
+        """
+        Saves the workbook with the calculated values cached next to the formulas.
+        """
+        self.wb.save(file_path)
+        ex_write_cached_values(file_path, self.wb, self.cached_values())
+        ex_invalidate_workbook(file_path)
+        ex_invalidate_occupancy_index(file_path)
+        ex_invalidate_sheet_frame(file_path)
+
+_FORMULA_CELL = re.compile(rb'<c r="([A-Z]+[0-9]+)"([^>]*)>(<f[^>]*>.*?</f>|<f[^>]*/>)<v\s*/></c>', re.DOTALL)
+
+def _cached_value_xml(value):
+    if isinstance(value, ExcelError):
+        return ' t="e"', escape(value.code)
+    if isinstance(value, bool):
+        return ' t="b"', "1" if value else "0"
+    if isinstance(value, str):
+        return ' t="str"', escape(value)
+    if isinstance(value, float) and value.is_integer() and abs(value) < 1e15:
+        return "", str(int(value))
+    return "", repr(value)
+
+@instrument
+def ex_write_cached_values(file_path, wb, values):
+    """
+    Writes calculated values into the <v> elements of the formula cells of a file just saved by openpyxl,
+    which otherwise leaves them empty.
+
+    Parameters:
+    - file_path: str
+        The file written by wb.save().
+    - wb: openpyxl.Workbook
+        The saved workbook, used to map sheet titles to worksheet parts.
+    - values: dict
+        {(sheet, row, column): value}. Cells without a value keep an empty cache.
+    """
+    by_sheet = {}
+    for (sheet, row, column), value in values.items():
+        by_sheet.setdefault(sheet, {})[(row, column)] = value
+    parts = {ws.path.lstrip("/"): by_sheet[ws.title] for ws in wb.worksheets if ws.title in by_sheet}
+    if not parts:
+        return
+
+    def inject(sheet_values):
+        def replace(match):
+            col_letters = match.group(1).rstrip(b"0123456789")
+            row = int(match.group(1)[len(col_letters):])
+            column = 0
+            for letter in col_letters:
+                column = column * 26 + letter - 64
+            value = sheet_values.get((row, column))
+            if value is None:
+                return match.group(0)
+            data_type, text = _cached_value_xml(value)
+            return (b'<c r="' + match.group(1) + b'"' + match.group(2) + data_type.encode() + b'>'
+                    + match.group(3) + b'<v>' + text.encode("utf-8") + b'</v></c>')
+        return replace
+
+    directory = os.path.dirname(os.path.abspath(file_path))
+    handle, temp_path = tempfile.mkstemp(suffix=".xlsx", dir=directory)
+    os.close(handle)
+    try:
+        with zipfile.ZipFile(file_path) as source, zipfile.ZipFile(temp_path, "w", zipfile.ZIP_DEFLATED) as target:
+            for item in source.infolist():
+                data = source.read(item.filename)
+                if item.filename in parts:
+                    data = _FORMULA_CELL.sub(inject(parts[item.filename]), data)
+                target.writestr(item, data)
+        os.replace(temp_path, file_path)
+    except Exception:
+        os.remove(temp_path)
+        raise
+
+@instrument
+def ex_calculate_workbook(file_path, target_file=None):
+    """
+    Calculates every formula of an Excel file offline and saves it with up-to-date cached values.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Parameters:
+    - file_path: str
+        The path to the .xlsx / .xlsm file to calculate.
+    - target_file: str, optional
+        Where to save the result. Defaults to file_path.
+
+    Returns:
+    - FormulaEvaluator
+        The evaluator, for recalculate() after further edits and for its unsupported cells.
+
+    Notes:
+    - Files written by openpyxl (e.g. by ex_copy_range) carry no cached values until Excel opens them;
+      after this call, openpyxl with data_only=True and ex_iter_sheet_records return the calculated results.
+    """
+    wb = ex_load_workbook(file_path, keep_vba=file_path.lower().endswith(".xlsm"), use_cache=False)
+    evaluator = FormulaEvaluator(wb)
+    evaluator.calculate()
+    evaluator.save(target_file or file_path)
+    if evaluator.unsupported:
+        logger.warning(f"{len(evaluator.unsupported)} formulas could not be calculated, "
+                        f"e.g. {next(iter(evaluator.unsupported.items()))}.")
+    return evaluator
+
+if __name__ == "__main__":
+    ex_configure_logging()
+    file_path = r"C:\Users\KNT15083\Downloads\521\summary.xlsx"
+    evaluator = ex_calculate_workbook(file_path)
+    ws = evaluator.wb.active
+    ws["B2"] = 100
+    evaluator.recalculate([(ws.title, 2, 2)])
+    evaluator.save(file_path)
@@ -0,0 +1,313 @@
+from bisect import bisect_left, bisect_right
+from collections import deque
+
+from .ex_find_cells_with_fomulas import ex_iter_formulas
+from .ex_formula_tokens import FormulaRef, ex_formula_references
+from .ex_workbook_cache import ex_load_workbook
+from .ex_workbook_session import ex_session_source
+from .ex_xlsx_reader import ex_read_sheet_names
+from .ex_logging import ex_configure_logging, ex_get_logger
+from .ex_telemetry import instrument
+
+logger = ex_get_logger(__name__)
+
+_BLOCK_SIZE = 64
+_NARROW_COLUMNS = 32  # ranges up to this many columns wide are indexed under each of their columns
+
+class _RangeIndex:
+    """
+    Static interval index over multi-cell ranges.
+
+    Ranges are sorted by first row and split into blocks that remember their largest last row, so an
+    overlap query only scans the blocks that can reach the queried rows.
+    """
+
+    def __init__(self, ranges):
+        # ranges: {(min_row, min_col, max_row, max_col): [formula cells]}
+        self.bounds = sorted(ranges)
+        self.owners = [ranges[bounds] for bounds in self.bounds]
+        self.starts = [bounds[0] for bounds in self.bounds]
+        self.block_max_row = [max(bounds[2] for bounds in self.bounds[i:i + _BLOCK_SIZE])
+                              for i in range(0, len(self.bounds), _BLOCK_SIZE)]
+
+    def overlapping(self, min_row, min_col, max_row, max_col):
+        end = bisect_right(self.starts, max_row)
+        for block, block_max_row in enumerate(self.block_max_row):
+            first = block * _BLOCK_SIZE
+            if first >= end:
+                break
+            if block_max_row < min_row:
+                continue
+            for i in range(first, min(first + _BLOCK_SIZE, end)):
+                bounds = self.bounds[i]
+                if bounds[2] >= min_row and bounds[1] <= max_col and bounds[3] >= min_col:
+                    yield from self.owners[i]
+
+def _columns_between(columns, min_col, max_col):
+    """Items of a {column: value} dict with min_col <= column <= max_col."""
+    if max_col - min_col < len(columns):
+        for column in range(min_col, max_col + 1):
+            if column in columns:
+                yield column, columns[column]
+    else:
+        for column, value in columns.items():
+            if min_col <= column <= max_col:
+                yield column, value
+
+class RowIntervals:
+    """
+    Set of rows stored as sorted disjoint [start, end] intervals, used to visit every row of
+    overlapping ranges only once.
+    """
+
+    def __init__(self):
+        self.starts = []
+        self.ends = []
+
+    def gaps(self, low, high):
+        """Parts of [low, high] not in the set, as a list of (low, high) tuples."""
+        starts, ends = self.starts, self.ends
+        gaps = []
+        cursor = low
+        for i in range(bisect_left(ends, low), bisect_right(starts, high)):
+            if cursor < starts[i]:
+                gaps.append((cursor, starts[i] - 1))
+            cursor = max(cursor, ends[i] + 1)
+        if cursor <= high:
+            gaps.append((cursor, high))
+        return gaps
+
+    def add(self, low, high):
+        starts, ends = self.starts, self.ends
+        first = bisect_left(ends, low - 1)
+        last = bisect_right(starts, high + 1)
+        if first < last:
+            low, high = min(low, starts[first]), max(high, ends[last - 1])
+        starts[first:last] = [low]
+        ends[first:last] = [high]
+
+    def claim(self, low, high):
+        """Adds [low, high] and returns the parts that were not in the set before."""
+        gaps = self.gaps(low, high)
+        self.add(low, high)
+        return gaps
+
+def _coalesce(cells):
+    """Groups (sheet, row, column) cells into (sheet, min_row, column, max_row, column) runs."""
+    areas = []
+    for sheet, row, column in sorted(cells, key=lambda cell: (cell[0], cell[2], cell[1])):
+        last = areas[-1] if areas else None
+        if last is not None and last[0] == sheet and last[2] == column and last[3] == row - 1:
+            areas[-1] = (sheet, last[1], column, row, column)
+        else:
+            areas.append((sheet, row, column, row, column))
+    return areas
+
+class FormulaGraph:
+    """
+    Precedents / dependents index of the formulas of a workbook, including cross-sheet references.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Cells are (sheet, row, column) tuples. Referenced ranges are kept as FormulaRef intervals
+    (sheet, min_row, min_col, max_row, max_col) and are never expanded into cells, so a SUM(A1:A100000)
+    costs one entry. The lookup indexes are built on the first query after add_formula().
+    """
+
+    def __init__(self, sheet_names=()):
+        self.formulas = {}  # (sheet, row, column) -> formula text
+        self._sheet_names = {name.lower(): name for name in sheet_names}
+        self._indexed = False
+
+    def _sheet(self, name):
+        # Excel compares sheet names case-insensitively
+        return self._sheet_names.setdefault(name.lower(), name)
+
+    def add_formula(self, sheet, row, column, formula):
+        """
+        Adds or replaces the formula of a cell.
+        """
+        self.formulas[(self._sheet(sheet), row, column)] = formula
+        self._indexed = False
+
+    def remove_formula(self, sheet, row, column):
+        """
+        Removes the formula of a cell, e.g. after it was overwritten with a value.
+        """
+        if self.formulas.pop((self._sheet(sheet), row, column), None) is not None:
+            self._indexed = False
+
+    def _references(self, cell):
+        return [FormulaRef(cell[0] if ref.sheet is None else self._sheet(ref.sheet), *ref[1:])
+                for ref in ex_formula_references(self.formulas[cell])]
+
+    def _build_index(self):
+        cells = {}          # sheet -> {(row, column): [dependent formula cells]}
+        ranges = {}         # sheet -> {(min_row, min_col, max_row, max_col): [dependent formula cells]}
+        formula_rows = {}   # sheet -> {column: sorted rows of formula cells}
+        for cell in self.formulas:
+            formula_rows.setdefault(cell[0], {}).setdefault(cell[2], []).append(cell[1])
+            for ref in self._references(cell):
+                if ref.min_row == ref.max_row and ref.min_col == ref.max_col:
+                    dependents = cells.setdefault(ref.sheet, {}).setdefault((ref.min_row, ref.min_col), [])
+                else:
+                    dependents = ranges.setdefault(ref.sheet, {}).setdefault(tuple(ref[1:]), [])
+                if not dependents or dependents[-1] != cell:
+                    dependents.append(cell)
+
+        cell_rows = {}      # sheet -> {column: sorted rows of referenced single cells}
+        for sheet, sheet_cells in cells.items():
+            columns = cell_rows[sheet] = {}
+            for row, column in sheet_cells:
+                columns.setdefault(column, []).append(row)
+        for columns in list(cell_rows.values()) + list(formula_rows.values()):
+            for rows in columns.values():
+                rows.sort()
+
+        column_ranges = {}  # sheet -> {column: _RangeIndex of the narrow ranges crossing it}
+        wide_ranges = {}    # sheet -> _RangeIndex of the other ranges
+        for sheet, sheet_ranges in ranges.items():
+            by_column, wide = {}, {}
+            for bounds, dependents in sheet_ranges.items():
+                if bounds[3] - bounds[1] < _NARROW_COLUMNS:
+                    for column in range(bounds[1], bounds[3] + 1):
+                        by_column.setdefault(column, {})[bounds] = dependents
+                else:
+                    wide[bounds] = dependents
+            column_ranges[sheet] = {column: _RangeIndex(items) for column, items in by_column.items()}
+            if wide:
+                wide_ranges[sheet] = _RangeIndex(wide)
+
+        self._cells = cells
+        self._cell_rows = cell_rows
+        self._column_ranges = column_ranges
+        self._wide_ranges = wide_ranges
+        self._formula_rows = formula_rows
+        self._indexed = True
+        logger.debug(f"Indexed {len(self.formulas)} formulas, "
+                      f"{sum(len(sheet_ranges) for sheet_ranges in ranges.values())} distinct ranges.")
+
+    def _dependents_of(self, sheet, min_row, min_col, max_row, max_col):
+        """Formula cells referencing at least one cell of the area (may repeat a cell)."""
+        sheet_cells = self._cells.get(sheet)
+        if sheet_cells:
+            if min_row == max_row and min_col == max_col:
+                yield from sheet_cells.get((min_row, min_col), ())
+            else:
+                for column, rows in _columns_between(self._cell_rows[sheet], min_col, max_col):
+                    for i in range(bisect_left(rows, min_row), bisect_right(rows, max_row)):
+                        yield from sheet_cells[(rows[i], column)]
+        for _, index in _columns_between(self._column_ranges.get(sheet, {}), min_col, max_col):
+            yield from index.overlapping(min_row, min_col, max_row, max_col)
+        if sheet in self._wide_ranges:
+            yield from self._wide_ranges[sheet].overlapping(min_row, min_col, max_row, max_col)
+
+    def precedents(self, sheet, row, column, transitive=False):
+        """
+        Returns the ranges a formula cell reads, as a list of FormulaRef.
+
+        With transitive=True, also follows the formulas found inside those ranges, so the result holds
+        every range that can change the value of the cell. Non-formula cells have no precedents.
+        """
+        if not self._indexed:
+            self._build_index()
+        start = (self._sheet(sheet), row, column)
+        if start not in self.formulas:
+            return []
+        if not transitive:
+            return self._references(start)
+
+        found = {}
+        covered = {}  # (sheet, column) -> rows whose formulas are already queued
+        queue = deque([start])
+        while queue:
+            for ref in self._references(queue.popleft()):
+                if ref in found:
+                    continue
+                found[ref] = None
+                columns = self._formula_rows.get(ref.sheet, {})
+                for formula_column, rows in _columns_between(columns, ref.min_col, ref.max_col):
+                    runs = covered.setdefault((ref.sheet, formula_column), RowIntervals())
+                    for low, high in runs.claim(ref.min_row, ref.max_row):
+                        for i in range(bisect_left(rows, low), bisect_right(rows, high)):
+                            queue.append((ref.sheet, rows[i], formula_column))
+        return list(found)
+
+    def dependents(self, sheet, row, column, max_row=None, max_column=None, transitive=False):
+        """
+        Returns the formula cells that reference a cell, or any cell of the area up to (max_row, max_column).
+
+        With transitive=True, also returns the formulas depending on those, i.e. everything that would
+        recalculate after a change. Results are (sheet, row, column) tuples sorted by sheet and position.
+        """
+        if not self._indexed:
+            self._build_index()
+        frontier = [(self._sheet(sheet), row, column, max_row or row, max_column or column)]
+
+        found = set()
+        while frontier:
+            new_cells = []
+            for area in frontier:
+                for cell in self._dependents_of(*area):
+                    if cell not in found:
+                        found.add(cell)
+                        new_cells.append(cell)
+            # Neighbouring cells found at the same depth are queried as one area
+            frontier = _coalesce(new_cells) if transitive else []
+        return sorted(found)
+
+@instrument
+def ex_build_formula_graph(file_path, sheet_names=None, engine="openpyxl"):
+    """
+    Builds the precedents / dependents graph of the formulas of a workbook.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Parameters:
+    - file_path: str or WorkbookSession
+        The path to the Excel file to read.
+        A WorkbookSession is read from its workbook while it has unsaved changes (see ex_session_source).
+    - sheet_names: list of str, optional
+        The sheets whose formulas are added. If not provided, every worksheet is read, which is needed
+        for dependents across sheets to be complete.
+    - engine: str, optional
+        'openpyxl' (default) reads the cached workbook; 'xml' (.xlsx only) streams the worksheet XML.
+        Both go through ex_iter_formulas.
+
+    Returns:
+    - FormulaGraph
+        Query it with precedents(sheet, row, column) and dependents(sheet, row, column), optionally with
+        transitive=True. If an error occurs, it is logged and the graph holds the sheets read so far.
+
+    Notes:
+    - References are parsed once per distinct formula text (see ex_formula_references). Defined names,
+      external and 3D references and INDIRECT/OFFSET targets are not followed.
+    """
+    graph = None
+    try:
+        file_path, engine = ex_session_source(file_path, engine)
+        if engine == "xml":
+            all_sheets = ex_read_sheet_names(file_path)
+        else:
+            all_sheets = [ws.title for ws in ex_load_workbook(file_path).worksheets]
+        graph = FormulaGraph(all_sheets)
+
+        for sheet_name in sheet_names or all_sheets:
+            for row, column, formula in ex_iter_formulas(file_path, sheet_name=sheet_name, engine=engine):
+                if isinstance(formula, str):
+                    graph.add_formula(sheet_name, row, column, formula)
+    except Exception as e:
+        logger.error(f"Error building the formula graph of '{file_path}': {e}")
+
+    graph = graph if graph is not None else FormulaGraph()
+    logger.info(f"Formula graph built with {len(graph.formulas)} formulas.")
+    return graph
+
+if __name__ == "__main__":
+    ex_configure_logging()
+    file_path = r"C:\Users\KNT15083\Downloads\521\summary.xlsx"
+    graph = ex_build_formula_graph(file_path)
+    print(graph.precedents("Sheet1", 10, 8, transitive=True))
+    print(graph.dependents("Sheet1", 2, 3, transitive=True))
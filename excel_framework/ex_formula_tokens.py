@@ -0,0 +1,107 @@
+from collections import namedtuple
+from functools import lru_cache
+
+FormulaRef = namedtuple("FormulaRef", ["sheet", "min_row", "min_col", "max_row", "max_col"])
+
+MAX_ROW = 1048576
+MAX_COLUMN = 16384
+
+@lru_cache(maxsize=65536)
+def ex_tokenize_formula(formula):
+    """
+    Splits a formula into tokens with openpyxl's Tokenizer, once per distinct formula text.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Parameters:
+    - formula: str
+        The formula text, e.g. "=SUM(A1:A3)".
+
+    Returns:
+    - tuple
+        A tuple of (value, type, subtype) tuples, e.g. (("SUM(", "FUNC", "OPEN"), ("A1:A3", "OPERAND", "RANGE"), ...).
+
+    Notes:
+    - Filled-down columns repeat the same few formula texts, so the result is cached (LRU, 65536 formulas).
+    """
+    from openpyxl.formula.tokenizer import Tokenizer
+
+    return tuple((token.value, token.type, token.subtype) for token in Tokenizer(formula).items)
+
+@lru_cache(maxsize=65536)
+def ex_formula_functions(formula):
+    """
+    Returns the upper-case names of the functions called by a formula, e.g. frozenset({"SUM", "IF"}).
+    The "_xlfn." / "_xlws." prefixes that newer functions carry in the file are removed.
+    """
+    names = set()
+    for value, token_type, subtype in ex_tokenize_formula(formula):
+        if token_type == "FUNC" and subtype == "OPEN":
+            name = value[:-1].upper()
+            for prefix in ("_XLFN.", "_XLWS."):
+                if name.startswith(prefix):
+                    name = name[len(prefix):]
+            names.add(name)
+    return frozenset(names)
+
+@lru_cache(maxsize=65536)
+def ex_formula_errors(formula):
+    """
+    Returns the error literals written in a formula, e.g. frozenset({"#N/A", "#REF!"}).
+    """
+    return frozenset(value.upper() for value, token_type, subtype in ex_tokenize_formula(formula)
+                     if token_type == "OPERAND" and subtype == "ERROR")
+
+def _split_sheet(reference):
+    sheet, separator, address = reference.rpartition("!")
+    if not separator:
+        return None, reference
+    if sheet.startswith("'") and sheet.endswith("'"):
+        sheet = sheet[1:-1].replace("''", "'")
+    return sheet, address
+
+@lru_cache(maxsize=65536)
+def ex_formula_references(formula):
+    """
+    Returns the cell and range references of a formula as intervals, without expanding ranges into cells.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Parameters:
+    - formula: str
+        The formula text, e.g. "=SUM(Sheet2!A1:A3)+B1".
+
+    Returns:
+    - tuple of FormulaRef
+        One (sheet, min_row, min_col, max_row, max_col) tuple per reference, in formula order. sheet is None
+        for references to the formula's own sheet. Whole columns (A:A) and rows (1:1) span the full sheet.
+
+    Notes:
+    - Defined names, table references, external workbooks ([1]Sheet!A1), 3D references (Sheet1:Sheet3!A1)
+      references built at run time (INDIRECT, OFFSET) and deleted references (#REF!) cannot be resolved
+      from the text and are skipped.
+    """
+    from openpyxl.utils import range_boundaries
+
+    references = []
+    for value, token_type, subtype in ex_tokenize_formula(formula):
+        if token_type != "OPERAND" or subtype != "RANGE" or value.startswith("[") or value.endswith("#REF!"):
+            continue
+        sheet, address = _split_sheet(value)
+        if not address or (sheet is not None and (sheet.startswith("[") or ":" in sheet)):
+            continue
+        try:
+            min_col, min_row, max_col, max_row = range_boundaries(address.replace("$", ""))
+        except (ValueError, TypeError):
+            continue  # defined name or table reference
+        min_row, max_row = min_row or 1, max_row or MAX_ROW
+        min_col, max_col = min_col or 1, max_col or MAX_COLUMN
+        references.append(FormulaRef(sheet, min(min_row, max_row), min(min_col, max_col),
+                                     max(min_row, max_row), max(min_col, max_col)))
+    return tuple(references)
+
+if __name__ == "__main__":
+    print(ex_tokenize_formula("=SUM(A1:A3)*2"))
+    print(ex_formula_references("=SUM('My Sheet'!$A$1:B3)+C:C+Rate"))
@@ -1,12 +1,10 @@
-import xlwings as xw
-import logging
 import time
+from .ex_logging import ex_configure_logging, ex_get_logger
+from .ex_telemetry import ex_count, instrument
 
-logging.basicConfig(
-        level=logging.DEBUG,
-        format='%(module)s | %(lineno)d | %(funcName)s | %(levelname)s | %(message)s',
-    )
+logger = ex_get_logger(__name__)
 
+@instrument
 def ex_insert_textbox(sheet, shape_name, textbox_content, 
                       position='A1', width=100, height=20, 
                       orientation=1, placement=3, 
@@ -99,11 +97,12 @@ def ex_insert_textbox(sheet, shape_name, textbox_content,
     - Logs an error message if an exception occurs during the insertion process.
     """
 
-    logging.debug(f"Starting to insert textbox '{shape_name}' in sheet '{sheet.name}' at position '{position}'.")
+    logger.debug(f"Starting to insert textbox '{shape_name}' in sheet '{sheet.name}' at position '{position}'.")
 
     try:
-        logging.debug(f"Processing sheet: {sheet.name}")
+        logger.debug(f"Processing sheet: {sheet.name}")
 
+        ex_count(com_calls=24)  # the fixed steps below: position, AddTextbox and the property writes
         left = sheet.range(position).left
         top = sheet.range(position).top
 
@@ -148,10 +147,12 @@ def ex_insert_textbox(sheet, shape_name, textbox_content,
 
         # Đặt màu nền
         if fill_color:
+            ex_count(com_calls=1)
             textbox.Fill.ForeColor.RGB = fill_color
 
         # Đặt màu văn bản
         if text_color:
+            ex_count(com_calls=1)
             text_frame.Characters().Font.Color = text_color
 
         # Đặt đường viền
@@ -161,8 +162,10 @@ def ex_insert_textbox(sheet, shape_name, textbox_content,
 
         # Đặt bóng
         if shadow:
+            ex_count(com_calls=2)  # Shadow, ShadowOffset
             textbox.Shadow = True
             if shadow_color:
+                ex_count(com_calls=1)
                 textbox.ShadowColor = shadow_color
             textbox.ShadowOffset = shadow_offset
 
@@ -178,13 +181,14 @@ def ex_insert_textbox(sheet, shape_name, textbox_content,
         # Đặt khóa
         textbox.Locked = locked
 
-        logging.debug(f"Added textbox '{shape_name}' with content '{textbox_content}' to sheet '{sheet.name}'.")
+        logger.debug(f"Added textbox '{shape_name}' with content '{textbox_content}' to sheet '{sheet.name}'.")
 
     except Exception as e:
-        logging.error(f"Error processing sheet '{sheet.name}': {e}")
+        logger.error(f"Error processing sheet '{sheet.name}': {e}")
         return f"Error processing sheet '{sheet.name}': {e}"
 
 if __name__ == '__main__':
+    ex_configure_logging()
     import os
     import sys
 
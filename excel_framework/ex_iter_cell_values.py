@@ -0,0 +1,75 @@
+from .ex_iter_populated_cells import ex_iter_populated_cells
+from .ex_workbook_cache import ex_load_workbook
+from .ex_workbook_session import ex_session_source
+from .ex_logging import ex_configure_logging
+from .ex_telemetry import ex_count
+
+def ex_iter_cell_values(file_path, sheet_name=None, find_range=None):
+    """
+    Streams the non-empty cell values of a sheet in an Excel workbook without loading it into memory.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Parameters:
+    - file_path: str or WorkbookSession
+        The path to the Excel file to read.
+        A WorkbookSession is read from its workbook while it has unsaved changes (see ex_session_source).
+    - sheet_name: str, optional
+        The name of the sheet to read. If not provided, the active sheet is used.
+    - find_range: str, optional
+        A string representing the range of cells to read (e.g., "A1:C10", "B:D" or "5:20").
+        Only the rows and columns inside the range are parsed. If not provided, the entire sheet is read.
+
+    Yields:
+    - tuple
+        A tuple (row, column, value) for every cell that holds a value, in row-major order.
+
+    Notes:
+    - The workbook is opened with read_only=True and rows are read as plain value tuples,
+      so no Cell objects are created and memory stays flat regardless of the sheet size.
+    - Formula cells yield the formula text (e.g. "=SUM(A1:A3)"), as in the default edit mode.
+    """
+    min_col = min_row = max_col = max_row = None
+    if find_range:
+        from openpyxl.utils import range_boundaries
+        min_col, min_row, max_col, max_row = range_boundaries(find_range)
+
+    file_path, engine = ex_session_source(file_path, "stream")
+    if engine == "openpyxl":
+        # Unsaved changes of a session: read the stored cells of its workbook without creating new ones
+        workbook = ex_load_workbook(file_path)
+        sheet = workbook[sheet_name] if sheet_name else workbook.active
+        scanned = 0
+        for row, column, cell in ex_iter_populated_cells(sheet, min_row or 1, min_col or 1, max_row, max_col):
+            scanned += 1
+            if cell.value is not None:
+                yield row, column, cell.value
+        ex_count(cells=scanned)
+        return
+
+    # Read-only workbooks are not cached: this generator owns the file handle and closes it when done
+    workbook = ex_load_workbook(file_path, read_only=True)
+    try:
+        sheet = workbook[sheet_name] if sheet_name else workbook.active
+        # The stored <dimension> is not always trustworthy, let the parser find the real bounds
+        sheet.reset_dimensions()
+
+        first_row = min_row or 1
+        first_col = min_col or 1
+        rows = sheet.iter_rows(min_row=first_row, max_row=max_row,
+                               min_col=first_col, max_col=max_col, values_only=True)
+
+        for i, row in enumerate(rows):
+            ex_count(cells=len(row))
+            for j, value in enumerate(row):
+                if value is not None:
+                    yield first_row + i, first_col + j, value
+    finally:
+        workbook.close()
+
+if __name__ == "__main__":
+    ex_configure_logging()
+    file_path = r"C:\Users\KNT15083\Downloads\521\summary.xlsx"
+    for row, column, value in ex_iter_cell_values(file_path, sheet_name=None, find_range="A1:H20"):
+        print(row, column, value)
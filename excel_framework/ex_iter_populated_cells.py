@@ -0,0 +1,49 @@
+def ex_iter_populated_cells(ws, min_row=1, min_col=1, max_row=None, max_col=None):
+    """
+    Iterates over the cells that already exist in a worksheet, without creating any new cell.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Parameters:
+    - ws: openpyxl.worksheet.worksheet.Worksheet
+        A worksheet loaded in edit mode (ws.cell() on such a sheet would create and store an empty cell
+        for every coordinate it touches).
+    - min_row, min_col: int, optional
+        The top-left corner of the area to read. Defaults to 1.
+    - max_row, max_col: int, optional
+        The bottom-right corner of the area to read. Defaults to ws.max_row / ws.max_column.
+
+    Yields:
+    - tuple
+        (row, column, cell) for every existing cell inside the bounds, in row-major order.
+        Cells with a value of None (e.g. formatted blanks) are included.
+
+    Notes:
+    - When the area is smaller than the number of stored cells, each coordinate is looked up directly;
+      otherwise the stored cells are filtered, so the cost follows the real data and not the area.
+    """
+    cells = ws._cells
+    max_row = ws.max_row if max_row is None else max_row
+    max_col = ws.max_column if max_col is None else max_col
+    if max_row < min_row or max_col < min_col:
+        return
+
+    area = (max_row - min_row + 1) * (max_col - min_col + 1)
+    if area <= len(cells):
+        for row in range(min_row, max_row + 1):
+            for column in range(min_col, max_col + 1):
+                cell = cells.get((row, column))
+                if cell is not None:
+                    yield row, column, cell
+    else:
+        inside = [key for key in cells
+                  if min_row <= key[0] <= max_row and min_col <= key[1] <= max_col]
+        for key in sorted(inside):
+            yield key[0], key[1], cells[key]
+
+if __name__ == "__main__":
+    import openpyxl
+    ws = openpyxl.load_workbook(r"C:\Users\KNT15083\Downloads\521\summary.xlsx").active
+    for row, column, cell in ex_iter_populated_cells(ws, 1, 1, 20, 8):
+        print(row, column, cell.value)
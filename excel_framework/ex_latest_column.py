@@ -0,0 +1,120 @@
+import zipfile
+
+from .ex_occupancy_index import OccupancyIndex, ex_get_occupancy_index
+from .ex_workbook_cache import ex_load_workbook
+from .ex_workbook_session import ex_session_source
+from .ex_xlsx_reader import ex_sheet_extent
+from .ex_logging import ex_configure_logging, ex_get_logger
+from .ex_telemetry import instrument
+
+logger = ex_get_logger(__name__)
+
+
+@instrument
+def ex_latest_column(file_path, sheet_name=None, row=None, column=None, engine="openpyxl", use_dimension=False, verify_dimension=False):
+    """
+    Retrieves the latest column with data from a specified sheet in an Excel workbook.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Parameters:
+    - file_path: str or WorkbookSession
+        The path to the Excel file from which to retrieve data, or a WorkbookSession. A session with unsaved
+        changes is always read from its workbook, whatever the engine (see ex_session_source).
+    - sheet_name: str, optional
+        The name of the sheet to search for the latest column. If not provided, the active sheet is used.
+    - row: int, optional
+        The specific row to start checking from. If provided, column must also be specified.
+    - column: int or str, optional
+        The column number (or letter) to check for data. If specified as a letter, it will be converted to a number.
+    - engine: str, optional
+        'openpyxl' (default) loads the workbook in edit mode.
+        'xml' (.xlsx only) answers from the sheet's OccupancyIndex (see ex_get_occupancy_index), built in one
+        pass over the worksheet XML and reused by later calls until the file changes. Best for repeated queries.
+    - use_dimension: bool, optional
+        If True and neither row nor column is given, the answer is read from the sheet's stored <dimension>
+        element through ex_sheet_extent instead of loading the workbook. Defaults to False: the element is
+        written by the last application that saved the file and may be stale or missing, so only enable it
+        for files written by Excel or openpyxl, or together with verify_dimension.
+    - verify_dimension: bool, optional
+        If True, the stored dimension is checked against the last populated cell. Defaults to False.
+
+    Returns:
+    - int
+        The index of the last column with data in the specified range. 
+        Returns 0 if the specified cell is empty, 1 if no columns are found, 
+        or the maximum column number if no specific conditions are met.
+
+    Raises:
+    - ValueError
+        If a column is specified without a corresponding row.
+    """
+
+    # The stored dimension is only read from a file that holds every change
+    dimension_source, dimension_engine = ex_session_source(file_path, "xml")
+    if use_dimension and row is None and column is None and dimension_engine == "xml":
+        try:
+            max_row, max_column = ex_sheet_extent(dimension_source, sheet_name, verify=verify_dimension)
+            logger.info(f"Last column in the sheet: {max_column}.")
+            return max_column
+        except (zipfile.BadZipFile, KeyError) as e:
+            logger.debug(f"Dimension fast path not available for '{file_path}': {e}")
+
+    # Check if only column is provided without a row
+    if column is not None and row is None:
+        raise ValueError("Row must be provided if column is specified.")
+
+    # Convert column from letter to number if necessary
+    if isinstance(column, str):
+        from openpyxl.utils import column_index_from_string
+        column = column_index_from_string(column)
+
+    file_path, engine = ex_session_source(file_path, engine)
+    if engine == "xml":
+        index = ex_get_occupancy_index(file_path, sheet_name)
+    else:
+        # Load the workbook and select the specified sheet
+        wb = ex_load_workbook(file_path)
+        ws = wb[sheet_name] if sheet_name else wb.active
+
+        # Only the row being asked about is indexed. Its cells are read from the stored cells:
+        # ws.cell() would create an empty cell for every coordinate probed and grow the (cached) sheet.
+        index = OccupancyIndex()
+        index.max_column = ws.max_column
+        if row is not None:
+            for (r, c), cell in ws._cells.items():
+                if r == row and cell.value is not None:
+                    index.set(r, c, cell.value)
+
+    # Get the last column with data in the sheet
+    last_column = index.last_column()
+    logger.debug(f"Last column in the sheet: {last_column}")
+
+    # If both row and column are provided, find the latest column with data from that cell
+    if row is not None and column is not None:
+        end = index.block_end_right(row, column)
+        if end == 0:
+            logger.info(f"Cell ({row}, {column}) is empty. Return 0")
+            return 0
+        if end < last_column:
+            logger.info(f"Last column with data from cell ({row}, {column}): {end}.")
+            return end  # The column before the first empty cell
+
+    # If only row is provided, find the last column with data in that row
+    if row is not None and index.last_column(row):
+        logger.info(f"Last column with data in row {row}: {index.last_column(row)}.")
+        return index.last_column(row)
+
+    logger.info(f"Last column in the sheet: {last_column}.")
+    return last_column
+
+
+if __name__ == "__main__":
+    ex_configure_logging()
+    file_path = r"C:\Users\KNT15083\Downloads\521\summary.xlsx"
+
+    lastcol_1 = ex_latest_column(file_path, sheet_name=None, row=None, column=None)
+    lastcol_2 = ex_latest_column(file_path, sheet_name=None, row=11, column=None)
+    lastcol_3 = ex_latest_column(file_path, sheet_name=None, row=11, column=8)
+    lastcol_4 = ex_latest_column(file_path, sheet_name=None, row=2, column="H")
@@ -0,0 +1,129 @@
+import logging
+import os
+
+LOGGER_NAME = "excel_framework"
+LOG_FORMAT = '%(asctime)s | %(module)s | %(lineno)d | %(funcName)s | %(levelname)s | %(message)s'
+
+def ex_get_logger(name):
+    """
+    Returns the logger of an ex_* module, a child of the "excel_framework" logger.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Parameters:
+    - name: str
+        The module name, usually __name__ (e.g. "ex_find_cells_with_text").
+
+    Returns:
+    - logging.Logger
+        The logger "excel_framework.<module>".
+
+    Notes:
+    - Getting a logger configures nothing: until ex_configure_logging (or the application's own logging setup)
+      is called, only warnings and errors are printed, by Python's last-resort handler.
+    """
+    return logging.getLogger(f"{LOGGER_NAME}.{name.rpartition('.')[2]}")
+
+def ex_configure_logging(level=None, log_file=None, fmt=LOG_FORMAT, stream=None):
+    """
+    Sets up the output of all ex_* modules in one place. Safe to call more than once.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Parameters:
+    - level: int or str, optional
+        The level to log at, e.g. logging.DEBUG or "DEBUG". Defaults to the EX_LOG_LEVEL environment
+        variable, or INFO if it is not set.
+    - log_file: str, optional
+        Writes the log to this file (UTF-8, appended) instead of the console.
+    - fmt: str, optional
+        The record format. Defaults to LOG_FORMAT (time | module | line | function | level | message).
+    - stream: file-like, optional
+        The console stream when no log_file is given. Defaults to sys.stderr.
+
+    Returns:
+    - logging.Logger
+        The configured "excel_framework" logger.
+
+    Notes:
+    - Only the "excel_framework" logger is touched; the root logger and other libraries keep their settings.
+    - A handler installed by an earlier call is replaced, so records are never printed twice.
+    """
+    if level is None:
+        level = os.environ.get("EX_LOG_LEVEL", "INFO")
+    if isinstance(level, str):
+        name = level.upper()
+        level = logging.getLevelName(name)
+        if not isinstance(level, int):
+            raise ValueError(f"Unknown logging level '{name}'.")
+
+    logger = logging.getLogger(LOGGER_NAME)
+    for handler in [handler for handler in logger.handlers if getattr(handler, "_ex_handler", False)]:
+        logger.removeHandler(handler)
+        handler.close()
+
+    handler = logging.FileHandler(log_file, encoding="utf-8") if log_file else logging.StreamHandler(stream)
+    handler.setFormatter(logging.Formatter(fmt))
+    handler._ex_handler = True
+    logger.addHandler(handler)
+    logger.setLevel(level)
+    logger.propagate = False
+    return logger
+
+class LogSampler:
+    """
+    Debug output for hot loops: logs the first few events, then one event in every N, then a summary.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Parameters:
+    - logger: logging.Logger
+        The logger to write to, e.g. the module logger from ex_get_logger.
+    - first: int, optional
+        The number of events logged before sampling starts. Defaults to 10.
+    - every: int, optional
+        After the first events, one event in every `every` is logged. Defaults to 10000.
+
+    Notes:
+    - `enabled` is read once, when the sampler is created. Loops test it before building any message
+      argument, so nothing is formatted per item unless DEBUG is on:
+
+          sampler = LogSampler(logger)
+          for cell in cells:
+              if sampler.enabled:
+                  sampler.debug("Checking cell %s", cell.coordinate)
+          sampler.summary("Checked cells")
+    - Messages use %-style arguments, which logging only formats for the records it actually emits.
+    """
+
+    def __init__(self, logger, first=10, every=10000):
+        self.logger = logger
+        self.first = first
+        self.every = every
+        self.count = 0
+        self.logged = 0
+        self.enabled = logger.isEnabledFor(logging.DEBUG)
+
+    def debug(self, msg, *args):
+        if not self.enabled:
+            return
+        self.count += 1
+        if self.count <= self.first or self.count % self.every == 0:
+            self.logged += 1
+            self.logger.debug(f"[{self.count}] {msg}", *args, stacklevel=2)
+
+    def summary(self, msg, *args):
+        if self.enabled:
+            self.logger.debug(f"{msg}: {self.count} events, {self.logged} logged.", *args, stacklevel=2)
+
+if __name__ == "__main__":
+    ex_configure_logging("DEBUG")
+    logger = ex_get_logger(__name__)
+    sampler = LogSampler(logger, first=3, every=250)
+    for i in range(1000):
+        if sampler.enabled:
+            sampler.debug("Item %d", i)
+    sampler.summary("Processed items")
@@ -0,0 +1,247 @@
+import os
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+
+from .ex_xlsx_reader import ex_iter_sheet_records
+from .ex_logging import ex_configure_logging, ex_get_logger
+from .ex_telemetry import instrument
+
+logger = ex_get_logger(__name__)
+
+def _runs_append(runs, index):
+    # Fast path while building: indexes arrive in ascending order
+    starts, ends = runs
+    if ends and ends[-1] >= index - 1:
+        if ends[-1] < index:
+            ends[-1] = index
+    else:
+        starts.append(index)
+        ends.append(index)
+
+def _runs_find(runs, index):
+    """Position of the run containing index, or -1."""
+    starts, ends = runs
+    pos = bisect_right(starts, index) - 1
+    if pos >= 0 and ends[pos] >= index:
+        return pos
+    return -1
+
+def _runs_add(runs, index):
+    starts, ends = runs
+    pos = bisect_right(starts, index) - 1
+    if pos >= 0 and ends[pos] >= index:
+        return
+    joins_left = pos >= 0 and ends[pos] == index - 1
+    joins_right = pos + 1 < len(starts) and starts[pos + 1] == index + 1
+    if joins_left and joins_right:
+        ends[pos] = ends[pos + 1]
+        del starts[pos + 1], ends[pos + 1]
+    elif joins_left:
+        ends[pos] = index
+    elif joins_right:
+        starts[pos + 1] = index
+    else:
+        starts.insert(pos + 1, index)
+        ends.insert(pos + 1, index)
+
+def _runs_remove(runs, index):
+    starts, ends = runs
+    pos = _runs_find(runs, index)
+    if pos < 0:
+        return
+    start, end = starts[pos], ends[pos]
+    if start == end:
+        del starts[pos], ends[pos]
+    elif index == start:
+        starts[pos] = index + 1
+    elif index == end:
+        ends[pos] = index - 1
+    else:
+        ends[pos] = index - 1
+        starts.insert(pos + 1, index + 1)
+        ends.insert(pos + 1, end)
+
+class OccupancyIndex:
+    """
+    Per-sheet index of which cells hold data, stored as sorted run-length lists per row and per column.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    A cell is occupied when it holds a value or a formula. max_row / max_column follow openpyxl and also
+    count cells that exist without data (e.g. formatted blanks).
+
+    Queries (last used row/column, end of a contiguous block) are a bisect on one run list, O(log n).
+    Use set() after writing a cell to keep an index built by hand in step with the sheet.
+    """
+
+    def __init__(self):
+        self.max_row = 1
+        self.max_column = 1
+        self._columns = {}  # column -> ([run starts], [run ends]) over rows
+        self._rows = {}     # row -> ([run starts], [run ends]) over columns
+
+    @classmethod
+    def from_records(cls, records):
+        """
+        Builds the index in one pass over (row, column, data_type, value, formula) records in row-major order,
+        as produced by ex_iter_sheet_records(..., include_empty=True).
+        """
+        index = cls()
+        columns, rows = index._columns, index._rows
+        max_column = 1
+        row = 1
+        for record in records:
+            row, column = record[0], record[1]
+            if column > max_column:
+                max_column = column
+            if record[3] is None and record[4] is None:
+                continue
+            column_runs = columns.get(column)
+            if column_runs is None:
+                column_runs = columns[column] = ([], [])
+            _runs_append(column_runs, row)
+            row_runs = rows.get(row)
+            if row_runs is None:
+                row_runs = rows[row] = ([], [])
+            _runs_append(row_runs, column)
+        index.max_row = row
+        index.max_column = max_column
+        return index
+
+    @classmethod
+    def from_worksheet(cls, ws):
+        """
+        Builds the index from an openpyxl worksheet loaded in edit mode, without creating any cell.
+        """
+        return cls.from_records((row, column, None, cell.value, None)
+                                for (row, column), cell in sorted(ws._cells.items()))
+
+    def set(self, row, column, value):
+        """
+        Records that a cell was written. value None marks it as empty.
+        """
+        self.max_row = max(self.max_row, row)
+        self.max_column = max(self.max_column, column)
+        if value is None:
+            if column in self._columns:
+                _runs_remove(self._columns[column], row)
+            if row in self._rows:
+                _runs_remove(self._rows[row], column)
+        else:
+            _runs_add(self._columns.setdefault(column, ([], [])), row)
+            _runs_add(self._rows.setdefault(row, ([], [])), column)
+
+    def is_occupied(self, row, column):
+        runs = self._columns.get(column)
+        return runs is not None and _runs_find(runs, row) >= 0
+
+    def last_row(self, column=None):
+        """
+        Last used row in a column (0 if the column is empty), or max_row if column is None.
+        """
+        if column is None:
+            return self.max_row
+        runs = self._columns.get(column)
+        return runs[1][-1] if runs and runs[1] else 0
+
+    def last_column(self, row=None):
+        """
+        Last used column in a row (0 if the row is empty), or max_column if row is None.
+        """
+        if row is None:
+            return self.max_column
+        runs = self._rows.get(row)
+        return runs[1][-1] if runs and runs[1] else 0
+
+    def block_end_down(self, row, column):
+        """
+        Last row of the contiguous block of used cells starting at (row, column), or 0 if that cell is empty.
+        """
+        runs = self._columns.get(column)
+        pos = _runs_find(runs, row) if runs else -1
+        return runs[1][pos] if pos >= 0 else 0
+
+    def block_end_right(self, row, column):
+        """
+        Last column of the contiguous block of used cells starting at (row, column), or 0 if that cell is empty.
+        """
+        runs = self._rows.get(row)
+        pos = _runs_find(runs, column) if runs else -1
+        return runs[1][pos] if pos >= 0 else 0
+
+_index_cache = OrderedDict()
+_index_lock = threading.Lock()
+_INDEX_CACHE_SIZE = 32
+
+@instrument
+def ex_get_occupancy_index(file_path, sheet_name=None):
+    """
+    Returns the OccupancyIndex of a sheet, building it in one streaming pass the first time.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Parameters:
+    - file_path: str
+        The path to the .xlsx / .xlsm file.
+    - sheet_name: str, optional
+        The name of the sheet. If not provided, the active sheet is used.
+
+    Returns:
+    - OccupancyIndex
+        The index, shared with later calls until the file changes on disk (keyed by path, mtime and size)
+        or ex_invalidate_occupancy_index drops it.
+
+    Notes:
+    - The writers of this package (WorkbookSession.save, ex_copy_range, ex_write_xlsx, FormulaEvaluator.save)
+      drop the indexes of the file they write, so an index is never reused across a rewrite that keeps the
+      same mtime and size. Code that writes the file by other means should call ex_invalidate_occupancy_index
+      (and ex_invalidate_sheet_frame for the SheetFrames of ex_read_sheet_frame).
+    """
+    abs_path = os.path.abspath(file_path)
+    stat = os.stat(abs_path)
+    key = (abs_path, stat.st_mtime_ns, stat.st_size, sheet_name)
+    with _index_lock:
+        index = _index_cache.get(key)
+        if index is not None:
+            _index_cache.move_to_end(key)
+            return index
+
+    index = OccupancyIndex.from_records(ex_iter_sheet_records(abs_path, sheet_name=sheet_name, include_empty=True))
+    logger.debug(f"Built occupancy index for '{abs_path}' ({index.max_row} rows, {index.max_column} columns).")
+    with _index_lock:
+        _index_cache[key] = index
+        while len(_index_cache) > _INDEX_CACHE_SIZE:
+            _index_cache.popitem(last=False)
+    return index
+
+@instrument
+def ex_invalidate_occupancy_index(file_path=None):
+    """
+    Removes the cached occupancy indexes of one file (every sheet), or clears them all.
+
+    Parameters:
+    - file_path: str, optional
+        The file whose indexes should be dropped. If not provided, all indexes are dropped.
+
+    Returns:
+    - int
+        The number of indexes removed.
+    """
+    with _index_lock:
+        if file_path is None:
+            keys = list(_index_cache)
+        else:
+            abs_path = os.path.abspath(file_path)
+            keys = [k for k in _index_cache if k[0] == abs_path]
+        for key in keys:
+            del _index_cache[key]
+    return len(keys)
+
+if __name__ == "__main__":
+    ex_configure_logging()
+    file_path = r"C:\Users\KNT15083\Downloads\521\summary.xlsx"
+    index = ex_get_occupancy_index(file_path)
+    print(index.last_row(8), index.last_column(11), index.block_end_down(2, 8))
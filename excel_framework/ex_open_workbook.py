@@ -1,14 +1,9 @@
-import xlwings as xw
-import logging
+from .ex_logging import ex_configure_logging, ex_get_logger
+from .ex_telemetry import ex_count, instrument
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(module)s | %(lineno)d | %(funcName)s | %(levelname)s | %(message)s',
-)
-
-import xlwings as xw
-import logging
+logger = ex_get_logger(__name__)
 
+@instrument
 def ex_open_workbook(file_path, read_only=False, password=None):
     """
     Opens an Excel workbook and returns the application and workbook objects.
@@ -34,14 +29,17 @@ def ex_open_workbook(file_path, read_only=False, password=None):
     - Logs an info message when the Excel file is opened successfully.
     - Logs an error message if the file cannot be opened, including specific messages for password-related issues.
     """
-    logging.debug(f"Starting to open the Excel file '{file_path}' with read_only={read_only}.")
+    import xlwings as xw
+    logger.debug(f"Starting to open the Excel file '{file_path}' with read_only={read_only}.")
 
+    ex_count(com_calls=2)  # start Excel, display_alerts
     app = xw.App(visible=False)
     app.display_alerts = False
 
     try:
+        ex_count(com_calls=1)
         workbook = app.books.open(file_path, password=password, read_only=read_only, ignore_read_only_recommended=True)
-        logging.info(f"The Excel file '{file_path}' is opened successfully.")
+        logger.info(f"The Excel file '{file_path}' is opened successfully.")
         return app, workbook
 
     except Exception as e:
@@ -49,10 +47,10 @@ def ex_open_workbook(file_path, read_only=False, password=None):
 
         if 'password' in str(e).lower():
             error_message = f"Failed to open the Excel file '{file_path}' because this file has been set with a password and cannot be opened."
-            logging.error(error_message)
+            logger.error(error_message)
         else:
             error_message = f"Failed to open the Excel file '{file_path}'. Error: {str(e)}"
-            logging.error(error_message)
+            logger.error(error_message)
 
         if 'workbook' in locals():
             workbook.close()
@@ -60,6 +58,7 @@ def ex_open_workbook(file_path, read_only=False, password=None):
     return False, False
 
 if __name__ == '__main__':
+    ex_configure_logging()
     try:
         file_path = r"C:\Users\KNT15083\Documents\Book1111.xlsx"
         file_path = r"C:\Users\KNT15083\Downloads\fffsda.xlsx"
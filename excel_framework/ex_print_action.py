@@ -1,10 +1,9 @@
-import logging
+from .ex_logging import ex_get_logger
+from .ex_telemetry import ex_count, instrument
 
-logging.basicConfig(
-        level=logging.DEBUG,
-        format='%(asctime)s | %(module)s | %(lineno)d | %(funcName)s | %(levelname)s | %(message)s',
-    )
+logger = ex_get_logger(__name__)
 
+@instrument
 def ex_print_action(sheet, 
                      action='check',  # 'check' or 'set'
                      left_margin=0, right_margin=0, top_margin=0, bottom_margin=0,
@@ -71,9 +70,10 @@ def ex_print_action(sheet,
     """
     error_list = []  # List to store errors
     try:
-        logging.debug(f"{action.capitalize()} print settings for sheet '{sheet.name}'.")
+        logger.debug(f"{action.capitalize()} print settings for sheet '{sheet.name}'.")
 
         if action == 'check':
+            ex_count(com_calls=17)  # one PageSetup property read per setting
             # Check margins
             if sheet.api.PageSetup.LeftMargin != left_margin:
                 error_list.append(f"Left margin is not {left_margin} (current: {sheet.api.PageSetup.LeftMargin})")
@@ -121,13 +121,18 @@ def ex_print_action(sheet,
                 error_list.append(f"FitToPagesTall is not {fit_to_pages_tall} (current: {sheet.api.PageSetup.FitToPagesTall})")
 
             if error_list:
-                logging.warning(f"Print settings check completed with errors for sheet '{sheet.name}': {error_list}")
+                logger.warning(f"Print settings check completed with errors for sheet '{sheet.name}': {error_list}")
                 return error_list  # Return error list if there are errors
             else:
-                logging.info(f"Print settings check completed successfully for sheet '{sheet.name}'.")
+                logger.info(f"Print settings check completed successfully for sheet '{sheet.name}'.")
                 return []  # Return empty list if no errors
 
         elif action == 'set':
+            # One PageSetup property write per given setting, plus Zoom
+            settings = (left_margin, right_margin, top_margin, bottom_margin, header_margin, footer_margin,
+                        left_header, center_header, right_header, left_footer, center_footer, right_footer,
+                        center_horizontally, center_vertically, paper_size, fit_to_pages_wide, fit_to_pages_tall)
+            ex_count(com_calls=1 + sum(value is not None for value in settings))
             # Set margins
             try:
                 if left_margin is not None:
@@ -194,12 +199,12 @@ def ex_print_action(sheet,
                 error_list.append(f"Error fitting to pages: {e}")
 
             if error_list:
-                logging.warning(f"Print settings updated with errors for sheet '{sheet.name}': {error_list}")
+                logger.warning(f"Print settings updated with errors for sheet '{sheet.name}': {error_list}")
                 return error_list  # Return error list if there are errors
             else:
-                logging.info(f"Print settings updated successfully for sheet '{sheet.name}'.")
+                logger.info(f"Print settings updated successfully for sheet '{sheet.name}'.")
                 return []  # Return empty list if no errors
 
     except Exception as sheet_error:
-        logging.error(f"Error processing print settings for sheet '{sheet.name}': {sheet_error}")
+        logger.error(f"Error processing print settings for sheet '{sheet.name}': {sheet_error}")
         return [f"Error processing print settings for sheet '{sheet.name}': {sheet_error}"]
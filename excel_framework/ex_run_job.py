@@ -0,0 +1,419 @@
+import argparse
+import json
+import os
+import time
+from contextlib import nullcontext
+
+from .ex_find_cells_with_text import ex_find_cells_with_text
+from .ex_latest_column import ex_latest_column
+from .ex_latest_row import ex_latest_row
+from .ex_workbook_cache import ex_load_workbook
+from .ex_workbook_session import WorkbookSession
+from .ex_logging import ex_configure_logging, ex_get_logger
+from .ex_telemetry import ex_count, ex_telemetry_scope
+
+logger = ex_get_logger(__name__)
+
+_PRINT_SETTINGS = ("left_margin", "right_margin", "top_margin", "bottom_margin", "header_margin", "footer_margin",
+                   "left_header", "center_header", "right_header", "left_footer", "center_footer", "right_footer",
+                   "center_horizontally", "center_vertically", "paper_size", "fit_to_pages_wide", "fit_to_pages_tall")
+
+# op -> (backend, accepted keys besides "op" and "file")
+# 'openpyxl' operations read the file (or the open edit-mode copy of a copy target); 'excel' operations
+# run against a workbook opened in Excel through xlwings.
+_OPERATIONS = {
+    "find": ("openpyxl", ("search_text", "sheet_name", "exact_match", "find_range", "engine")),
+    "latest_row": ("openpyxl", ("sheet_name", "row", "column", "engine", "use_dimension", "verify_dimension")),
+    "latest_column": ("openpyxl", ("sheet_name", "row", "column", "engine", "use_dimension", "verify_dimension")),
+    "copy_range": ("openpyxl", ("source_info", "target_info", "copy_styles", "translate_formulas")),
+    "sheet_action": ("excel", ("action", "new_sheet_name", "sheet_identifier")),
+    "print_settings": ("excel", ("sheet_name", "action") + _PRINT_SETTINGS),
+    "convert": ("excel", ("to", "output", "remove_source")),
+}
+
+def ex_load_job(file_path):
+    """
+    Reads a job file: a JSON or YAML (.yaml / .yml, needs PyYAML) document listing operations.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Parameters:
+    - file_path: str
+        The job file. Relative workbook paths inside it are resolved against its folder.
+
+    Returns:
+    - dict
+        The job, e.g.
+        {"name": "monthly", "copy_styles": False, "stop_on_error": False, "operations": [
+            {"op": "find", "file": "data.xlsx", "sheet_name": "Data", "search_text": "TOTAL", "engine": "xml"},
+            {"op": "latest_row", "file": "data.xlsx", "sheet_name": "Data", "column": "A"},
+            {"op": "copy_range", "source_info": ["data.xlsx", "Data", "A1:D10"], "target_info": ["report.xlsx", "Out", "B2"]},
+            {"op": "sheet_action", "file": "report.xlsx", "action": "rename_sheet", "sheet_identifier": "Out",
+             "new_sheet_name": "Result"},
+            {"op": "print_settings", "file": "report.xlsx", "sheet_name": "Result", "action": "set", "paper_size": 9},
+            {"op": "convert", "file": "report.xlsx", "to": "pdf"}]}
+        Every key of an operation besides "op" and "file" is passed to the matching ex_* function under the
+        same name (find: ex_find_cells_with_text, latest_row / latest_column, copy_range: ex_copy_range,
+        sheet_action: ex_sheet_action, print_settings: ex_print_action). convert takes "to" ("pdf" or
+        "xlsx"), "output" and "remove_source".
+
+    Raises:
+    - ImportError
+        If the file is YAML and PyYAML is not installed.
+    """
+    with open(file_path, encoding="utf-8") as f:
+        if file_path.lower().endswith((".yaml", ".yml")):
+            try:
+                import yaml
+            except ImportError as e:
+                raise ImportError("Reading a YAML job file needs PyYAML (pip install pyyaml); "
+                                  "use a .json job file otherwise.") from e
+            job = yaml.safe_load(f)
+        else:
+            job = json.load(f)
+    job.setdefault("base_dir", os.path.dirname(os.path.abspath(file_path)))
+    job.setdefault("name", os.path.splitext(os.path.basename(file_path))[0])
+    return job
+
+def _normalize_operation(index, operation, base_dir):
+    """
+    Validates one job entry and returns it with absolute paths and its backend, reads and writes.
+    """
+    operation = dict(operation)
+    kind = operation.pop("op", None)
+    if kind not in _OPERATIONS:
+        raise ValueError(f"Operation {index}: unknown op '{kind}'. Use one of {sorted(_OPERATIONS)}.")
+    backend, accepted = _OPERATIONS[kind]
+    file_path = operation.pop("file", None)
+    unknown = set(operation) - set(accepted)
+    if unknown:
+        raise ValueError(f"Operation {index} ({kind}): unknown keys {sorted(unknown)}.")
+
+    def resolve(path):
+        return os.path.abspath(os.path.join(base_dir, path))
+
+    if kind == "copy_range":
+        if "source_info" not in operation or "target_info" not in operation:
+            raise ValueError(f"Operation {index} (copy_range): source_info and target_info are required.")
+        source = (resolve(operation["source_info"][0]),) + tuple(operation["source_info"][1:])
+        target = (resolve(operation["target_info"][0]),) + tuple(operation["target_info"][1:])
+        operation.update(source_info=source, target_info=target)
+        file_path, reads, writes = target[0], {source[0]}, {target[0]}
+    else:
+        if not file_path:
+            raise ValueError(f"Operation {index} ({kind}): 'file' is required.")
+        file_path = resolve(file_path)
+        reads, writes = {file_path}, set()
+        if kind == "sheet_action" or (kind == "print_settings" and operation.get("action") == "set"):
+            writes = {file_path}
+        elif kind == "convert":
+            if operation.get("to") not in ("pdf", "xlsx"):
+                raise ValueError(f"Operation {index} (convert): 'to' must be 'pdf' or 'xlsx'.")
+            output = operation.get("output") or os.path.splitext(file_path)[0] + "." + operation["to"]
+            operation["output"] = resolve(output)
+            writes = {operation["output"]}
+            if operation.get("remove_source"):
+                writes.add(file_path)
+
+    return {"index": index, "op": kind, "backend": backend, "file": file_path, "args": operation,
+            "reads": reads, "writes": writes}
+
+def ex_plan_job(job):
+    """
+    Groups the operations of a job into stages, so each workbook is opened once per stage.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Parameters:
+    - job: dict
+        A job as returned by ex_load_job.
+
+    Returns:
+    - list of dict
+        The stages in execution order: {"backend": "openpyxl" or "excel", "operations": [...], "reads": set,
+        "writes": set}. Each operation is the normalized job entry with its "index" in the job file.
+
+    Raises:
+    - ValueError
+        If an operation is unknown or misses a required key. Nothing has been run at that point.
+
+    Notes:
+    - An operation joins the latest stage of its backend unless a stage in between touches a file it writes,
+      or writes a file it reads; otherwise it starts a new stage. Operations on unrelated files can therefore
+      run out of file order, operations on the same file never do.
+    - An openpyxl stage holds the targets of its copies in WorkbookSessions and saves them at its end; find and
+      latest_row / latest_column on such a file read the session, so they see the copies made before them.
+    """
+    base_dir = job.get("base_dir", os.getcwd())
+    operations = [_normalize_operation(index, operation, base_dir)
+                  for index, operation in enumerate(job.get("operations", []))]
+    stages = []
+    for operation in operations:
+        chosen = None
+        for stage in reversed(stages):
+            if stage["backend"] == operation["backend"]:
+                chosen = stage
+                break
+            if operation["writes"] & (stage["reads"] | stage["writes"]) or operation["reads"] & stage["writes"]:
+                break
+        if chosen is None:
+            chosen = {"backend": operation["backend"], "operations": [], "reads": set(), "writes": set()}
+            stages.append(chosen)
+        chosen["operations"].append(operation)
+        chosen["reads"] |= operation["reads"]
+        chosen["writes"] |= operation["writes"]
+
+    logger.debug(f"Planned {len(operations)} operations in {len(stages)} stages.")
+    return stages
+
+class _OpenpyxlStage:
+    """
+    Runs the openpyxl operations of one stage. Every copy target is held by a WorkbookSession: it is loaded once,
+    later operations of the stage read it from memory and it is saved once at the end, only if it changed.
+    Sources and searched files come from the shared workbook cache or the streaming readers.
+    """
+    def __init__(self, job, report):
+        self.job = job
+        self.report = report
+        self.sessions = {}  # absolute path -> WorkbookSession of each copy target
+        self.style_maps = {}  # (source path, target path) -> source style -> target style
+
+    def run(self, operation):
+        """
+        Runs one operation and returns (result, changed).
+        """
+        kind, args, path = operation["op"], operation["args"], operation["file"]
+        source = self.sessions.get(path, path)
+        if kind == "find":
+            return ex_find_cells_with_text(source, **args), False
+        if kind == "latest_row":
+            return ex_latest_row(source, **args), False
+        if kind == "latest_column":
+            return ex_latest_column(source, **args), False
+
+        from .ex_copy_range import ex_copy_range_between_sheets
+
+        source_path, source_sheet_name, source_range = args["source_info"]
+        target_path, target_sheet_name, target_start_cell = args["target_info"]
+        source_wb = ex_load_workbook(self.sessions.get(source_path, source_path))
+        target = self.sessions.setdefault(target_path, WorkbookSession(target_path))
+        if not target.is_loaded:
+            start = time.perf_counter()
+            target.workbook
+            self.report["workbooks"].append({"file": target_path, "backend": "openpyxl",
+                                             "load_seconds": round(time.perf_counter() - start, 4)})
+        copied = ex_copy_range_between_sheets(
+            source_wb[source_sheet_name], source_range, target.edit_sheet(target_sheet_name, create=True),
+            target_start_cell,
+            copy_styles=args.get("copy_styles", self.job.get("copy_styles", False)),
+            style_map=self.style_maps.setdefault((source_path, target_path), {}),
+            translate_formulas=args.get("translate_formulas", self.job.get("translate_formulas", False)))
+        return copied, True
+
+    def close(self):
+        for path, session in self.sessions.items():
+            start = time.perf_counter()
+            if session.save():
+                self.report["saves"].append({"file": path, "seconds": round(time.perf_counter() - start, 4)})
+            session.close()
+        self.sessions.clear()
+
+class _ExcelStage:
+    """
+    Runs the Excel operations of one stage in a single hidden Excel instance. Each workbook is opened once and
+    saved at the end only if an operation changed it.
+    """
+    def __init__(self, job, report):
+        self.job = job
+        self.report = report
+        self.app = None
+        self.books = {}  # absolute path -> xlwings workbook
+        self.dirty = set()
+        self.remove_after = []
+
+    def _book(self, path):
+        if path not in self.books:
+            import xlwings as xw
+
+            start = time.perf_counter()
+            if self.app is None:
+                ex_count(com_calls=2)
+                self.app = xw.App(visible=False)
+                self.app.display_alerts = False
+            ex_count(com_calls=1)
+            self.books[path] = self.app.books.open(path, ignore_read_only_recommended=True)
+            self.report["workbooks"].append({"file": path, "backend": "excel",
+                                             "load_seconds": round(time.perf_counter() - start, 4)})
+        return self.books[path]
+
+    def run(self, operation):
+        """
+        Runs one operation and returns (result, changed).
+        """
+        from .ex_print_action import ex_print_action
+        from .ex_sheet_action import ex_sheet_action
+
+        kind, args, path = operation["op"], dict(operation["args"]), operation["file"]
+        wb = self._book(path)
+        if kind == "sheet_action":
+            done = ex_sheet_action(wb, args["action"], new_sheet_name=args.get("new_sheet_name"),
+                                   sheet_identifier=args.get("sheet_identifier"))
+            if not done:
+                raise RuntimeError(f"Sheet action '{args['action']}' failed, see the log.")
+            self.dirty.add(path)
+            return done, True
+        if kind == "print_settings":
+            sheet_name = args.pop("sheet_name", None)
+            ex_count(com_calls=1)
+            sheet = wb.sheets[sheet_name] if sheet_name else wb.sheets.active
+            errors = ex_print_action(sheet, **args)
+            changed = args.get("action") == "set"
+            if changed:
+                self.dirty.add(path)
+            return errors, changed
+
+        # convert
+        if args["to"] == "pdf":
+            ex_count(com_calls=1)
+            wb.to_pdf(args["output"])
+            logger.info(f"Conversion to PDF completed! File saved at: {args['output']}")
+            return args["output"], False
+        # Saving under the new name moves the open workbook (and its pending changes) to the new file
+        ex_count(com_calls=2)
+        wb.save(args["output"])
+        wb.close()
+        del self.books[path]
+        self.dirty.discard(path)
+        if args.get("remove_source"):
+            self.remove_after.append(path)
+        logger.info(f"Successfully converted {path} to {args['output']}.")
+        return args["output"], True
+
+    def close(self):
+        from .ex_close_workbook import ex_close_workbook
+
+        if self.app is not None and not self.books:
+            ex_count(com_calls=1)
+            self.app.quit()  # every workbook was converted and closed already
+        # ex_close_workbook quits Excel once its last workbook is closed
+        for path, wb in list(self.books.items()):
+            start = time.perf_counter()
+            ex_close_workbook(self.app, wb, save_on_close=path in self.dirty)
+            if path in self.dirty:
+                self.report["saves"].append({"file": path, "seconds": round(time.perf_counter() - start, 4)})
+        self.books.clear()
+        for path in self.remove_after:
+            os.remove(path)
+            logger.info(f"Original file {path} has been deleted.")
+
+def ex_run_job(job, telemetry_path=None):
+    """
+    Runs a job: every workbook is opened once per stage, the operations run against the open workbook and only
+    the workbooks that changed are saved.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Parameters:
+    - job: dict or str
+        A job (see ex_load_job) or the path of a job file. Besides "operations" it may set "name",
+        "copy_styles" and "translate_formulas" (defaults for every copy_range), and "stop_on_error".
+    - telemetry_path: str, optional
+        If given, the ex_* calls of the job are measured and appended to this JSON-lines file
+        (see ex_telemetry_scope).
+
+    Returns:
+    - dict
+        The report: {"job", "seconds", "stages", "operations", "workbooks", "saves"}. Each operation entry holds
+        its index, op, file, stage, seconds, changed and either result or error; "workbooks" lists the loads done
+        by the runner and "saves" every file written, with their times.
+
+    Raises:
+    - ValueError
+        If the job is invalid (see ex_plan_job).
+
+    Notes:
+    - A failing operation is logged and reported, the others still run, unless "stop_on_error" is set.
+      Workbooks changed by earlier operations are saved in both cases.
+    - find, latest_row and latest_column go through the workbook cache, so several searches of one file load it
+      only once (or not at all with the 'xml' / 'shared_strings' engines).
+    """
+    if isinstance(job, str):
+        job = ex_load_job(job)
+    stages = ex_plan_job(job)
+    report = {"job": job.get("name"), "seconds": None, "operations": [], "workbooks": [], "saves": [],
+              "stages": [{"backend": stage["backend"], "operations": [op["index"] for op in stage["operations"]]}
+                         for stage in stages]}
+
+    job_start = time.perf_counter()
+    with ex_telemetry_scope(job=job.get("name"), export_path=telemetry_path) if telemetry_path else nullcontext():
+        stopped = False
+        for number, stage in enumerate(stages):
+            if stopped:
+                break
+            runner = (_OpenpyxlStage if stage["backend"] == "openpyxl" else _ExcelStage)(job, report)
+            try:
+                for operation in stage["operations"]:
+                    entry = {"index": operation["index"], "op": operation["op"], "file": operation["file"],
+                             "stage": number}
+                    start = time.perf_counter()
+                    try:
+                        entry["result"], entry["changed"] = runner.run(operation)
+                    except Exception as e:
+                        entry["error"], entry["changed"] = f"{type(e).__name__}: {e}", False
+                        logger.error(f"Operation {operation['index']} ({operation['op']}) failed: {e}")
+                    entry["seconds"] = round(time.perf_counter() - start, 4)
+                    report["operations"].append(entry)
+                    if "error" in entry and job.get("stop_on_error"):
+                        stopped = True
+                        break
+            finally:
+                runner.close()
+
+    report["operations"].sort(key=lambda entry: entry["index"])
+    report["seconds"] = round(time.perf_counter() - job_start, 4)
+    failed = sum("error" in entry for entry in report["operations"])
+    logger.info(f"Job '{report['job']}': {len(report['operations'])} operations in {len(stages)} stages, "
+                f"{len(report['saves'])} files saved, {failed} failed, {report['seconds']} s.")
+    return report
+
+def _print_report(report):
+    print(f"{'#':>4} {'op':<15} {'stage':>5} {'seconds':>9}  file / result")
+    for entry in report["operations"]:
+        outcome = entry.get("error") or entry.get("result")
+        if isinstance(outcome, list) and len(outcome) > 5:
+            outcome = f"{len(outcome)} items"
+        print(f"{entry['index']:>4} {entry['op']:<15} {entry['stage']:>5} {entry['seconds']:>9.4f}  "
+              f"{os.path.basename(entry['file'])}: {outcome}")
+    for save in report["saves"]:
+        print(f"saved {save['file']} in {save['seconds']} s")
+    print(f"total {report['seconds']} s")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a JSON/YAML job of ex_* operations.")
+    parser.add_argument("job", help="the job file (.json, .yaml or .yml)")
+    parser.add_argument("--plan", action="store_true", help="only print the stages, run nothing")
+    parser.add_argument("--report", default=None, help="write the report to this JSON file")
+    parser.add_argument("--telemetry", default=None, help="append per-call telemetry to this JSON-lines file")
+    parser.add_argument("--log-level", default=None)
+    args = parser.parse_args(argv)
+    ex_configure_logging(args.log_level)
+
+    job = ex_load_job(args.job)
+    if args.plan:
+        for number, stage in enumerate(ex_plan_job(job)):
+            print(f"stage {number} ({stage['backend']}): "
+                  + ", ".join(f"#{op['index']} {op['op']}" for op in stage["operations"]))
+        return 0
+
+    report = ex_run_job(job, telemetry_path=args.telemetry)
+    _print_report(report)
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False, default=str)
+    return 1 if any("error" in entry for entry in report["operations"]) else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
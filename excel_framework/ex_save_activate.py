@@ -1,13 +1,10 @@
-import xlwings as xw
-import pygetwindow as gw
-import logging
 import time
+from .ex_logging import ex_configure_logging, ex_get_logger
+from .ex_telemetry import ex_count, instrument
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(module)s | %(lineno)d | %(funcName)s | %(levelname)s | %(message)s',
-)
+logger = ex_get_logger(__name__)
 
+@instrument
 def ex_save_activate(file_path):
     """
     Saves the currently active workbook in the active Excel application to a specified file path.
@@ -31,44 +28,51 @@ def ex_save_activate(file_path):
     - Logs a warning if a TypeError is encountered during saving, and attempts to save again.
     - Logs debug information when the workbook is closed.
     """
+    import pygetwindow as gw
+    import xlwings as xw
     # Define the name of the Excel application window
     excel_window_name = "Excel"
-    logging.debug("Checking for active Excel window...")
+    logger.debug("Checking for active Excel window...")
 
     # Get the active window
     active_window = gw.getActiveWindow()
 
     # Check if the active window title contains "Excel"
     while active_window is None or excel_window_name not in active_window.title:
-        logging.debug("Waiting for Excel to be the active application...")
+        logger.debug("Waiting for Excel to be the active application...")
         time.sleep(1)
         active_window = gw.getActiveWindow()
 
-    logging.info("Excel is now the active application.")
+    logger.info("Excel is now the active application.")
 
     # Connect to the active Excel application
+    ex_count(com_calls=2)  # active app, active workbook
     app = xw.apps.active
     # Get the active workbook
     wb = app.books.active
 
     # Save the active workbook to the specified file path
-    logging.debug(f"Saving workbook to {file_path}...")
+    logger.debug(f"Saving workbook to {file_path}...")
 
     try:
+        ex_count(com_calls=1)
         wb.save(file_path)
-        logging.info(f"Workbook saved successfully to {file_path}.")
+        logger.info(f"Workbook saved successfully to {file_path}.")
     except TypeError:
-        logging.warning("TypeError encountered while saving. Attempting to save without compatibility checks...")
+        logger.warning("TypeError encountered while saving. Attempting to save without compatibility checks...")
+        ex_count(com_calls=1)
         wb.save(file_path)
-        logging.info(f"Workbook saved successfully to {file_path} after handling TypeError.")
+        logger.info(f"Workbook saved successfully to {file_path} after handling TypeError.")
 
     # Close the workbook
+    ex_count(com_calls=2)  # close, quit
     wb.close()
     app.quit()
 
-    logging.debug("Workbook closed.")
+    logger.debug("Workbook closed.")
 
 if __name__ == '__main__':
+    ex_configure_logging()
     file_path = r"C:\exeBuild\2D Drawing Download\save.xlsx"
     ex_save_activate(file_path)
 
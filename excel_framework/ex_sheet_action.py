@@ -1,16 +1,9 @@
-import logging
-logging.basicConfig(
-        level=logging.DEBUG,
-        format='%(module)s | %(lineno)d | %(funcName)s | %(levelname)s | %(message)s',
-    )
+from .ex_logging import ex_configure_logging, ex_get_logger
+from .ex_telemetry import ex_count, instrument
 
-import xlwings as xw
-
-from openpyxl import load_workbook
-
-from PIL import Image
-Image.MAX_IMAGE_PIXELS = None
+logger = ex_get_logger(__name__)
 
+@instrument
 def ex_sheet_action(wb, action, new_sheet_name=None, sheet_identifier=None):
     """
     Performs specified actions on a sheet within a given Excel workbook.
@@ -44,16 +37,17 @@ def ex_sheet_action(wb, action, new_sheet_name=None, sheet_identifier=None):
     - Logs an error message if required parameters are missing or if an unknown action is specified.
     - Logs info messages when actions are successfully completed, such as creating, renaming, moving, deleting, copying, hiding, or unhiding sheets.
     """
-    logging.debug(f"Performing action '{action}' on workbook: {wb.name}")
+    logger.debug(f"Performing action '{action}' on workbook: {wb.name}")
 
     try:
         if action == 'create_sheet':
             if new_sheet_name:
+                ex_count(com_calls=1)
                 wb.sheets.add(new_sheet_name)
-                logging.info(f"Created new sheet: '{new_sheet_name}' in workbook '{wb.name}'.")
+                logger.info(f"Created new sheet: '{new_sheet_name}' in workbook '{wb.name}'.")
                 return True
             else:
-                logging.error("New sheet name must be provided for creating a sheet.")
+                logger.error("New sheet name must be provided for creating a sheet.")
                 return False
 
         elif action == 'rename_sheet':
@@ -63,22 +57,24 @@ def ex_sheet_action(wb, action, new_sheet_name=None, sheet_identifier=None):
                 else:
                     sheet = wb.sheets[sheet_identifier]
                 
+                ex_count(com_calls=2)  # look up the sheet, rename it
                 sheet.name = new_sheet_name
-                logging.info(f"Renamed sheet '{sheet_identifier}' to '{new_sheet_name}' in workbook '{wb.name}'.")
+                logger.info(f"Renamed sheet '{sheet_identifier}' to '{new_sheet_name}' in workbook '{wb.name}'.")
                 return True
             else:
-                logging.error("Both sheet identifier and new sheet name must be provided for renaming.")
+                logger.error("Both sheet identifier and new sheet name must be provided for renaming.")
                 return False
 
         elif action == 'move_sheet':
             if sheet_identifier and isinstance(sheet_identifier, int) and new_sheet_name in wb.sheetnames:
                 sheet = wb.sheets[sheet_identifier]
                 target_sheet = wb.sheets[new_sheet_name]
+                ex_count(com_calls=4)  # sheet names, both sheets, Move
                 sheet.api.Move(Before=target_sheet.api)  # Di chuyển sheet trước sheet mục tiêu
-                logging.info(f"Moved sheet '{sheet.name}' before '{target_sheet.name}' in workbook '{wb.name}'.")
+                logger.info(f"Moved sheet '{sheet.name}' before '{target_sheet.name}' in workbook '{wb.name}'.")
                 return True
             else:
-                logging.error("Valid sheet identifier and target sheet name must be provided for moving.")
+                logger.error("Valid sheet identifier and target sheet name must be provided for moving.")
                 return False
 
         elif action == 'delete_sheet':
@@ -88,11 +84,12 @@ def ex_sheet_action(wb, action, new_sheet_name=None, sheet_identifier=None):
                 else:
                     sheet = wb.sheets[sheet_identifier]
                 
+                ex_count(com_calls=2)  # look up the sheet, delete it
                 sheet.delete()
-                logging.info(f"Deleted sheet '{sheet.name}' from workbook '{wb.name}'.")
+                logger.info(f"Deleted sheet '{sheet.name}' from workbook '{wb.name}'.")
                 return True
             else:
-                logging.error("Sheet identifier must be provided for deleting a sheet.")
+                logger.error("Sheet identifier must be provided for deleting a sheet.")
                 return False
 
         elif action == 'copy_sheet':
@@ -102,12 +99,13 @@ def ex_sheet_action(wb, action, new_sheet_name=None, sheet_identifier=None):
                 else:
                     sheet = wb.sheets[sheet_identifier]
 
+                ex_count(com_calls=4)  # look up the sheet, last sheet, copy, rename
                 sheet.copy(after=wb.sheets[-1]) 
                 wb.sheets[-1].name = new_sheet_name
-                logging.info(f"Copied sheet '{sheet.name}' to new sheet '{new_sheet_name}' in workbook '{wb.name}'.")
+                logger.info(f"Copied sheet '{sheet.name}' to new sheet '{new_sheet_name}' in workbook '{wb.name}'.")
                 return True
             else:
-                logging.error("Both sheet identifier and new sheet name must be provided for copying.")
+                logger.error("Both sheet identifier and new sheet name must be provided for copying.")
                 return False
 
         elif action == 'hide_sheet':
@@ -117,11 +115,12 @@ def ex_sheet_action(wb, action, new_sheet_name=None, sheet_identifier=None):
                 else:
                     sheet = wb.sheets[sheet_identifier]
 
+                ex_count(com_calls=2)  # look up the sheet, set Visible
                 sheet.api.Visible = 0
-                logging.info(f"Hid sheet '{sheet.name}' in workbook '{wb.name}'.")
+                logger.info(f"Hid sheet '{sheet.name}' in workbook '{wb.name}'.")
                 return True
             else:
-                logging.error("Sheet identifier must be provided for hiding a sheet.")
+                logger.error("Sheet identifier must be provided for hiding a sheet.")
                 return False
 
         elif action == 'unhide_sheet':
@@ -131,22 +130,25 @@ def ex_sheet_action(wb, action, new_sheet_name=None, sheet_identifier=None):
                 else:
                     sheet = wb.sheets[sheet_identifier]
 
+                ex_count(com_calls=2)  # look up the sheet, set Visible
                 sheet.api.Visible = -1
-                logging.info(f"Unhid sheet '{sheet.name}' in workbook '{wb.name}'.")
+                logger.info(f"Unhid sheet '{sheet.name}' in workbook '{wb.name}'.")
                 return True
             else:
-                logging.error("Sheet identifier must be provided for unhiding a sheet.")
+                logger.error("Sheet identifier must be provided for unhiding a sheet.")
                 return False
 
         else:
-            logging.error(f"Unknown action: {action}")
+            logger.error(f"Unknown action: {action}")
             return False
 
     except Exception as e:
-        logging.error(f"Error performing action '{action}' on workbook '{wb.name}': {e}")
+        logger.error(f"Error performing action '{action}' on workbook '{wb.name}': {e}")
         return False
     
 if __name__ == "__main__":
+    ex_configure_logging()
+    import xlwings as xw
     app = xw.App(visible=False)
     wb = app.books.open(r"C:\Users\KNT15083\Downloads\FY24_Q3_UV2小林-3殿宛_1812 _original\RN02753\検討書\TR-V2-S24023.xlsx")
 
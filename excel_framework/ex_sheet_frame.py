@@ -0,0 +1,450 @@
+import os
+import sys
+from array import array
+from datetime import datetime
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError("SheetFrame needs NumPy (pip install numpy).") from e
+
+from .ex_iter_populated_cells import ex_iter_populated_cells
+from .ex_sheet_frame_cache import _get_frame, _put_frame
+from .ex_workbook_cache import ex_load_workbook
+from .ex_workbook_session import ex_session_source
+from .ex_xlsx_reader import SheetRecord, ex_iter_sheet_records
+from .ex_logging import ex_configure_logging, ex_get_logger
+from .ex_telemetry import instrument
+
+logger = ex_get_logger(__name__)
+
+# Cell kinds, stored as one uint8 per cell
+EMPTY, INTEGER, FLOAT, BOOL, STRING, ERROR, FORMULA, DATE, OBJECT = range(9)
+_NUMERIC_KINDS = (INTEGER, FLOAT)
+_CODED_KINDS = (STRING, ERROR, FORMULA)  # held as codes into the string dictionary
+
+# Characters str() can produce for each kind, to skip kinds a partial search cannot match
+_NUMBER_TEXT = frozenset("0123456789.-+einfa")
+_DATE_TEXT = frozenset("0123456789-: .")
+
+def _column_number(column):
+    if isinstance(column, str):
+        from openpyxl.utils import column_index_from_string
+        return column_index_from_string(column)
+    return column
+
+class _Column:
+    """
+    The cells of one sheet column, one entry per frame row. Only the arrays its kinds need are allocated.
+    """
+    __slots__ = ("kinds", "numbers", "codes", "dates", "objects")
+
+    def __init__(self, kinds):
+        self.kinds = kinds  # uint8, EMPTY where the cell has no value (the null mask)
+        self.numbers = None  # float64, the value of INTEGER / FLOAT / BOOL cells, NaN elsewhere
+        self.codes = None  # int32, index into SheetFrame.strings for STRING / ERROR / FORMULA cells, -1 elsewhere
+        self.dates = None  # datetime64[us] of DATE cells, NaT elsewhere
+        self.objects = None  # frame row -> value for OBJECT cells (date, time, timedelta, ...)
+
+    @property
+    def nbytes(self):
+        total = self.kinds.nbytes
+        for values in (self.numbers, self.codes, self.dates):
+            if values is not None:
+                total += values.nbytes
+        return total + (sys.getsizeof(self.objects) if self.objects else 0)
+
+class SheetFrame:
+    """
+    A sheet held as typed NumPy columns instead of Cell objects, for vectorized searches and queries.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Attributes:
+    - min_row, min_col, max_row, max_col: int
+        The area covered by the frame (1-based, inclusive). max_row / max_col are 0 for an empty frame.
+    - strings: list of str
+        The string dictionary: every distinct text, error literal and (with formulas=True) formula text.
+    - columns: dict
+        Sheet column number -> _Column. Columns without any value are absent.
+
+    Notes:
+    - Each cell costs 1 byte for its kind plus 8 bytes in number / date columns and 4 bytes in text columns,
+      so a 1M-cell sheet takes tens of MB (openpyxl needs several hundred bytes per Cell).
+    - Numbers are float64: integers above 2**53 lose precision.
+    - Build it with ex_read_sheet_frame, or SheetFrame.from_records for records already at hand.
+    """
+    def __init__(self, min_row=1, min_col=1, max_row=0, max_col=0):
+        self.min_row, self.min_col, self.max_row, self.max_col = min_row, min_col, max_row, max_col
+        self.strings = []
+        self.columns = {}
+
+    def __repr__(self):
+        return (f"SheetFrame(rows {self.min_row}-{self.max_row}, columns {self.min_col}-{self.max_col}, "
+                f"{len(self.strings)} strings, {self.nbytes / 2**20:.1f} MB)")
+
+    @classmethod
+    def from_records(cls, records, formulas=False):
+        """
+        Builds a frame in one pass over SheetRecord tuples (see ex_iter_sheet_records), in any order.
+
+        Parameters:
+        - records: iterable of SheetRecord
+            The cells to hold. Cells without a value are skipped.
+        - formulas: bool, optional
+            If True, formula cells hold their formula text (kind FORMULA); otherwise their cached value. Defaults to False.
+        """
+        rows, cols, kinds, numbers, codes = array("I"), array("H"), array("B"), array("d"), array("i")
+        dates, objects = {}, {}  # position in the arrays -> value
+        strings, string_codes = [], {}
+        nan = float("nan")
+
+        for row, column, data_type, value, formula in records:
+            if formulas and formula is not None:
+                kind, value = FORMULA, formula
+            elif value is None:
+                continue
+            elif value is True or value is False:
+                kind = BOOL
+            elif data_type == "e":
+                kind = ERROR
+            elif isinstance(value, int):
+                kind = INTEGER
+            elif isinstance(value, float):
+                kind = FLOAT
+            elif isinstance(value, str):
+                kind = STRING
+            elif type(value) is datetime:
+                kind = DATE
+            else:
+                kind = OBJECT
+
+            position = len(kinds)
+            rows.append(row)
+            cols.append(column)
+            kinds.append(kind)
+            if kind in _CODED_KINDS:
+                code = string_codes.get(value)
+                if code is None:
+                    code = string_codes[value] = len(strings)
+                    strings.append(value)
+                codes.append(code)
+                numbers.append(nan)
+            else:
+                codes.append(-1)
+                numbers.append(float(value) if kind in (INTEGER, FLOAT, BOOL) else nan)
+                if kind == DATE:
+                    dates[position] = value
+                elif kind == OBJECT:
+                    objects[position] = value
+
+        rows, cols = np.frombuffer(rows, dtype=np.uint32), np.frombuffer(cols, dtype=np.uint16)
+        min_row = int(rows.min()) if len(rows) else 1
+        min_col = int(cols.min()) if len(cols) else 1
+        frame = cls(min_row, min_col, int(rows.max()) if len(rows) else 0, int(cols.max()) if len(cols) else 0)
+        frame.strings = strings
+        if not len(rows):
+            return frame
+
+        kinds = np.frombuffer(kinds, dtype=np.uint8)
+        numbers = np.frombuffer(numbers, dtype=np.float64)
+        codes = np.frombuffer(codes, dtype=np.int32)
+        height = frame.max_row - min_row + 1
+
+        # Group the cells by column; the stable sort keeps each column in reading order
+        order = np.argsort(cols, kind="stable")
+        sorted_cols = cols[order]
+        starts = np.flatnonzero(np.r_[True, sorted_cols[1:] != sorted_cols[:-1]])
+        ends = np.r_[starts[1:], len(order)]
+        for start, end in zip(starts, ends):
+            positions = order[start:end]
+            at = rows[positions].astype(np.int64) - min_row
+            column_kinds = kinds[positions]
+            column = _Column(np.zeros(height, dtype=np.uint8))
+            column.kinds[at] = column_kinds
+            present = np.unique(column_kinds)
+            if np.isin(present, (INTEGER, FLOAT, BOOL)).any():
+                column.numbers = np.full(height, np.nan)
+                column.numbers[at] = numbers[positions]
+            if np.isin(present, _CODED_KINDS).any():
+                column.codes = np.full(height, -1, dtype=np.int32)
+                column.codes[at] = codes[positions]
+            if DATE in present:
+                column.dates = np.full(height, np.datetime64("NaT"), dtype="datetime64[us]")
+                for position, offset in zip(positions[column_kinds == DATE], at[column_kinds == DATE]):
+                    column.dates[offset] = np.datetime64(dates[int(position)], "us")
+            if OBJECT in present:
+                column.objects = {int(offset): objects[int(position)]
+                                  for position, offset in zip(positions[column_kinds == OBJECT], at[column_kinds == OBJECT])}
+            frame.columns[int(sorted_cols[start])] = column
+        return frame
+
+    @property
+    def nbytes(self):
+        """
+        Memory held by the frame: its arrays plus the string dictionary.
+        """
+        return (sum(column.nbytes for column in self.columns.values())
+                + sum(sys.getsizeof(text) for text in self.strings) + sys.getsizeof(self.strings))
+
+    @property
+    def shape(self):
+        """
+        (rows, columns) of the covered area.
+        """
+        if not self.columns:
+            return 0, 0
+        return self.max_row - self.min_row + 1, self.max_col - self.min_col + 1
+
+    def _hits(self, masks):
+        """
+        Turns {column: boolean mask} into [(row, column), ...] in row-major order.
+        """
+        rows, cols = [], []
+        for column, mask in masks.items():
+            found = np.flatnonzero(mask)
+            if len(found):
+                rows.append(found + self.min_row)
+                cols.append(np.full(len(found), column))
+        if not rows:
+            return []
+        rows, cols = np.concatenate(rows), np.concatenate(cols)
+        order = np.lexsort((cols, rows))
+        return list(zip(rows[order].tolist(), cols[order].tolist()))
+
+    def value(self, row, column):
+        """
+        Returns the value of one cell as a Python object (None when empty or outside the frame).
+        """
+        column = self.columns.get(_column_number(column))
+        offset = row - self.min_row
+        if column is None or not 0 <= offset < len(column.kinds):
+            return None
+        kind = column.kinds[offset]
+        if kind == EMPTY:
+            return None
+        if kind in _CODED_KINDS:
+            return self.strings[column.codes[offset]]
+        if kind == INTEGER:
+            return int(column.numbers[offset])
+        if kind == FLOAT:
+            return float(column.numbers[offset])
+        if kind == BOOL:
+            return bool(column.numbers[offset])
+        if kind == DATE:
+            return column.dates[offset].astype(datetime)
+        return column.objects[int(offset)]
+
+    def mask(self, column, kinds=None):
+        """
+        Returns a boolean array over the frame rows: True where the cell of the column has a value,
+        or has one of the given kinds (e.g. (INTEGER, FLOAT)).
+        """
+        column = self.columns.get(_column_number(column))
+        height = self.shape[0]
+        if column is None:
+            return np.zeros(height, dtype=bool)
+        if kinds is None:
+            return column.kinds != EMPTY
+        return np.isin(column.kinds, kinds)
+
+    def numbers(self, column):
+        """
+        Returns the numeric values of a column as float64 (booleans as 0 / 1), NaN for other cells.
+        """
+        column = self.columns.get(_column_number(column))
+        if column is None or column.numbers is None:
+            return np.full(self.shape[0], np.nan)
+        return column.numbers
+
+    def find_text(self, search_text, exact_match=False):
+        """
+        Vectorized equivalent of ex_find_cells_with_text: partial matches compare with str(value), exact matches
+        with the value itself (see find_value).
+
+        Returns:
+        - list of tuples
+            (row, column) of every matching cell, in row-major order.
+        """
+        if exact_match:
+            return self.find_value(search_text)
+
+        # Each distinct string is tested once, then every cell is matched by its code. The dictionary is scanned
+        # as a list: a NumPy unicode array would pad every string to the length of the longest one
+        matching_codes = np.fromiter((code for code, text in enumerate(self.strings) if search_text in text),
+                                     dtype=np.int32)
+        characters = set(search_text)
+        masks = {}
+        for number, column in self.columns.items():
+            mask = np.zeros(len(column.kinds), dtype=bool)
+            if column.codes is not None and len(matching_codes):
+                mask |= np.isin(column.codes, matching_codes)
+            if column.numbers is not None:
+                for kind, text_of in ((INTEGER, lambda v: str(int(v))), (FLOAT, lambda v: str(float(v)))):
+                    if characters <= _NUMBER_TEXT:
+                        is_kind = column.kinds == kind
+                        values = np.unique(column.numbers[is_kind])
+                        matches = [v for v in values if search_text in text_of(v)]
+                        if matches:
+                            mask |= is_kind & np.isin(column.numbers, matches)
+                is_bool = column.kinds == BOOL
+                for flag, text in ((1.0, "True"), (0.0, "False")):
+                    if search_text in text:
+                        mask |= is_bool & (column.numbers == flag)
+            if column.dates is not None and characters <= _DATE_TEXT:
+                values = np.unique(column.dates[column.kinds == DATE])
+                matches = [v for v in values if search_text in str(v.astype(datetime))]
+                if matches:
+                    mask |= np.isin(column.dates, matches)
+            if column.objects:
+                for offset, value in column.objects.items():
+                    if search_text in str(value):
+                        mask[offset] = True
+            masks[number] = mask
+        return self._hits(masks)
+
+    def find_value(self, value):
+        """
+        Returns the (row, column) of every cell equal to value, in row-major order. Text is compared with strings
+        and error literals (and formula texts when the frame holds formulas), numbers with numbers.
+        """
+        masks = {}
+        if isinstance(value, str):
+            code = self.strings.index(value) if value in self.strings else -1
+            if code < 0:
+                return []
+            for number, column in self.columns.items():
+                if column.codes is not None:
+                    masks[number] = column.codes == code
+        elif isinstance(value, (bool, int, float)):
+            kinds = (BOOL,) if isinstance(value, bool) else _NUMERIC_KINDS
+            for number, column in self.columns.items():
+                if column.numbers is not None:
+                    masks[number] = np.isin(column.kinds, kinds) & (column.numbers == float(value))
+        elif type(value) is datetime:
+            target = np.datetime64(value, "us")
+            for number, column in self.columns.items():
+                if column.dates is not None:
+                    masks[number] = column.dates == target
+        else:
+            for number, column in self.columns.items():
+                if column.objects:
+                    mask = np.zeros(len(column.kinds), dtype=bool)
+                    mask[[offset for offset, item in column.objects.items() if item == value]] = True
+                    masks[number] = mask
+        return self._hits(masks)
+
+    def filter_rows(self, column, min_value=None, max_value=None):
+        """
+        Returns the row numbers (int64 array) where the number or date of a column lies in [min_value, max_value].
+        Either bound may be None. Dates are compared when a bound is a datetime.
+        """
+        data = self.columns.get(_column_number(column))
+        if data is None:
+            return np.array([], dtype=np.int64)
+        if isinstance(min_value, datetime) or isinstance(max_value, datetime):
+            if data.dates is None:
+                return np.array([], dtype=np.int64)
+            values, mask = data.dates, data.kinds == DATE
+            min_value = None if min_value is None else np.datetime64(min_value, "us")
+            max_value = None if max_value is None else np.datetime64(max_value, "us")
+        else:
+            if data.numbers is None:
+                return np.array([], dtype=np.int64)
+            values, mask = data.numbers, np.isin(data.kinds, _NUMERIC_KINDS)
+        if min_value is not None:
+            mask &= values >= min_value
+        if max_value is not None:
+            mask &= values <= max_value
+        return np.flatnonzero(mask) + self.min_row
+
+    def last_row(self, column=None):
+        """
+        Returns the last row holding a value, in the given column or in any column; 0 if there is none.
+        """
+        columns = self.columns.values() if column is None else [self.columns.get(_column_number(column))]
+        last = 0
+        for data in columns:
+            if data is not None:
+                found = np.flatnonzero(data.kinds)
+                if len(found):
+                    last = max(last, int(found[-1]) + self.min_row)
+        return last
+
+    def last_column(self, row=None):
+        """
+        Returns the last column holding a value, in the given row or in any row; 0 if there is none.
+        """
+        offset = None if row is None else row - self.min_row
+        for number in sorted(self.columns, reverse=True):
+            kinds = self.columns[number].kinds
+            if offset is None or (0 <= offset < len(kinds) and kinds[offset] != EMPTY):
+                return number
+        return 0
+
+@instrument
+def ex_read_sheet_frame(file_path, sheet_name=None, find_range=None, formulas=False, use_cache=True):
+    """
+    Reads a sheet into a SheetFrame in one streaming pass over the worksheet XML.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Parameters:
+    - file_path: str or WorkbookSession
+        The path to the .xlsx / .xlsm file. A WorkbookSession with unsaved changes is read from its workbook
+        (see ex_session_source).
+    - sheet_name: str, optional
+        The name of the sheet. If not provided, the active sheet is used.
+    - find_range: str, optional
+        Only the cells inside this range (e.g. "A1:H5000") are held.
+    - formulas: bool, optional
+        If True, formula cells hold their formula text (as ex_find_cells_with_text compares them);
+        otherwise the value Excel calculated last time. Defaults to False.
+    - use_cache: bool, optional
+        If True (default), frames of unchanged files are reused (keyed by path, mtime, size and the arguments).
+        The writers of this package drop the frames of the file they write (see ex_invalidate_sheet_frame).
+
+    Returns:
+    - SheetFrame
+        The frame. Cached frames are shared: treat them as read-only.
+
+    Raises:
+    - KeyError
+        If the sheet does not exist.
+    """
+    source, engine = ex_session_source(file_path, "xml")
+    if engine == "openpyxl":
+        workbook = ex_load_workbook(source)
+        sheet = workbook[sheet_name] if sheet_name else workbook.active
+        bounds = (1, 1, None, None)
+        if find_range:
+            from openpyxl.utils import range_boundaries
+            min_col, min_row, max_col, max_row = range_boundaries(find_range)
+            bounds = (min_row or 1, min_col or 1, max_row, max_col)
+        records = (SheetRecord(row, column, cell.data_type, None if cell.data_type == "f" else cell.value,
+                               cell.value if cell.data_type == "f" else None)
+                   for row, column, cell in ex_iter_populated_cells(sheet, *bounds))
+        return SheetFrame.from_records(records, formulas=formulas)
+
+    abs_path = os.path.abspath(source)
+    stat = os.stat(abs_path)
+    key = (abs_path, stat.st_mtime_ns, stat.st_size, sheet_name, find_range, formulas)
+    if use_cache:
+        frame = _get_frame(key)
+        if frame is not None:
+            return frame
+
+    frame = SheetFrame.from_records(ex_iter_sheet_records(abs_path, sheet_name=sheet_name, find_range=find_range),
+                                    formulas=formulas)
+    logger.debug(f"Built {frame!r} for '{abs_path}'.")
+    if use_cache:
+        _put_frame(key, frame)
+    return frame
+
+if __name__ == "__main__":
+    ex_configure_logging()
+    file_path = r"C:\Users\KNT15083\Downloads\521\summary.xlsx"
+    frame = ex_read_sheet_frame(file_path)
+    print(frame, frame.find_text("BODY"), frame.last_row("H"), frame.filter_rows("B", 0, 100))
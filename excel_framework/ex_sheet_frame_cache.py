@@ -0,0 +1,57 @@
+import os
+import threading
+from collections import OrderedDict
+
+from .ex_logging import ex_get_logger
+from .ex_telemetry import instrument
+
+logger = ex_get_logger(__name__)
+
+# SheetFrames built by ex_read_sheet_frame, keyed by (path, mtime_ns, size, sheet_name, find_range, formulas).
+# Kept apart from ex_sheet_frame so the writers can drop entries without importing NumPy.
+_frame_cache = OrderedDict()
+_frame_lock = threading.Lock()
+_FRAME_CACHE_SIZE = 8
+
+def _get_frame(key):
+    with _frame_lock:
+        frame = _frame_cache.get(key)
+        if frame is not None:
+            _frame_cache.move_to_end(key)
+        return frame
+
+def _put_frame(key, frame):
+    with _frame_lock:
+        for stale_key in [k for k in _frame_cache if k[0] == key[0] and k[1:3] != key[1:3]]:
+            del _frame_cache[stale_key]
+        _frame_cache[key] = frame
+        while len(_frame_cache) > _FRAME_CACHE_SIZE:
+            _frame_cache.popitem(last=False)
+
+@instrument
+def ex_invalidate_sheet_frame(file_path=None):
+    """
+    Removes the cached SheetFrames of one file (every sheet and range), or clears them all.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Parameters:
+    - file_path: str, optional
+        The file whose frames should be dropped. If not provided, all frames are dropped.
+
+    Returns:
+    - int
+        The number of frames removed.
+    """
+    with _frame_lock:
+        if file_path is None:
+            keys = list(_frame_cache)
+        else:
+            abs_path = os.path.abspath(file_path)
+            keys = [k for k in _frame_cache if k[0] == abs_path]
+        for key in keys:
+            del _frame_cache[key]
+    if keys:
+        logger.debug(f"Dropped {len(keys)} cached sheet frames.")
+    return len(keys)
@@ -1,16 +1,17 @@
-import logging
-logging.basicConfig(
-        level=logging.DEBUG,
-        format='%(module)s | %(lineno)d | %(funcName)s | %(levelname)s | %(message)s',
-    )
+from .ex_logging import ex_configure_logging, ex_get_logger
+from .ex_telemetry import ex_count, instrument
 
-import xlwings as xw
+logger = ex_get_logger(__name__)
 
-from openpyxl import load_workbook
-
-from PIL import Image
-Image.MAX_IMAGE_PIXELS = None
+def _sheets(wb):
+    """
+    The sheets of wb, counting the COM calls of reading the collection and one property of each sheet.
+    """
+    sheets = list(wb.sheets)
+    ex_count(com_calls=1 + len(sheets))
+    return sheets
 
+@instrument
 def ex_sheets_action(wb, action):
     """
     Performs specified actions on the sheets of a given Excel workbook.
@@ -44,43 +45,47 @@ def ex_sheets_action(wb, action):
     - Logs an error message if an unknown action is specified or if an error occurs during the action.
     - Logs info messages when hidden sheets are deleted.
     """
-    logging.debug(f"Performing action '{action}' on workbook: {wb.name}")
+    logger.debug(f"Performing action '{action}' on workbook: {wb.name}")
     
     try:
         if action == 'count_total':
+            ex_count(com_calls=1)
             return len(wb.sheets)
         
         elif action == 'count_hidden':
-            return sum(1 for sheet in wb.sheets if sheet.api.Visible == 0)
+            return sum(1 for sheet in _sheets(wb) if sheet.api.Visible == 0)
 
         elif action == 'count_visible':
-            return sum(1 for sheet in wb.sheets if sheet.api.Visible == -1)
+            return sum(1 for sheet in _sheets(wb) if sheet.api.Visible == -1)
 
         elif action == 'list_sheets':
-            return [sheet.name for sheet in wb.sheets]
+            return [sheet.name for sheet in _sheets(wb)]
 
         elif action == 'list_hidden':
-            return [sheet.name for sheet in wb.sheets if sheet.api.Visible == 0]
+            return [sheet.name for sheet in _sheets(wb) if sheet.api.Visible == 0]
 
         elif action == 'list_visible':
-            return [sheet.name for sheet in wb.sheets if sheet.api.Visible == -1]
+            return [sheet.name for sheet in _sheets(wb) if sheet.api.Visible == -1]
 
         elif action == 'delete_hidden':
-            hidden_sheets = [sheet for sheet in wb.sheets if sheet.api.Visible == 0]
+            hidden_sheets = [sheet for sheet in _sheets(wb) if sheet.api.Visible == 0]
             for sheet in hidden_sheets:
+                ex_count(com_calls=1)
                 sheet.delete()
-            logging.info(f"Deleted {len(hidden_sheets)} hidden sheets.")
+            logger.info(f"Deleted {len(hidden_sheets)} hidden sheets.")
             return len(hidden_sheets)
 
         else:
-            logging.error(f"Unknown action: {action}")
+            logger.error(f"Unknown action: {action}")
             return False
 
     except Exception as e:
-        logging.error(f"Error performing action '{action}' on workbook '{wb.name}': {e}")
+        logger.error(f"Error performing action '{action}' on workbook '{wb.name}': {e}")
         return False
     
 if __name__ == "__main__":
+    ex_configure_logging()
+    import xlwings as xw
     app = xw.App(visible=False)
     wb = app.books.open(r"C:\Users\KNT15083\Downloads\FY24_Q3_UV2小林-3殿宛_1812 _original\RN02753\検討書\TR-V2-S24023.xlsx")
 
@@ -1,5 +1,6 @@
-import xlwings as xw
+from .ex_telemetry import ex_count, instrument
 
+@instrument
 def ex_style_autosize(sheet, index, fit_type='column'):
     """
     Adjusts the width of a column or the height of a row in an Excel worksheet.
@@ -15,16 +16,19 @@ def ex_style_autosize(sheet, index, fit_type='column'):
     Returns:
     - None
     """
+    import xlwings as xw
     # If index is an integer, convert it to the corresponding letter for columns
     if fit_type == 'column' and isinstance(index, int):
         index = xw.utils.get_column_letter(index)
 
     # Fit column width
     if fit_type == 'column':
+        ex_count(com_calls=1)
         sheet.range(index + ':' + index).autofit()
     
     # Fit row height
     elif fit_type == 'row' and isinstance(index, int):
+        ex_count(com_calls=1)
         sheet.range(index).autofit()
 
     else:
@@ -1,5 +1,6 @@
-import xlwings as xw
+from .ex_telemetry import ex_count, instrument
 
+@instrument
 def ex_style_range(sheet, cell_range, 
                    font_color=None, font_name=None, font_size=None, 
                    bold=None, italic=None, underline=None, strikethrough=None,
@@ -51,25 +52,32 @@ def ex_style_range(sheet, cell_range,
     - None
         The function does not return any value. It directly modifies the styles of the specified range.
     """
+    import xlwings as xw
 
+    ex_count(com_calls=1)
     rng = sheet[cell_range]
 
     # Thiết lập màu chữ
     if font_color is not None:
+        ex_count(com_calls=1)
         rng.font.color = font_color
 
     # Thiết lập tên font chữ
     if font_name is not None:
+        ex_count(com_calls=1)
         rng.font.name = font_name
 
     # Thiết lập kích cỡ chữ
     if font_size is not None:
+        ex_count(com_calls=1)
         rng.font.size = font_size
 
     # Thiết lập kiểu chữ
     if bold is not None:
+        ex_count(com_calls=1)
         rng.font.bold = bold
     if italic is not None:
+        ex_count(com_calls=1)
         rng.font.italic = italic
 
     # Thiết lập viền
@@ -78,39 +86,49 @@ def ex_style_range(sheet, cell_range,
             if border_type == 'surround':
                 # Thêm viền bao quanh vùng
                 for side in ['top', 'bottom', 'left', 'right']:
+                    ex_count(com_calls=1)
                     rng.api.Borders[getattr(xw.constants.XlBordersIndex, f'xlEdge{side.capitalize()}')].LineStyle = getattr(xw.constants.XlLineStyle, f'xlLineStyle{border_style.capitalize()}')
             elif border_type == 'all':
                 # Thêm viền cho tất cả các ô trong vùng
                 for side in ['top', 'bottom', 'left', 'right']:
+                    ex_count(com_calls=1)
                     rng.api.Borders[getattr(xw.constants.XlBordersIndex, f'xlEdge{side.capitalize()}')].LineStyle = getattr(xw.constants.XlLineStyle, f'xlLineStyle{border_style.capitalize()}')
                 for row in rng.rows:
                     for cell in row:
                         for side in ['top', 'bottom', 'left', 'right']:
+                            ex_count(com_calls=1)
                             cell.api.Borders[getattr(xw.constants.XlBordersIndex, f'xlEdge{side.capitalize()}')].LineStyle = getattr(xw.constants.XlLineStyle, f'xlLineStyle{border_style.capitalize()}')
 
     # Thiết lập màu nền
     if background_color is not None:
+        ex_count(com_calls=2)
         rng.fill.solid()
         rng.fill.fore_color = background_color
 
     # Thiết lập căn chỉnh
     if horizontal_alignment is not None:
+        ex_count(com_calls=1)
         rng.api.HorizontalAlignment = getattr(xw.constants.XlHAlign, f'xlHAlign{horizontal_alignment.capitalize()}')
     if vertical_alignment is not None:
+        ex_count(com_calls=1)
         rng.api.VerticalAlignment = getattr(xw.constants.XlVAlign, f'xlVAlign{vertical_alignment.capitalize()}')
 
     # Thiết lập định dạng số
     if number_format is not None:
+        ex_count(com_calls=1)
         rng.number_format = number_format
 
     # Thiết lập gạch chéo và gạch dưới
     if strikethrough is not None:
+        ex_count(com_calls=1)
         rng.font.strikethrough = strikethrough
     if underline is not None:
+        ex_count(com_calls=1)
         rng.font.underline = underline
 
 # Ví dụ sử dụng
 if __name__ == "__main__":
+    import xlwings as xw
     wb = xw.Book()  # Mở một workbook mới
     sheet = wb.sheets[0]  # Lấy sheet đầu tiên
     ex_style_range(sheet, 'A1:B2', font_color='red', font_name='Arial', font_size=12, bold=True, italic=None, border=True, border_style='thin', border_type='surround')
@@ -0,0 +1,299 @@
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+from .ex_logging import ex_configure_logging, ex_get_logger
+
+logger = ex_get_logger(__name__)
+
+_enabled = os.environ.get("EX_TELEMETRY", "") not in ("", "0")
+_track_memory = False
+_started_tracing = False
+_current = contextvars.ContextVar("ex_telemetry_call", default=None)
+
+class _Call:
+    """
+    One running instrumented call. Counters are inclusive: when the call ends they are added to its caller.
+    """
+    __slots__ = ("function", "parent", "depth", "cells", "bytes_read", "com_calls", "memory_start", "memory_peak")
+
+    def __init__(self, function, parent):
+        self.function = function
+        self.parent = parent
+        self.depth = 0 if parent is None else parent.depth + 1
+        self.cells = 0
+        self.bytes_read = 0
+        self.com_calls = 0
+        self.memory_start = 0
+        self.memory_peak = 0
+
+class MetricsRegistry:
+    """
+    In-process store of the calls measured by ex_telemetry, with per-function totals.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Parameters:
+    - job: str, optional
+        A label copied into every record, e.g. the name of a batch job. Defaults to None.
+    - max_records: int, optional
+        The number of individual call records kept (the oldest are dropped first); totals always
+        cover every call. Defaults to 100000.
+
+    Notes:
+    - Each record is a dict with: job, function, depth (0 for a top-level call), start (epoch seconds),
+      wall_s, cpu_s, peak_bytes (None unless memory tracking is on), cells, bytes_read, com_calls and
+      error (the exception type name, or None).
+    - Thread-safe; CPU time is the time of the calling thread.
+    """
+
+    def __init__(self, job=None, max_records=100000):
+        self.job = job
+        self.max_records = max_records
+        self.records = []
+        self.totals = {}
+        self._lock = threading.Lock()
+
+    def add(self, record):
+        with self._lock:
+            self.records.append(record)
+            if len(self.records) > self.max_records:
+                del self.records[:len(self.records) - self.max_records]
+            total = self.totals.get(record["function"])
+            if total is None:
+                total = self.totals[record["function"]] = {
+                    "calls": 0, "errors": 0, "wall_s": 0.0, "cpu_s": 0.0, "peak_bytes": None,
+                    "cells": 0, "bytes_read": 0, "com_calls": 0,
+                }
+            total["calls"] += 1
+            total["errors"] += record["error"] is not None
+            for field in ("wall_s", "cpu_s", "cells", "bytes_read", "com_calls"):
+                total[field] += record[field]
+            if record["peak_bytes"] is not None:
+                total["peak_bytes"] = max(total["peak_bytes"] or 0, record["peak_bytes"])
+
+    def summary(self, top=None):
+        """
+        Returns the per-function totals as a list of dicts, slowest (total wall time) first.
+        """
+        with self._lock:
+            rows = [dict(function=function, **total) for function, total in self.totals.items()]
+        rows.sort(key=lambda row: row["wall_s"], reverse=True)
+        return rows[:top] if top else rows
+
+    def clear(self):
+        with self._lock:
+            self.records.clear()
+            self.totals.clear()
+
+_default_registry = MetricsRegistry()
+_registry = contextvars.ContextVar("ex_telemetry_registry", default=_default_registry)
+
+def ex_enable_telemetry(enabled=True, track_memory=False):
+    """
+    Turns the instrumentation of the ex_* functions on or off for the whole process.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Parameters:
+    - enabled: bool, optional
+        True to start recording calls, False to stop. Defaults to True. The EX_TELEMETRY environment
+        variable (any value but "0") enables it at import time.
+    - track_memory: bool, optional
+        If True, the peak Python memory of every call is measured with tracemalloc. This slows the
+        measured code down noticeably, so it is off by default. Defaults to False.
+
+    Notes:
+    - When disabled, an instrumented function costs one flag check before calling the original.
+    """
+    global _enabled, _track_memory, _started_tracing
+    _enabled = enabled
+    _track_memory = enabled and track_memory
+    if _track_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _started_tracing = True
+    elif not _track_memory and _started_tracing:
+        tracemalloc.stop()  # only stop tracing that was started here
+        _started_tracing = False
+
+def ex_telemetry_registry():
+    """
+    Returns the registry receiving the current measurements (the one of the innermost ex_telemetry_scope,
+    or the process-wide default registry).
+    """
+    return _registry.get()
+
+def ex_count(cells=0, bytes_read=0, com_calls=0):
+    """
+    Adds work counters to the instrumented call running in this context. Does nothing when telemetry is off.
+
+    Parameters:
+    - cells: int, optional
+        Cells scanned.
+    - bytes_read: int, optional
+        Bytes read from disk or from a zip member.
+    - com_calls: int, optional
+        Calls made into Excel through xlwings / COM.
+    """
+    if not _enabled:
+        return
+    call = _current.get()
+    if call is not None:
+        call.cells += cells
+        call.bytes_read += bytes_read
+        call.com_calls += com_calls
+
+def _measure(function, name, args, kwargs):
+    parent = _current.get()
+    call = _Call(name, parent)
+    if _track_memory:
+        current, peak = tracemalloc.get_traced_memory()
+        if parent is not None:
+            parent.memory_peak = max(parent.memory_peak, peak)
+        tracemalloc.reset_peak()
+        call.memory_start = call.memory_peak = current
+    token = _current.set(call)
+    error = None
+    start = time.time()
+    wall_start = time.perf_counter()
+    cpu_start = time.thread_time()
+    try:
+        return function(*args, **kwargs)
+    except BaseException as e:
+        error = type(e).__name__
+        raise
+    finally:
+        wall = time.perf_counter() - wall_start
+        cpu = time.thread_time() - cpu_start
+        _current.reset(token)
+        peak_bytes = None
+        if _track_memory and tracemalloc.is_tracing():
+            call.memory_peak = max(call.memory_peak, tracemalloc.get_traced_memory()[1])
+            peak_bytes = call.memory_peak - call.memory_start
+            if parent is not None:
+                parent.memory_peak = max(parent.memory_peak, call.memory_peak)
+        if parent is not None:
+            parent.cells += call.cells
+            parent.bytes_read += call.bytes_read
+            parent.com_calls += call.com_calls
+        registry = _registry.get()
+        registry.add({
+            "job": registry.job, "function": name, "depth": call.depth, "start": start,
+            "wall_s": wall, "cpu_s": cpu, "peak_bytes": peak_bytes,
+            "cells": call.cells, "bytes_read": call.bytes_read, "com_calls": call.com_calls,
+            "error": error,
+        })
+
+def instrument(function):
+    """
+    Decorator recording wall time, CPU time, peak memory and work counters of every call to a function
+    while telemetry is enabled (see ex_enable_telemetry and ex_telemetry_scope).
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Parameters:
+    - function: callable
+        A regular (non-generator) function. Generators return immediately, so their work is counted
+        in the instrumented function that consumes them.
+
+    Returns:
+    - callable
+        The wrapped function, with the same name, docstring and signature (functools.wraps).
+
+    Notes:
+    - Nested instrumented calls are recorded too; their counters are included in their caller's.
+    """
+    name = function.__name__
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if not _enabled:
+            return function(*args, **kwargs)
+        return _measure(function, name, args, kwargs)
+
+    return wrapper
+
+@contextmanager
+def ex_telemetry_scope(job=None, export_path=None, track_memory=False):
+    """
+    Measures the ex_* calls made inside a with-block into a registry of their own.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Parameters:
+    - job: str, optional
+        A label stored in every record of the scope, e.g. "monthly-report". Defaults to None.
+    - export_path: str, optional
+        If given, the records are appended to this JSON-lines file when the block ends (see ex_export_telemetry).
+    - track_memory: bool, optional
+        Also measure peak memory (slower), see ex_enable_telemetry. Defaults to False.
+
+    Yields:
+    - MetricsRegistry
+        The registry of the scope.
+
+    Notes:
+    - Telemetry is enabled for the duration of the block and the previous setting is restored afterwards.
+      Scopes can be nested; each call is recorded in the innermost one.
+    """
+    previous = (_enabled, _track_memory)
+    registry = MetricsRegistry(job=job)
+    token = _registry.set(registry)
+    ex_enable_telemetry(True, track_memory=track_memory or previous[1])
+    try:
+        yield registry
+    finally:
+        ex_enable_telemetry(*previous)
+        _registry.reset(token)
+        if export_path:
+            ex_export_telemetry(export_path, registry)
+
+def ex_export_telemetry(file_path, registry=None, include_summary=True):
+    """
+    Appends the records of a registry to a JSON-lines file, one JSON object per call.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Parameters:
+    - file_path: str
+        The .jsonl file to append to. It is created if it does not exist.
+    - registry: MetricsRegistry, optional
+        The registry to export. Defaults to the current one (ex_telemetry_registry()).
+    - include_summary: bool, optional
+        If True, one {"type": "summary", ...} line per function follows the call records.
+        Call records carry "type": "call". Defaults to True.
+
+    Returns:
+    - int
+        The number of lines written.
+    """
+    registry = registry or ex_telemetry_registry()
+    with registry._lock:
+        records = list(registry.records)
+    lines = [json.dumps(dict(type="call", **record), ensure_ascii=False) for record in records]
+    if include_summary:
+        lines += [json.dumps(dict(type="summary", job=registry.job, **row), ensure_ascii=False)
+                  for row in registry.summary()]
+    with open(file_path, "a", encoding="utf-8") as output:
+        for line in lines:
+            output.write(line + "\n")
+    logger.info(f"Exported {len(lines)} telemetry lines to '{file_path}'.")
+    return len(lines)
+
+if __name__ == "__main__":
+    ex_configure_logging()
+    from .ex_find_cells_with_text import ex_find_cells_with_text
+    with ex_telemetry_scope("demo", export_path="telemetry.jsonl") as registry:
+        ex_find_cells_with_text(r"C:\Users\KNT15083\Downloads\521\summary.xlsx", "BODY")
+    for row in registry.summary():
+        print(row)
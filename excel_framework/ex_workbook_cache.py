@@ -0,0 +1,210 @@
+import os
+import threading
+import warnings
+import zipfile
+from collections import OrderedDict
+
+from .ex_logging import ex_configure_logging, ex_get_logger
+from .ex_telemetry import ex_count, instrument
+
+logger = ex_get_logger(__name__)
+
+# Edit-mode workbooks parsed by openpyxl are kept here, most recently used last.
+# Key: (absolute path, mtime_ns, size, data_only, keep_vba, keep_links)
+_cache = OrderedDict()
+_cache_lock = threading.RLock()
+_cache_stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+_cache_max_bytes = 512 * 1024 * 1024
+
+# Rough ratio between the uncompressed XML of a workbook and the memory openpyxl needs to hold it
+_MEMORY_FACTOR = 4
+
+_openpyxl = None
+
+def ex_openpyxl():
+    """
+    Returns the openpyxl module, importing and preparing it the first time it is needed.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Returns:
+    - module
+        openpyxl.
+
+    Notes:
+    - openpyxl (and Pillow, which openpyxl imports when it is installed) takes a noticeable part of a
+      second to import, so the modules of this package only import it when a function actually needs it.
+    - On first use, Pillow's decompression bomb limit is lifted (large images embedded in workbooks must
+      not stop them from loading) and openpyxl's warnings about unsupported extensions are silenced.
+    """
+    global _openpyxl
+    if _openpyxl is None:
+        import openpyxl
+        warnings.filterwarnings("ignore", category=UserWarning, module="openpyxl")
+        try:
+            from PIL import Image
+            Image.MAX_IMAGE_PIXELS = None
+        except ImportError:
+            pass
+        _openpyxl = openpyxl
+    return _openpyxl
+
+def _estimate_workbook_bytes(file_path):
+    """
+    Estimates the memory held by a parsed workbook from the uncompressed size of its parts.
+    """
+    file_size = os.path.getsize(file_path)
+    try:
+        with zipfile.ZipFile(file_path) as archive:
+            xml_size = sum(info.file_size for info in archive.infolist())
+    except zipfile.BadZipFile:
+        xml_size = file_size
+    return max(file_size, xml_size * _MEMORY_FACTOR)
+
+def _evict(max_bytes):
+    # Caller holds the lock
+    total = sum(size for _, size in _cache.values())
+    while _cache and total > max_bytes:
+        key, (_, size) = _cache.popitem(last=False)
+        total -= size
+        _cache_stats["evictions"] += 1
+        logger.debug(f"Evicted workbook '{key[0]}' from cache ({size} bytes).")
+
+@instrument
+def ex_load_workbook(file_path, read_only=False, data_only=False, keep_vba=False, keep_links=True, use_cache=True):
+    """
+    Loads an Excel workbook with openpyxl, reusing a previously parsed copy when the file has not changed.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Parameters:
+    - file_path: str or WorkbookSession
+        The path to the Excel file to load. For a WorkbookSession, its (edit-mode) workbook is returned
+        and the other parameters are ignored.
+    - read_only: bool, optional
+        Passed to openpyxl.load_workbook. Defaults to False.
+    - data_only: bool, optional
+        Passed to openpyxl.load_workbook. Defaults to False.
+    - keep_vba: bool, optional
+        Passed to openpyxl.load_workbook. Defaults to False.
+    - keep_links: bool, optional
+        Passed to openpyxl.load_workbook. Defaults to True.
+    - use_cache: bool, optional
+        If False, always parses the file and does not store the result. Defaults to True.
+
+    Returns:
+    - openpyxl.Workbook
+        The loaded workbook. Cached workbooks are shared between callers, so a caller that
+        modifies the workbook should save it (which changes the file and therefore the cache key)
+        or call ex_invalidate_workbook.
+        Read-only workbooks are never cached: they keep the file open until closed, so the caller owns
+        the workbook and must call its close() method (on Windows an open handle blocks saving over
+        or deleting the file). Opening one is cheap since its cells are parsed lazily.
+
+    Notes:
+    - Entries are keyed by absolute path, modification time, file size and load options,
+      so a file changed on disk is parsed again automatically.
+    - The cache is bounded by an estimated memory size (see ex_set_workbook_cache_limit);
+      the least recently used workbooks are evicted first.
+    """
+    from .ex_workbook_session import WorkbookSession
+    if isinstance(file_path, WorkbookSession):
+        return file_path.workbook
+
+    abs_path = os.path.abspath(file_path)
+    stat = os.stat(abs_path)
+    key = (abs_path, stat.st_mtime_ns, stat.st_size, data_only, keep_vba, keep_links)
+    use_cache = use_cache and not read_only
+
+    if use_cache:
+        with _cache_lock:
+            entry = _cache.get(key)
+            if entry is not None:
+                _cache.move_to_end(key)
+                _cache_stats["hits"] += 1
+                logger.debug(f"Workbook cache hit for '{abs_path}'.")
+                return entry[0]
+            _cache_stats["misses"] += 1
+
+    workbook = ex_openpyxl().load_workbook(abs_path, read_only=read_only, data_only=data_only,
+                                           keep_vba=keep_vba, keep_links=keep_links)
+    ex_count(bytes_read=stat.st_size)
+    if not use_cache:
+        return workbook
+
+    size = _estimate_workbook_bytes(abs_path)
+    with _cache_lock:
+        # Drop entries for older versions of the same file
+        for stale_key in [k for k in _cache if k[0] == abs_path and k[1:3] != key[1:3]]:
+            del _cache[stale_key]
+        if size <= _cache_max_bytes:
+            _cache[key] = (workbook, size)
+            _evict(_cache_max_bytes)
+        else:
+            logger.debug(f"Workbook '{abs_path}' ({size} bytes) is larger than the cache limit, not cached.")
+    logger.debug(f"Workbook cache miss for '{abs_path}', loaded from disk.")
+    return workbook
+
+@instrument
+def ex_invalidate_workbook(file_path=None):
+    """
+    Removes cached workbooks for one file, or clears the whole cache.
+
+    Parameters:
+    - file_path: str, optional
+        The file whose cached workbooks (any load options) should be dropped. If not provided, all entries are dropped.
+
+    Returns:
+    - int
+        The number of entries removed.
+    """
+    with _cache_lock:
+        if file_path is None:
+            keys = list(_cache)
+        else:
+            abs_path = os.path.abspath(file_path)
+            keys = [k for k in _cache if k[0] == abs_path]
+        for key in keys:
+            del _cache[key]
+        _cache_stats["invalidations"] += len(keys)
+    return len(keys)
+
+@instrument
+def ex_set_workbook_cache_limit(max_bytes):
+    """
+    Sets the estimated memory limit of the workbook cache and evicts entries above it.
+    A limit of 0 disables caching.
+
+    Parameters:
+    - max_bytes: int
+        The maximum estimated size, in bytes, of all cached workbooks.
+    """
+    global _cache_max_bytes
+    with _cache_lock:
+        _cache_max_bytes = max(0, int(max_bytes))
+        _evict(_cache_max_bytes)
+
+@instrument
+def ex_workbook_cache_info():
+    """
+    Returns the workbook cache counters.
+
+    Returns:
+    - dict
+        hits, misses, evictions, invalidations, entries, bytes (estimated) and max_bytes.
+    """
+    with _cache_lock:
+        info = dict(_cache_stats)
+        info["entries"] = len(_cache)
+        info["bytes"] = sum(size for _, size in _cache.values())
+        info["max_bytes"] = _cache_max_bytes
+    return info
+
+if __name__ == "__main__":
+    ex_configure_logging()
+    file_path = r"C:\Users\KNT15083\Downloads\521\summary.xlsx"
+    ex_load_workbook(file_path)
+    ex_load_workbook(file_path)
+    print(ex_workbook_cache_info())
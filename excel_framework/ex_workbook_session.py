@@ -0,0 +1,176 @@
+import os
+
+from .ex_occupancy_index import ex_invalidate_occupancy_index
+from .ex_sheet_frame_cache import ex_invalidate_sheet_frame
+from .ex_workbook_cache import ex_invalidate_workbook, ex_load_workbook, ex_openpyxl
+from .ex_logging import ex_configure_logging, ex_get_logger
+
+logger = ex_get_logger(__name__)
+
+class WorkbookSession:
+    """
+    Holds one workbook loaded in edit mode for a series of ex_* calls and saves it once, at the end.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Parameters:
+    - file_path: str
+        The workbook file. If it does not exist, a new workbook is created and written there on save.
+    - data_only: bool, optional
+        Passed to openpyxl.load_workbook. Defaults to False (formulas are kept).
+    - keep_vba: bool, optional
+        Passed to openpyxl.load_workbook. Defaults to True for .xlsm files, False otherwise.
+
+    Usage:
+        with WorkbookSession("report.xlsx") as session:
+            ex_copy_range(("data.xlsx", "Data", "A1:D10"), (session, "Out", "B2"))
+            rows = ex_latest_row(session, sheet_name="Out", column="B")
+        # report.xlsx is written here, once, and only if something changed
+
+    Notes:
+    - The ex_* helpers that take a file path also accept a session: they read from and write to the workbook
+      held by the session and mark the sheets they change as dirty instead of saving.
+    - The workbook is loaded on first use. Helpers with a streaming engine ('xml', 'stream', ...) read the
+      file itself while the session has no unsaved changes, so a session that is only read may never load it.
+    - Code that changes session.workbook directly should call mark_dirty (or get the sheet with edit_sheet).
+    - When the with-block ends with an exception, nothing is saved.
+    """
+    def __init__(self, file_path, data_only=False, keep_vba=None):
+        self.file_path = os.path.abspath(file_path)
+        self.data_only = data_only
+        self.keep_vba = self.file_path.lower().endswith(".xlsm") if keep_vba is None else keep_vba
+        self.dirty_sheets = set()
+        self.saves = 0
+        self._workbook = None
+        self._default_sheet = None  # default sheet of a newly created workbook
+
+    def __repr__(self):
+        return f"WorkbookSession({self.file_path!r}, dirty={sorted(self.dirty_sheets)})"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if exc_type is None:
+                self.save()
+            elif self.dirty_sheets:
+                logger.warning(f"Discarded unsaved changes to {sorted(self.dirty_sheets)} in '{self.file_path}'.")
+        finally:
+            self.close()
+        return False
+
+    @property
+    def workbook(self):
+        """
+        The openpyxl workbook, loaded (or created) on first access.
+        """
+        if self._workbook is None:
+            if os.path.exists(self.file_path):
+                self._workbook = ex_load_workbook(self.file_path, data_only=self.data_only, keep_vba=self.keep_vba,
+                                                  use_cache=False)
+            else:
+                self._workbook = ex_openpyxl().Workbook()
+                self._default_sheet = self._workbook.active
+                logger.debug(f"Created a new workbook for '{self.file_path}'.")
+        return self._workbook
+
+    @property
+    def is_loaded(self):
+        return self._workbook is not None
+
+    @property
+    def is_dirty(self):
+        return bool(self.dirty_sheets)
+
+    def sheet(self, sheet_name=None):
+        """
+        Returns a worksheet for reading: the named one, or the active sheet.
+        """
+        return self.workbook[sheet_name] if sheet_name else self.workbook.active
+
+    def edit_sheet(self, sheet_name=None, create=False):
+        """
+        Returns a worksheet for writing and marks it dirty. With create=True a missing sheet is added.
+        """
+        if sheet_name and create and sheet_name not in self.workbook.sheetnames:
+            self.workbook.create_sheet(title=sheet_name)
+        sheet = self.sheet(sheet_name)
+        self.dirty_sheets.add(sheet.title)
+        return sheet
+
+    def mark_dirty(self, *sheet_names):
+        """
+        Records that the given sheets (the active sheet if none is given) were changed.
+        """
+        self.dirty_sheets.update(sheet_names or (self.workbook.active.title,))
+
+    def save(self, force=False):
+        """
+        Writes the workbook if a sheet was marked dirty (or force is True) and clears the dirty marks.
+
+        Returns:
+        - bool
+            True if the file was written.
+        """
+        if not (self.dirty_sheets or force) or self._workbook is None:
+            logger.debug(f"No changes to save in '{self.file_path}'.")
+            return False
+        wb = self._workbook
+        # Drop the default sheet of a new workbook if nothing was written to it
+        if self._default_sheet is not None and self._default_sheet.title in wb.sheetnames \
+                and not self._default_sheet._cells and len(wb.sheetnames) > 1:
+            wb.remove(self._default_sheet)
+        self._default_sheet = None
+        wb.save(self.file_path)
+        ex_invalidate_workbook(self.file_path)
+        ex_invalidate_occupancy_index(self.file_path)
+        ex_invalidate_sheet_frame(self.file_path)
+        self.saves += 1
+        logger.info(f"Saved '{self.file_path}' ({len(self.dirty_sheets)} changed sheets: {sorted(self.dirty_sheets)}).")
+        self.dirty_sheets.clear()
+        return True
+
+    def close(self):
+        """
+        Releases the workbook without saving it.
+        """
+        self._workbook = None
+        self._default_sheet = None
+        self.dirty_sheets.clear()
+
+def ex_session_source(source, engine="openpyxl"):
+    """
+    Decides where a reading helper reads a file path or a WorkbookSession from.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Parameters:
+    - source: str or WorkbookSession
+        The file_path argument the helper received.
+    - engine: str, optional
+        The engine the caller asked for. Defaults to 'openpyxl'.
+
+    Returns:
+    - tuple
+        (source, engine) to use. Paths are returned unchanged. A session is replaced by its file path when the
+        engine reads the file itself and the session has no unsaved changes; otherwise the session is returned
+        with the 'openpyxl' engine, which reads its workbook through ex_load_workbook.
+    """
+    if not isinstance(source, WorkbookSession):
+        return source, engine
+    if engine != "openpyxl" and not source.is_dirty and os.path.exists(source.file_path):
+        return source.file_path, engine
+    return source, "openpyxl"
+
+if __name__ == "__main__":
+    ex_configure_logging()
+    from .ex_copy_range import ex_copy_range
+    from .ex_latest_row import ex_latest_row
+
+    with WorkbookSession("target_file.xlsx") as session:
+        ex_copy_range(("source_file.xlsx", "Sheet1", "A5:D10"), (session, "CopiedSheet", "E3"))
+        ex_copy_range(("source_file.xlsx", "Sheet1", "F5:F10"), (session, "CopiedSheet", "J3"))
+        print(ex_latest_row(session, sheet_name="CopiedSheet", column="E"))
@@ -0,0 +1,280 @@
+import csv
+import os
+import re
+from datetime import date, datetime, time
+from itertools import chain
+from zipfile import ZIP_DEFLATED, ZipFile
+
+from .ex_occupancy_index import ex_invalidate_occupancy_index
+from .ex_sheet_frame_cache import ex_invalidate_sheet_frame
+from .ex_workbook_cache import ex_invalidate_workbook, ex_openpyxl
+from .ex_logging import ex_configure_logging, ex_get_logger
+from .ex_telemetry import ex_count, instrument
+
+logger = ex_get_logger(__name__)
+
+EXCEL_MAX_ROWS = 1048576
+
+# Number format of date / time columns without an explicit one
+_DEFAULT_FORMATS = {"timestamp": "yyyy-mm-dd hh:mm:ss", "date": "yyyy-mm-dd", "time": "hh:mm:ss"}
+_INTEGER = re.compile(r"[+-]?(0|[1-9]\d*)", re.ASCII)
+_FLOAT = re.compile(r"[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?", re.ASCII)
+# Excel keeps 15 significant digits of a number; longer digit strings (IDs, card numbers) would be rounded
+EXCEL_MAX_DIGITS = 15
+_INVALID_SHEET_CHARACTERS = re.compile(r"[\[\]:*?/\\]")
+
+def _parse_bool(text):
+    lowered = text.strip().lower()
+    if lowered in ("true", "1", "yes"):
+        return True
+    if lowered in ("false", "0", "no"):
+        return False
+    raise ValueError(text)
+
+def _parse_auto(text):
+    """
+    int or float when the text is a plain number that Excel stores without loss, the text itself otherwise.
+    Numbers with leading zeros (codes such as "00123") or more than 15 significant digits
+    ("12345678901234567890") stay text, and so does anything float() accepts beyond plain decimal notation
+    ("1_000", " 12", "nan", "inf").
+    """
+    match = _FLOAT.fullmatch(text)
+    if not match or len(match.group(1).replace(".", "").lstrip("0")) > EXCEL_MAX_DIGITS:
+        return text
+    if _INTEGER.fullmatch(text):
+        return int(text)
+    number = float(text)
+    digits = text.lstrip("+-")
+    if digits[:1] == "0" and digits[1:2] not in ("", ".", "e", "E"):
+        return text
+    return number if number == number and number not in (float("inf"), float("-inf")) else text
+
+# Parser of a text value for each column type; the labels are those of ex_export_sheet
+_PARSERS = {"auto": _parse_auto, "string": str, "int64": int, "float64": float, "bool": _parse_bool,
+            "timestamp": datetime.fromisoformat, "date": date.fromisoformat, "time": time.fromisoformat}
+
+def _sheet_title(base, index):
+    base = _INVALID_SHEET_CHARACTERS.sub("_", base)[:31] or "Sheet"
+    if index == 1:
+        return base
+    suffix = f"_{index}"
+    return base[:31 - len(suffix)] + suffix
+
+def _column_setting(settings, name, index):
+    """
+    The entry of a types / number_formats dict for a column, looked up by header name, then by 0-based index.
+    """
+    if not settings:
+        return None
+    if name is not None and name in settings:
+        return settings[name]
+    return settings.get(index)
+
+def _discard_sheets(workbook):
+    """
+    Closes the write-only sheets of an abandoned workbook and removes their temporary XML files.
+    """
+    for sheet in workbook.worksheets:
+        try:
+            sheet.close()
+        except Exception:
+            pass  # already closed, or never written
+        writer = getattr(sheet, "_writer", None)
+        if writer is not None and os.path.exists(writer.out):
+            os.remove(writer.out)
+
+@instrument
+def ex_write_xlsx(rows, output_path, columns=None, sheet_name="Sheet1", types=None, default_type=None,
+                  number_formats=None, max_rows_per_sheet=EXCEL_MAX_ROWS, compress_level=6):
+    """
+    Writes rows into a new xlsx file through an openpyxl write-only workbook, so memory stays constant
+    whatever the number of rows.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Parameters:
+    - rows: iterable
+        The data rows: sequences of values, or dicts (keyed by the column names). Consumed once, lazily.
+    - output_path: str
+        The .xlsx file to write. An existing file is replaced once the new one is complete.
+    - columns: list of str, optional
+        The header, repeated as the first row of every sheet. Defaults to the keys of the first dict row;
+        sequence rows are written without a header when it is not given.
+    - sheet_name: str, optional
+        The name of the first sheet; the following ones get a suffix ("Data_2", "Data_3", ...). Defaults to "Sheet1".
+    - types: dict, optional
+        Column name (or 0-based index) -> 'auto', 'string', 'int64', 'float64', 'bool', 'timestamp', 'date' or 'time'.
+        Text values of a typed column are parsed (ISO 8601 for dates); other values are written as they are.
+    - default_type: str, optional
+        The type of the columns without an entry in types. Defaults to None: their values are written as they are.
+    - number_formats: dict, optional
+        Column name (or 0-based index) -> Excel number format, e.g. {"Amount": "#,##0.00"}.
+        timestamp, date and time columns default to ISO-like formats.
+    - max_rows_per_sheet: int, optional
+        Rows per sheet including the header; further rows continue on a new sheet. Defaults to 1,048,576,
+        the Excel limit.
+    - compress_level: int, optional
+        zlib level of the package, 0 (fastest, largest) to 9 (slowest, smallest). Defaults to 6.
+
+    Returns:
+    - dict
+        {"output_path", "rows", "sheets": [(sheet name, data rows), ...]}.
+
+    Raises:
+    - ValueError
+        If a text value cannot be parsed as the type of its column, or a setting is invalid.
+
+    Notes:
+    - The write-only worksheets stream their XML to temporary files, which are zipped on save: disk space grows
+      with the data, memory does not.
+    - Cells with a number format are written as WriteOnlyCell objects, which is slower than plain values;
+      give formats only to the columns that need them.
+    """
+    if not 0 <= compress_level <= 9:
+        raise ValueError(f"compress_level must be between 0 and 9, not {compress_level}.")
+    rows = iter(rows)
+    first = next(rows, None)
+    if isinstance(first, dict) and columns is None:
+        columns = list(first)
+    if first is not None:
+        rows = chain([first], rows)
+    header_rows = 1 if columns else 0
+    if max_rows_per_sheet <= header_rows:
+        raise ValueError(f"max_rows_per_sheet must leave room for data rows, not {max_rows_per_sheet}.")
+    for column_type in [*(types or {}).values(), *([default_type] if default_type else [])]:
+        if column_type not in _PARSERS:
+            raise ValueError(f"Unknown column type '{column_type}'. Use one of {sorted(_PARSERS)}.")
+
+    openpyxl = ex_openpyxl()
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.writer.excel import ExcelWriter
+
+    workbook = openpyxl.Workbook(write_only=True)
+    column_plan = {}  # column index -> (parser, number format), settled on first use
+
+    def plan(index):
+        if index not in column_plan:
+            name = columns[index] if columns and index < len(columns) else None
+            column_type = _column_setting(types, name, index) or default_type
+            number_format = _column_setting(number_formats, name, index) or _DEFAULT_FORMATS.get(column_type)
+            column_plan[index] = (_PARSERS[column_type] if column_type not in (None, "string") else None,
+                                  number_format)
+        return column_plan[index]
+
+    def cells(sheet, row_number, values):
+        for index, value in enumerate(values):
+            parser, number_format = plan(index)
+            if isinstance(value, str):
+                if value == "" and parser is not None:
+                    value = None
+                elif parser is not None:
+                    try:
+                        value = parser(value)
+                    except ValueError:
+                        name = columns[index] if columns and index < len(columns) else index
+                        raise ValueError(f"Row {row_number}, column {name!r}: cannot read {value!r} "
+                                         f"as {_column_setting(types, name, index) or default_type}.") from None
+            if number_format is not None and value is not None:
+                cell = WriteOnlyCell(sheet, value)
+                cell.number_format = number_format
+                value = cell
+            yield value
+
+    sheets = []
+    sheet = None
+    written = 0
+    row_number = 0
+    try:
+        for row in rows:
+            if sheet is None or sheets[-1][1] + header_rows >= max_rows_per_sheet:
+                sheet = workbook.create_sheet(_sheet_title(sheet_name, len(sheets) + 1))
+                sheets.append([sheet.title, 0])
+                if columns:
+                    sheet.append(list(columns))
+            row_number += 1
+            values = [row.get(column) for column in columns] if isinstance(row, dict) else row
+            sheet.append(list(cells(sheet, row_number, values)))
+            sheets[-1][1] += 1
+            written += len(values)
+
+        if not sheets:
+            sheet = workbook.create_sheet(_sheet_title(sheet_name, 1))
+            sheets.append([sheet.title, 0])
+            if columns:
+                sheet.append(list(columns))
+    except BaseException:
+        _discard_sheets(workbook)
+        raise
+
+    temp_path = output_path + ".part"
+    try:
+        # openpyxl's save_workbook always uses the default zlib level; hand it an archive with ours
+        archive = ZipFile(temp_path, "w", ZIP_DEFLATED, allowZip64=True, compresslevel=compress_level)
+        ExcelWriter(workbook, archive).save()
+        os.replace(temp_path, output_path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    ex_invalidate_workbook(output_path)
+    ex_invalidate_occupancy_index(output_path)
+    ex_invalidate_sheet_frame(output_path)
+    ex_count(cells=written)
+
+    sheets = [tuple(entry) for entry in sheets]
+    logger.info(f"Wrote {row_number} rows to '{output_path}' ({len(sheets)} sheets).")
+    return {"output_path": os.path.abspath(output_path), "rows": row_number, "sheets": sheets}
+
+@instrument
+def ex_csv_to_xlsx(csv_path, xlsx_path=None, sheet_name=None, header=True, types=None, number_formats=None,
+                   delimiter=",", encoding="utf-8-sig", max_rows_per_sheet=EXCEL_MAX_ROWS, compress_level=6):
+    """
+    Converts a CSV file into an xlsx file on any platform, streaming it row by row through ex_write_xlsx.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Parameters:
+    - csv_path: str
+        The CSV file to read.
+    - xlsx_path: str, optional
+        The xlsx file to write. Defaults to csv_path with the .xlsx extension.
+    - sheet_name: str, optional
+        The name of the first sheet. Defaults to the CSV file name.
+    - header: bool, optional
+        If True (default), the first CSV row is the header, repeated on every sheet.
+    - types: dict, optional
+        Column name (or 0-based index) -> column type, see ex_write_xlsx. Columns without an entry are 'auto':
+        plain numbers that fit Excel's 15 significant digits become numbers, everything else (codes with
+        leading zeros, long IDs, ...) stays text.
+    - number_formats: dict, optional
+        Column name (or 0-based index) -> Excel number format.
+    - delimiter: str, optional
+        The CSV delimiter. Defaults to ",".
+    - encoding: str, optional
+        The CSV encoding. Defaults to "utf-8-sig" (UTF-8, with or without BOM).
+    - max_rows_per_sheet, compress_level:
+        As in ex_write_xlsx.
+
+    Returns:
+    - dict
+        The summary of ex_write_xlsx.
+    """
+    if xlsx_path is None:
+        xlsx_path = os.path.splitext(csv_path)[0] + ".xlsx"
+    if sheet_name is None:
+        sheet_name = os.path.splitext(os.path.basename(csv_path))[0]
+
+    with open(csv_path, encoding=encoding, newline="") as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        columns = next(reader, None) if header else None
+        result = ex_write_xlsx(reader, xlsx_path, columns=columns, sheet_name=sheet_name, types=types,
+                               default_type="auto", number_formats=number_formats, max_rows_per_sheet=max_rows_per_sheet,
+                               compress_level=compress_level)
+    logger.info(f"Converted '{csv_path}' to '{xlsx_path}'.")
+    return result
+
+if __name__ == "__main__":
+    ex_configure_logging()
+    csv_path = r"C:\Users\KNT15083\Downloads\521\summary.csv"
+    print(ex_csv_to_xlsx(csv_path, types={"Date": "date"}, number_formats={"Amount": "#,##0.00"}, compress_level=1))
@@ -0,0 +1,538 @@
+import posixpath
+import re
+import zipfile
+from collections import namedtuple
+from functools import lru_cache
+from xml.etree.ElementTree import iterparse, fromstring
+
+from .ex_logging import ex_configure_logging, ex_get_logger
+from .ex_telemetry import ex_count, instrument
+
+logger = ex_get_logger(__name__)
+
+SHEET_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+_ROW_TAG = f"{{{SHEET_MAIN_NS}}}row"
+_CELL_TAG = f"{{{SHEET_MAIN_NS}}}c"
+_VALUE_TAG = f"{{{SHEET_MAIN_NS}}}v"
+_FORMULA_TAG = f"{{{SHEET_MAIN_NS}}}f"
+_INLINE_TAG = f"{{{SHEET_MAIN_NS}}}is"
+_TEXT_TAG = f"{{{SHEET_MAIN_NS}}}t"
+_RUN_TAG = f"{{{SHEET_MAIN_NS}}}r"
+_SHEET_DATA_TAG = f"{{{SHEET_MAIN_NS}}}sheetData"
+_DIMENSION_TAG = f"{{{SHEET_MAIN_NS}}}dimension"
+
+# One cell as read by ex_iter_sheet_records. value is the stored (cached) value, formula the formula text or None.
+SheetRecord = namedtuple("SheetRecord", ["row", "column", "data_type", "value", "formula"])
+
+# Characters that can appear in str() of the values openpyxl builds from numeric cells
+_NUMBER_CHARS = frozenset("0123456789.-+eE")
+_DATE_CHARS = frozenset("0123456789-: .")
+_TIMEDELTA_CHARS = frozenset("0123456789-: .,days")
+_BOOL_TEXTS = ("True", "False")
+
+_REFERENCE_RE = re.compile(r"\$?([A-Za-z]{1,3})\$?([0-9]+)(?::\$?([A-Za-z]{1,3})\$?([0-9]+))?")
+
+# openpyxl is only imported by the functions that need it (find ranges, styles, dates, shared formulas):
+# importing it, and Pillow with it, takes longer than reading a sheet dimension.
+
+@lru_cache(maxsize=None)
+def _column_index(letters):
+    index = 0
+    for letter in letters.upper():
+        index = index * 26 + ord(letter) - 64
+    return index
+
+def _reference_bounds(reference):
+    """
+    (min_col, min_row, max_col, max_row) of an "A1" or "A1:D20" reference, or None for anything else.
+    """
+    match = _REFERENCE_RE.fullmatch(reference or "")
+    if match is None:
+        return None
+    first_col, first_row, last_col, last_row = match.groups()
+    if last_col is None:
+        last_col, last_row = first_col, first_row
+    return _column_index(first_col), int(first_row), _column_index(last_col), int(last_row)
+
+def _find_range_bounds(find_range):
+    """
+    (min_col, min_row, max_col, max_row) of a find_range such as "A1:C10", "B:D" or "5:20"; all None without one.
+    """
+    if not find_range:
+        return None, None, None, None
+    from openpyxl.utils import range_boundaries
+    return range_boundaries(find_range)
+
+def _read_rels(archive, part):
+    """
+    Returns {relationship id: (type, absolute target)} for a package part.
+    """
+    folder, name = posixpath.split(part)
+    rels_path = posixpath.join(folder, "_rels", name + ".rels")
+    try:
+        root = fromstring(archive.read(rels_path))
+    except KeyError:
+        return {}
+    rels = {}
+    for rel in root.iter(f"{{{PKG_REL_NS}}}Relationship"):
+        target = rel.get("Target")
+        if target.startswith("/"):
+            target = target[1:]
+        else:
+            target = posixpath.normpath(posixpath.join(folder, target))
+        rels[rel.get("Id")] = (rel.get("Type"), target)
+    return rels
+
+def _read_text(element):
+    """
+    Plain text of a shared or inline string, without phonetic runs (as openpyxl's Text.content).
+    """
+    snippets = []
+    plain = element.find(_TEXT_TAG)
+    if plain is not None and plain.text:
+        snippets.append(plain.text)
+    for run in element.iterfind(_RUN_TAG):
+        text = run.find(_TEXT_TAG)
+        if text is not None and text.text:
+            snippets.append(text.text)
+    return "".join(snippets)
+
+def _open_package(file_path):
+    """
+    Opens an xlsx package and reads the workbook-level parts needed to decode sheets.
+
+    Returns:
+    - dict
+        archive, sheets ({name: part path}), active (name of the active sheet), date1904,
+        shared_strings_part and styles_part. Shared strings and styles are loaded on demand.
+    """
+    archive = zipfile.ZipFile(file_path)
+    root_rels = _read_rels(archive, "")
+    workbook_part = next((target for rel_type, target in root_rels.values()
+                          if rel_type.endswith("/officeDocument")), "xl/workbook.xml")
+    workbook_rels = _read_rels(archive, workbook_part)
+    workbook = fromstring(archive.read(workbook_part))
+
+    sheets = {}
+    names = []
+    for sheet in workbook.iter(f"{{{SHEET_MAIN_NS}}}sheet"):
+        rel_type, target = workbook_rels.get(sheet.get(f"{{{REL_NS}}}id"), (None, None))
+        names.append(sheet.get("name"))
+        if rel_type is not None and rel_type.endswith("/worksheet"):
+            sheets[sheet.get("name")] = target
+
+    view = workbook.find(f"{{{SHEET_MAIN_NS}}}bookViews/{{{SHEET_MAIN_NS}}}workbookView")
+    active_index = int(view.get("activeTab", 0)) if view is not None else 0
+    active = names[active_index] if active_index < len(names) else (names[0] if names else None)
+
+    properties = workbook.find(f"{{{SHEET_MAIN_NS}}}workbookPr")
+    date1904 = properties is not None and properties.get("date1904") in ("1", "true")
+
+    def part_of(suffix):
+        return next((target for rel_type, target in workbook_rels.values() if rel_type.endswith(suffix)), None)
+
+    return {
+        "archive": archive,
+        "sheets": sheets,
+        "active": active,
+        "date1904": date1904,
+        "shared_strings_part": part_of("/sharedStrings"),
+        "styles_part": part_of("/styles"),
+    }
+
+def _sheet_part(package, sheet_name):
+    name = sheet_name or package["active"]
+    if name not in package["sheets"]:
+        raise KeyError(f"Worksheet {name} does not exist.")
+    return package["sheets"][name]
+
+def _open_part(package, part):
+    archive = package["archive"]
+    ex_count(bytes_read=archive.getinfo(part).compress_size)
+    return archive.open(part)
+
+def _shared_strings(package):
+    if "shared_strings" not in package:
+        strings = []
+        part = package["shared_strings_part"]
+        if part is not None and part in package["archive"].namelist():
+            with _open_part(package, part) as source:
+                for _, node in iterparse(source):
+                    if node.tag == f"{{{SHEET_MAIN_NS}}}si":
+                        strings.append(_read_text(node).replace("x005F_", ""))
+                        node.clear()
+        package["shared_strings"] = strings
+    return package["shared_strings"]
+
+def _number_styles(package):
+    """
+    Returns (date style ids, timedelta style ids), indexed like openpyxl's cell styles.
+    """
+    if "date_styles" not in package:
+        from openpyxl.styles.numbers import BUILTIN_FORMATS, is_date_format, is_timedelta_format
+
+        date_styles, timedelta_styles = set(), set()
+        part = package["styles_part"]
+        if part is not None and part in package["archive"].namelist():
+            root = fromstring(package["archive"].read(part))
+            custom = {int(fmt.get("numFmtId")): fmt.get("formatCode")
+                      for fmt in root.iter(f"{{{SHEET_MAIN_NS}}}numFmt")}
+            cell_xfs = root.find(f"{{{SHEET_MAIN_NS}}}cellXfs")
+            for idx, xf in enumerate(cell_xfs if cell_xfs is not None else []):
+                fmt_id = int(xf.get("numFmtId", 0))
+                fmt = custom.get(fmt_id, BUILTIN_FORMATS.get(fmt_id))
+                if fmt is not None and is_date_format(fmt):
+                    date_styles.add(idx)
+                if fmt is not None and is_timedelta_format(fmt):
+                    timedelta_styles.add(idx)
+        package["date_styles"] = date_styles
+        package["timedelta_styles"] = timedelta_styles
+    return package["date_styles"], package["timedelta_styles"]
+
+def _iter_cell_elements(source, min_row=None, max_row=None, min_col=None, max_col=None):
+    """
+    Iterparses a worksheet part and yields (row, column, element) for every <c> inside the bounds.
+    Rows are cleared once processed, so memory does not grow with the sheet.
+    """
+    row_index = 0
+    col_index = 0
+    sheet_data = None
+    for event, element in iterparse(source, events=("start", "end")):
+        tag = element.tag
+        if event == "start":
+            if tag == _SHEET_DATA_TAG:
+                sheet_data = element
+            elif tag == _ROW_TAG:
+                row_attr = element.get("r")
+                row_index = int(row_attr) if row_attr else row_index + 1
+                col_index = 0
+                if max_row is not None and row_index > max_row:
+                    return
+            continue
+
+        if tag == _CELL_TAG:
+            ref = element.get("r")
+            col_index = _column_index(ref.rstrip("0123456789")) if ref else col_index + 1
+            if min_row is not None and row_index < min_row:
+                continue
+            if (min_col is None or col_index >= min_col) and (max_col is None or col_index <= max_col):
+                yield row_index, col_index, element
+        elif tag == _ROW_TAG:
+            ex_count(cells=len(element))
+            # Drop the finished row from the tree, not only its content
+            sheet_data.clear()
+
+def _formula_text(element, formula, shared_formulae):
+    """
+    Formula text of a cell as openpyxl returns it ("=..."), expanding shared formulas.
+    shared_formulae maps si -> (master text, master coordinate), replaced by a Translator the first time
+    a cell of the group is expanded, and must be kept for the whole sheet.
+    """
+    value = "=" + (formula.text or "")
+    if formula.get("t") == "shared":
+        idx = formula.get("si")
+        coordinate = element.get("r")
+        if idx in shared_formulae:
+            if coordinate:
+                translator = shared_formulae[idx]
+                if isinstance(translator, tuple):
+                    from openpyxl.formula.translate import Translator
+
+                    # Tokenized only when a cell of the group is actually read
+                    translator = shared_formulae[idx] = Translator(*translator)
+                value = translator.translate_formula(coordinate)
+        elif value != "=" and coordinate:
+            shared_formulae[idx] = (value, coordinate)
+    return value
+
+def _cell_value(element, package, shared_formulae, data_only=False):
+    """
+    Decodes a <c> element to (data type, value) the same way openpyxl's WorkSheetParser does.
+    Array and data table formulas are returned as their formula text.
+    """
+    data_type = element.get("t", "n")
+    formula = element.find(_FORMULA_TAG)
+    if not data_only and formula is not None:
+        return "f", _formula_text(element, formula, shared_formulae)
+
+    if data_type == "inlineStr":
+        child = element.find(_INLINE_TAG)
+        if child is None:
+            return data_type, None
+        return "s", _read_text(child)
+
+    value = element.findtext(_VALUE_TAG) or None
+    if value is None:
+        return data_type, None
+    if data_type == "n":
+        value = float(value) if ("." in value or "E" in value or "e" in value) else int(value)
+        style_id = int(element.get("s", 0))
+        date_styles, timedelta_styles = _number_styles(package)
+        if style_id in date_styles:
+            from openpyxl.utils.datetime import from_excel, CALENDAR_MAC_1904, CALENDAR_WINDOWS_1900
+
+            epoch = CALENDAR_MAC_1904 if package["date1904"] else CALENDAR_WINDOWS_1900
+            try:
+                return "d", from_excel(value, epoch, timedelta=style_id in timedelta_styles)
+            except (OverflowError, ValueError):
+                return "e", "#VALUE!"
+        return "n", value
+    if data_type == "s":
+        return "s", _shared_strings(package)[int(value)]
+    if data_type == "b":
+        return "b", bool(int(value))
+    if data_type == "str":
+        return "s", value
+    if data_type == "d":
+        from openpyxl.utils.datetime import from_ISO8601
+
+        return "d", from_ISO8601(value)
+    return data_type, value
+
+def ex_iter_sheet_records(file_path, sheet_name=None, find_range=None, include_empty=False):
+    """
+    Streams the cells of a sheet straight from the worksheet XML, without building an openpyxl workbook.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Parameters:
+    - file_path: str
+        The path to the .xlsx / .xlsm file to read.
+    - sheet_name: str, optional
+        The name of the sheet to read. If not provided, the active sheet is used.
+    - find_range: str, optional
+        A string representing the range of cells to read (e.g., "A1:C10"). If not provided, the entire sheet is read.
+        Parsing stops after the last row of the range.
+    - include_empty: bool, optional
+        If True, also yields cells that exist in the XML without value or formula (e.g. formatted blanks),
+        which openpyxl counts in max_row / max_column. Defaults to False.
+
+    Yields:
+    - SheetRecord
+        A (row, column, data_type, value, formula) tuple per cell, in row-major order.
+        data_type and value follow openpyxl with data_only=True ('n', 's', 'b', 'd', 'e'); for formula cells
+        value is the result Excel stored last time and formula is the formula text, e.g. "=SUM(A1:A3)".
+
+    Notes:
+    - Only the workbook part, its relationships, the shared strings and the number formats of styles.xml
+      are read besides the sheet itself; styles, drawings and images are never loaded.
+    - Shared formulas are expanded with openpyxl's Translator, array formulas are returned as their text.
+    """
+    package = _open_package(file_path)
+    try:
+        part = _sheet_part(package, sheet_name)
+        min_col, min_row, max_col, max_row = _find_range_bounds(find_range)
+        shared_formulae = {}
+
+        with _open_part(package, part) as source:
+            # Shared formula masters can sit outside find_range, so every row up to max_row is parsed
+            for row, column, element in _iter_cell_elements(source, max_row=max_row):
+                formula = element.find(_FORMULA_TAG)
+                if ((min_row is not None and row < min_row)
+                        or (min_col is not None and column < min_col)
+                        or (max_col is not None and column > max_col)):
+                    if formula is not None and formula.get("t") == "shared" and formula.get("si") not in shared_formulae:
+                        _formula_text(element, formula, shared_formulae)  # register the master formula
+                    continue
+
+                formula_text = _formula_text(element, formula, shared_formulae) if formula is not None else None
+                data_type, value = _cell_value(element, package, shared_formulae, data_only=True)
+                if value is None and formula_text is None and not include_empty:
+                    continue
+                yield SheetRecord(row, column, data_type, value, formula_text)
+    finally:
+        package["archive"].close()
+
+@instrument
+def ex_read_sheet_names(file_path):
+    """
+    Returns the names of the worksheets of an xlsx package in workbook order, reading only the workbook part.
+
+    Parameters:
+    - file_path: str
+        The path to the .xlsx / .xlsm file to read.
+
+    Returns:
+    - list of str
+        The worksheet names. Chart sheets and dialog sheets are not included.
+    """
+    package = _open_package(file_path)
+    package["archive"].close()
+    return list(package["sheets"])
+
+@instrument
+def ex_read_sheet_dimension(file_path, sheet_name=None):
+    """
+    Reads the <dimension ref="..."> element at the top of a worksheet XML, without parsing any cell.
+
+    Parameters:
+    - file_path: str
+        The path to the .xlsx / .xlsm file to read.
+    - sheet_name: str, optional
+        The name of the sheet. If not provided, the active sheet is used.
+
+    Returns:
+    - tuple or None
+        (min_col, min_row, max_col, max_row) of the stored used range, or None if the element is missing or invalid.
+    """
+    package = _open_package(file_path)
+    try:
+        part = _sheet_part(package, sheet_name)
+        with _open_part(package, part) as source:
+            for _, element in iterparse(source, events=("start",)):
+                if element.tag == _DIMENSION_TAG:
+                    return _reference_bounds(element.get("ref"))
+                if element.tag == _SHEET_DATA_TAG:
+                    return None
+    finally:
+        package["archive"].close()
+    return None
+
+@instrument
+def ex_sheet_extent(file_path, sheet_name=None, verify=False):
+    """
+    Returns the last row and column of a sheet, as openpyxl's max_row / max_column, in milliseconds when possible.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Parameters:
+    - file_path: str
+        The path to the .xlsx / .xlsm file to read.
+    - sheet_name: str, optional
+        The name of the sheet. If not provided, the active sheet is used.
+    - verify: bool, optional
+        If True, always scans the cells and logs a warning when the stored dimension is wrong. Defaults to False.
+
+    Returns:
+    - tuple
+        (max_row, max_column). (1, 1) for an empty sheet.
+
+    Notes:
+    - The <dimension> element is trusted unless it is missing or only "A1", which some writers emit
+      whatever the content. In those cases the cells are scanned with ex_iter_sheet_records.
+    """
+    bounds = ex_read_sheet_dimension(file_path, sheet_name)
+    trusted = bounds is not None and (bounds[2], bounds[3]) != (1, 1)
+    if trusted and not verify:
+        logger.debug(f"Using stored dimension of the sheet: {bounds}.")
+        return bounds[3], bounds[2]
+
+    max_row = max_column = 1
+    for record in ex_iter_sheet_records(file_path, sheet_name=sheet_name, include_empty=True):
+        max_row = record.row
+        max_column = max(max_column, record.column)
+
+    if trusted and (max_row, max_column) != (bounds[3], bounds[2]):
+        logger.warning(f"Stored dimension ends at ({bounds[3]}, {bounds[2]}) but the last cell is at ({max_row}, {max_column}).")
+    return max_row, max_column
+
+def ex_iter_text_matches_by_shared_strings(file_path, search_text, sheet_name=None, exact_match=False, find_range=None):
+    """
+    Streams the coordinates of cells containing specified text, testing each unique shared string only once.
+
+    Author: NGUYEN TIEN THANH / KNT15083
+    Last Updated: 2026-10-17
+
+    Parameters:
+    - file_path: str
+        The path to the .xlsx file in which to search for text.
+    - search_text: str
+        The text to search for within the cells.
+    - sheet_name: str, optional
+        The name of the sheet to search in. If not provided, the active sheet is used.
+    - exact_match: bool, optional
+        If True, searches for an exact match of the search_text. Defaults to False for partial matches.
+    - find_range: str, optional
+        A string representing the range of cells to search (e.g., "A1:C10"). If not provided, the entire sheet is searched.
+
+    Yields:
+    - tuple
+        The coordinates (row, column) of each cell that contains the search_text, in row-major order.
+
+    Notes:
+    - xl/sharedStrings.xml is matched first; the sheet XML is then scanned and a t="s" cell is a match
+      only if its index is in the matching set, so no string is built for the other text cells.
+    - Inline strings, formulas and error values are decoded and tested directly. Numeric, date and boolean
+      cells are decoded only when the search_text is made of characters their text form can contain.
+    - Results are the same as ex_find_cells_with_text on the edit-mode workbook, except that empty cells
+      never match.
+    """
+    package = _open_package(file_path)
+    try:
+        part = _sheet_part(package, sheet_name)
+
+        strings = _shared_strings(package)
+        if exact_match:
+            matching_strings = {str(i) for i, text in enumerate(strings) if text == search_text}
+        else:
+            matching_strings = {str(i) for i, text in enumerate(strings) if search_text in text}
+        logger.debug(f"{len(matching_strings)} of {len(strings)} shared strings match '{search_text}'.")
+
+        needle_chars = set(search_text)
+        test_numbers = not exact_match and needle_chars <= _NUMBER_CHARS
+        test_dates = not exact_match and needle_chars <= _DATE_CHARS
+        test_timedeltas = not exact_match and needle_chars <= _TIMEDELTA_CHARS
+        test_bools = not exact_match and any(search_text in text for text in _BOOL_TEXTS)
+        date_styles, timedelta_styles = _number_styles(package)
+
+        def matches(value):
+            if exact_match:
+                return value == search_text
+            return search_text in str(value)
+
+        bounds = _find_range_bounds(find_range)
+        min_col, min_row, max_col, max_row = bounds
+        shared_formulae = {}
+
+        with _open_part(package, part) as source:
+            # Shared formula masters can sit outside find_range, so formulas are tracked for the whole sheet
+            for row, column, element in _iter_cell_elements(source, max_row=max_row):
+                in_range = ((min_row is None or row >= min_row)
+                            and (min_col is None or column >= min_col)
+                            and (max_col is None or column <= max_col))
+                formula = element.find(_FORMULA_TAG)
+                if formula is not None:
+                    if in_range:
+                        if matches(_formula_text(element, formula, shared_formulae)):
+                            yield row, column
+                    elif formula.get("t") == "shared" and formula.get("si") not in shared_formulae:
+                        _formula_text(element, formula, shared_formulae)  # register the master formula
+                    continue
+                if not in_range:
+                    continue
+
+                data_type = element.get("t", "n")
+                if data_type == "s":
+                    if element.findtext(_VALUE_TAG) in matching_strings:
+                        yield row, column
+                    continue
+                if data_type == "n":
+                    if not (test_numbers or test_dates or test_timedeltas):
+                        continue
+                    style_id = int(element.get("s", 0))
+                    if style_id in timedelta_styles:
+                        if not test_timedeltas:
+                            continue
+                    elif style_id in date_styles:
+                        if not test_dates:
+                            continue
+                    elif not test_numbers:
+                        continue
+                elif data_type == "b" and not test_bools:
+                    continue
+
+                _, value = _cell_value(element, package, shared_formulae)
+                if value is not None and matches(value):
+                    yield row, column
+    finally:
+        package["archive"].close()
+
+if __name__ == "__main__":
+    ex_configure_logging()
+    file_path = r"C:\Users\KNT15083\Downloads\521\summary.xlsx"
+    print(list(ex_iter_text_matches_by_shared_strings(file_path, "BODY")))